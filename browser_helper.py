@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """Browser helper for launching browsers with stealth and extension support."""
 
+import asyncio
 import logging
 import os
+import re
 import tempfile
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from dotenv import load_dotenv
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Page as AsyncPage, Playwright as AsyncPlaywright
 from playwright.sync_api import BrowserContext, Playwright, Page
 from playwright_stealth import Stealth
 
@@ -64,35 +69,27 @@ AD_PATTERNS = [
     "*://*.taboola.com/*",
 ]
 
-
-def launch_browser_with_extension(
-    playwright: Playwright,
-    extension_path: Path | str | None = None,
-    headless: bool = False,
-    user_data_dir: Path | str | None = None,
-    viewport: dict = None,
-    user_agent: str = None,
-    use_proxy: bool = True,
-    browser: str = "chromium",
-) -> BrowserContext:
+# AD_PATTERNS as one regex, so a page needs a single route instead of one
+# per pattern (each of which Playwright checks against every request)
+_AD_HOSTS = sorted({p.split("://", 1)[1].split("/", 1)[0].removeprefix("*.") for p in AD_PATTERNS})
+AD_URL_RE = re.compile(r"^[a-z]+://(?:[^/]*\.)?(?:" + "|".join(map(re.escape, _AD_HOSTS)) + r")(?:[:/]|$)")
+
+
+def _persistent_context_options(
+    playwright,
+    extension_path: Path | str | None,
+    headless: bool,
+    user_data_dir: Path | str | None,
+    viewport: dict | None,
+    user_agent: str | None,
+    use_proxy: bool,
+    browser: str,
+):
     """
-    Launch a browser with optional extension and proxy support.
-
-    To use extensions, Playwright requires a persistent context with Chromium.
-    Extensions are NOT supported in Firefox or WebKit.
+    Resolve the browser type and launch_persistent_context() kwargs.
 
-    Args:
-        playwright: Playwright instance
-        extension_path: Path to unpacked extension directory (must have manifest.json)
-        headless: Run in headless mode (extensions may not work in headless)
-        user_data_dir: Browser profile directory (created if None)
-        viewport: Viewport dimensions dict {"width": 1280, "height": 800}
-        user_agent: Custom user agent string
-        use_proxy: If True, use Bright Data Web Unlocker proxy if configured
-        browser: Browser to use - "chromium", "firefox", or "webkit"
-
-    Returns:
-        BrowserContext
+    Shared by the sync and async launchers. Returns
+    (browser_type, launch_kwargs, extension_loaded).
     """
     if viewport is None:
         viewport = {"width": 1280, "height": 800}
@@ -143,8 +140,7 @@ def launch_browser_with_extension(
     if proxy:
         logger.info(f"Browser using proxy: {proxy['server']}")
 
-    # Launch persistent context
-    context = browser_type.launch_persistent_context(
+    launch_kwargs = dict(
         user_data_dir=str(user_data_dir),
         headless=headless,
         args=browser_args if browser == "chromium" else [],
@@ -159,9 +155,180 @@ def launch_browser_with_extension(
         accept_downloads=True,
     )
 
+    return browser_type, launch_kwargs, extension_loaded
+
+
+def launch_browser_with_extension(
+    playwright: Playwright,
+    extension_path: Path | str | None = None,
+    headless: bool = False,
+    user_data_dir: Path | str | None = None,
+    viewport: dict = None,
+    user_agent: str = None,
+    use_proxy: bool = True,
+    browser: str = "chromium",
+) -> BrowserContext:
+    """
+    Launch a browser with optional extension and proxy support.
+
+    To use extensions, Playwright requires a persistent context with Chromium.
+    Extensions are NOT supported in Firefox or WebKit.
+
+    Args:
+        playwright: Playwright instance
+        extension_path: Path to unpacked extension directory (must have manifest.json)
+        headless: Run in headless mode (extensions may not work in headless)
+        user_data_dir: Browser profile directory (created if None)
+        viewport: Viewport dimensions dict {"width": 1280, "height": 800}
+        user_agent: Custom user agent string
+        use_proxy: If True, use Bright Data Web Unlocker proxy if configured
+        browser: Browser to use - "chromium", "firefox", or "webkit"
+
+    Returns:
+        BrowserContext
+    """
+    browser_type, launch_kwargs, extension_loaded = _persistent_context_options(
+        playwright, extension_path, headless, user_data_dir, viewport, user_agent, use_proxy, browser,
+    )
+
+    # Launch persistent context
+    context = browser_type.launch_persistent_context(**launch_kwargs)
+
+    return context, extension_loaded
+
+
+async def launch_browser_with_extension_async(
+    playwright: AsyncPlaywright,
+    extension_path: Path | str | None = None,
+    headless: bool = False,
+    user_data_dir: Path | str | None = None,
+    viewport: dict = None,
+    user_agent: str = None,
+    use_proxy: bool = True,
+    browser: str = "chromium",
+) -> AsyncBrowserContext:
+    """Async version of launch_browser_with_extension() for playwright.async_api."""
+    browser_type, launch_kwargs, extension_loaded = _persistent_context_options(
+        playwright, extension_path, headless, user_data_dir, viewport, user_agent, use_proxy, browser,
+    )
+
+    context = await browser_type.launch_persistent_context(**launch_kwargs)
+
     return context, extension_loaded
 
 
+class PagePool:
+    """
+    Fixed-size pool of pages sharing one browser context.
+
+    Pages are handed out through an asyncio.Queue, so at most `size` pages
+    are navigating at once. Use with the async Playwright API:
+
+        pool = PagePool(context, size=5, setup=setup_page)
+        await pool.start()
+        async with pool.page() as page:
+            await page.goto(url)
+
+    Long crawls leak memory in the renderer, so a page is closed and
+    replaced with a fresh one after `max_uses` checkouts or once it is
+    older than `max_age` seconds (either can be None to disable).
+    """
+
+    def __init__(
+        self,
+        context: AsyncBrowserContext,
+        size: int = 1,
+        setup=None,
+        max_uses: int | None = None,
+        max_age: float | None = None,
+    ):
+        self.context = context
+        self.size = max(1, size)
+        self.setup = setup
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self._queue: asyncio.Queue = asyncio.Queue()
+        # page -> [uses, created_at]
+        self._usage: dict = {}
+
+    async def _add_page(self, page: AsyncPage) -> None:
+        if self.setup:
+            await self.setup(page)
+        self._put(page)
+
+    def _put(self, page: AsyncPage) -> None:
+        """Make a page available with a fresh usage count."""
+        self._usage[page] = [0, time.monotonic()]
+        self._queue.put_nowait(page)
+
+    async def start(self) -> None:
+        """Open the pages (reusing any the context already has)."""
+        pages = list(self.context.pages[:self.size])
+        while len(pages) < self.size:
+            pages.append(await self.context.new_page())
+        for page in pages:
+            await self._add_page(page)
+        logger.info(f"Page pool ready with {self.size} page(s)")
+
+    def _needs_recycle(self, page: AsyncPage) -> bool:
+        uses, created_at = self._usage[page]
+        if self.max_uses and uses >= self.max_uses:
+            return True
+        if self.max_age and time.monotonic() - created_at >= self.max_age:
+            return True
+        return False
+
+    async def _recycle(self, page: AsyncPage) -> None:
+        """Swap a worn-out page for a fresh one.
+
+        The fresh page is opened and set up before the old one is taken out,
+        so a failure keeps the old page in the pool instead of losing a slot
+        (and never replaces the borrower's own exception).
+        """
+        try:
+            fresh = await self.context.new_page()
+        except Exception as e:
+            # Keep the old page rather than shrinking the pool
+            logger.warning(f"Could not open replacement page, reusing old one: {e}")
+            self._put(page)
+            return
+
+        try:
+            if self.setup:
+                await self.setup(fresh)
+        except BaseException as e:
+            self._put(page)
+            if not isinstance(e, Exception):
+                raise  # Cancelled; the old page is back in the pool
+            logger.warning(f"Could not set up replacement page, reusing old one: {e}")
+            try:
+                await fresh.close()
+            except Exception as close_error:
+                logger.debug(f"Error closing unused replacement page: {close_error}")
+            return
+
+        uses, _ = self._usage.pop(page)
+        logger.debug(f"Recycling page after {uses} use(s)")
+        self._put(fresh)
+        try:
+            await page.close()
+        except Exception as e:
+            logger.debug(f"Error closing recycled page: {e}")
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page from the pool for the duration of the block."""
+        page = await self._queue.get()
+        try:
+            yield page
+        finally:
+            self._usage[page][0] += 1
+            if self._needs_recycle(page):
+                await self._recycle(page)
+            else:
+                self._queue.put_nowait(page)
+
+
 def apply_stealth(page: Page) -> None:
     """
     Apply stealth patches to a page to avoid fingerprint detection.
@@ -178,6 +345,13 @@ def apply_stealth(page: Page) -> None:
     logger.info("Stealth patches applied to page")
 
 
+async def apply_stealth_async(page: AsyncPage) -> None:
+    """Async version of apply_stealth()."""
+    stealth = Stealth()
+    await stealth.apply_stealth_async(page)
+    logger.info("Stealth patches applied to page")
+
+
 def setup_route_ad_blocking(page: Page) -> None:
     """
     Set up route-based ad blocking on a page.
@@ -187,59 +361,115 @@ def setup_route_ad_blocking(page: Page) -> None:
     def block_ads(route):
         route.abort()
 
-    for pattern in AD_PATTERNS:
-        page.route(pattern, block_ads)
+    page.route(AD_URL_RE, block_ads)
 
     logger.info("Route-based ad blocking enabled")
 
 
+async def setup_route_ad_blocking_async(page: AsyncPage) -> None:
+    """Async version of setup_route_ad_blocking()."""
+    def block_ads(route):
+        return route.abort()
+
+    await page.route(AD_URL_RE, block_ads)
+
+    logger.info("Route-based ad blocking enabled")
+
+
+# Bandwidth-heavy domains and ad networks blocked by setup_bandwidth_saving()
+BANDWIDTH_BLOCKED_DOMAINS = [
+    # ManualsLib static content
+    "static-data2.manualslib.com",
+    # Google Ads
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "adservice.google.com",
+    "pagead2.googlesyndication.com",
+    "adsensecustomsearchads.com",
+    # Other ad networks
+    "adnxs.com",
+    "adsrvr.org",
+    "amazon-adsystem.com",
+    "facebook.net",
+    "moatads.com",
+    "rubiconproject.com",
+    "pubmatic.com",
+    "criteo.com",
+    "outbrain.com",
+    "taboola.com",
+]
+_BANDWIDTH_BLOCKED_RE = re.compile("|".join(map(re.escape, BANDWIDTH_BLOCKED_DOMAINS)))
+
+
+def _bandwidth_route_handler(route):
+    """
+    Abort requests to blocked domains, pass everything else on.
+
+    Uses fallback() rather than continue_() so context-level routes (see
+    set_resource_blocking_async) still see the request. Returns the route
+    call so the same handler works with both Playwright APIs (the async
+    API awaits the returned coroutine).
+    """
+    url = route.request.url
+    if _BANDWIDTH_BLOCKED_RE.search(url):
+        logger.debug(f"Blocking: {url[:60]}...")
+        return route.abort()
+    return route.fallback()
+
+
 def setup_bandwidth_saving(page: Page) -> None:
     """
     Block bandwidth-heavy domains and ads to save proxy costs.
 
     Blocks static content (images, thumbnails) and ad networks.
     """
-    blocked_domains = [
-        # ManualsLib static content
-        "static-data2.manualslib.com",
-        # Google Ads
-        "doubleclick.net",
-        "googlesyndication.com",
-        "googleadservices.com",
-        "google-analytics.com",
-        "googletagmanager.com",
-        "googletagservices.com",
-        "adservice.google.com",
-        "pagead2.googlesyndication.com",
-        "adsensecustomsearchads.com",
-        # Other ad networks
-        "adnxs.com",
-        "adsrvr.org",
-        "amazon-adsystem.com",
-        "facebook.net",
-        "moatads.com",
-        "rubiconproject.com",
-        "pubmatic.com",
-        "criteo.com",
-        "outbrain.com",
-        "taboola.com",
-    ]
-
-    def handle_route(route):
-        url = route.request.url
-        for domain in blocked_domains:
-            if domain in url:
-                logger.debug(f"Blocking: {url[:60]}...")
-                route.abort()
-                return
-        route.continue_()
-
     # Match all requests and filter in the handler
-    page.route("**/*", handle_route)
+    page.route("**/*", _bandwidth_route_handler)
 
     logger.info("Bandwidth-saving mode enabled (blocking static content and ads)")
 
 
+async def setup_bandwidth_saving_async(page: AsyncPage) -> None:
+    """Async version of setup_bandwidth_saving()."""
+    await page.route("**/*", _bandwidth_route_handler)
+
+    logger.info("Bandwidth-saving mode enabled (blocking static content and ads)")
+
+
+# Resource types that never carry data the index crawls need
+INDEX_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Challenge widgets that may appear mid-crawl and need their images to be solved
+_CHALLENGE_URL_RE = re.compile(r"^https://(?:[^/]*\.)?(?:hcaptcha\.com|challenges\.cloudflare\.com|google\.com/recaptcha|gstatic\.com/recaptcha)")
+
+
+def _resource_block_handler(route):
+    """Abort heavy resource types, pass everything else on."""
+    request = route.request
+    if request.resource_type in INDEX_BLOCKED_RESOURCE_TYPES and not _CHALLENGE_URL_RE.match(request.url):
+        return route.abort()
+    return route.fallback()
+
+
+async def set_resource_blocking_async(context: AsyncBrowserContext, enabled: bool) -> None:
+    """
+    Toggle blocking of images, fonts, media and stylesheets for a whole context.
+
+    Meant for index crawls, where only links are read. Turn it off again
+    before download pages, which need to render their captcha widgets.
+    """
+    if enabled:
+        await context.route("**/*", _resource_block_handler)
+        logger.info("Blocking images, fonts, media and stylesheets")
+    else:
+        await context.unroute("**/*", _resource_block_handler)
+        logger.info("Resource blocking disabled")
+
+
 def get_extension_path(config: dict, project_dir: Path) -> Path | None:
     """
     Get the extension path from config or default location.
@@ -1,15 +1,22 @@
 """2captcha integration for automatic reCAPTCHA solving."""
 
+import hashlib
 import logging
+import re
 import time
 import urllib.request
 import urllib.parse
 import json
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 TWOCAPTCHA_API_URL = "http://2captcha.com"
 
+# Last known balance, so startup doesn't have to ask the API every run
+BALANCE_CACHE_PATH = Path.home() / ".cache" / "salli-cat" / "twocaptcha.json"
+BALANCE_CACHE_TTL = 3600
+
 
 class TwoCaptchaSolver:
     """Solve reCAPTCHA using 2captcha.com API."""
@@ -140,6 +147,100 @@ class TwoCaptchaSolver:
             logger.error(f"Error getting balance: {e}")
             return None
 
+    def get_cached_balance(self, ttl: int = BALANCE_CACHE_TTL) -> float | None:
+        """Get the account balance, reusing one fetched within the last `ttl` seconds."""
+        # Identify the account without writing the key itself to disk
+        key_id = hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+        try:
+            cached = json.loads(BALANCE_CACHE_PATH.read_text())
+            if cached["key"] == key_id and time.time() - cached["ts"] < ttl:
+                return cached["balance"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        balance = self.get_balance()
+        if balance is not None:
+            try:
+                BALANCE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                BALANCE_CACHE_PATH.write_text(json.dumps({"key": key_id, "balance": balance, "ts": time.time()}))
+            except OSError as e:
+                logger.debug(f"Could not cache 2captcha balance: {e}")
+        return balance
+
+
+# Finds a data-sitekey attribute on the reCAPTCHA widget
+_SITEKEY_JS = """
+    () => {
+        // Check for data-sitekey on various elements
+        const selectors = [
+            '.g-recaptcha[data-sitekey]',
+            '[data-sitekey]',
+            '#recaptcha[data-sitekey]'
+        ];
+        for (const selector of selectors) {
+            const elem = document.querySelector(selector);
+            if (elem) {
+                return elem.getAttribute('data-sitekey');
+            }
+        }
+        return null;
+    }
+"""
+
+# Fills every g-recaptcha-response textarea, enables the submit button and
+# optionally fires the widget's data-callback
+_INJECT_RESPONSE_JS = """
+    (args) => {
+        const token = args.token;
+        const triggerCallback = args.triggerCallback;
+
+        // Find and fill ALL g-recaptcha-response textareas
+        const responseTextareas = document.querySelectorAll('[name="g-recaptcha-response"], #g-recaptcha-response');
+        responseTextareas.forEach(ta => {
+            ta.value = token;
+            ta.innerHTML = token;
+        });
+        console.log('Filled', responseTextareas.length, 'response textareas');
+
+        // Enable the submit button directly
+        // The server will validate the token when the form is submitted
+        const submitBtn = document.querySelector('.get-manual-btn, input[type="submit"][disabled]');
+        if (submitBtn) {
+            submitBtn.disabled = false;
+            submitBtn.removeAttribute('disabled');
+            console.log('Enabled submit button');
+        }
+
+        // Only try callbacks if explicitly requested (they can cause errors)
+        if (triggerCallback) {
+            try {
+                // Look for data-callback attribute on recaptcha element
+                const recaptchaDiv = document.querySelector('.g-recaptcha[data-callback]');
+                if (recaptchaDiv) {
+                    const callbackName = recaptchaDiv.getAttribute('data-callback');
+                    if (callbackName && typeof window[callbackName] === 'function') {
+                        console.log('Triggering callback:', callbackName);
+                        window[callbackName](token);
+                    }
+                }
+            } catch (e) {
+                console.log('Callback error (ignored):', e.message);
+            }
+        }
+
+        return responseTextareas.length > 0;
+    }
+"""
+
+
+def _sitekey_from_iframe_src(src: str | None) -> str | None:
+    """Parse the sitekey from a URL like ...recaptcha/api2/anchor?k=SITEKEY&..."""
+    if src and "k=" in src:
+        match = re.search(r'[?&]k=([^&]+)', src)
+        if match:
+            return match.group(1)
+    return None
+
 
 def extract_sitekey_from_page(page) -> str | None:
     """
@@ -151,37 +252,14 @@ def extract_sitekey_from_page(page) -> str | None:
     """
     try:
         # Method 1: Look for data-sitekey attribute
-        sitekey = page.evaluate("""
-            () => {
-                // Check for data-sitekey on various elements
-                const selectors = [
-                    '.g-recaptcha[data-sitekey]',
-                    '[data-sitekey]',
-                    '#recaptcha[data-sitekey]'
-                ];
-                for (const selector of selectors) {
-                    const elem = document.querySelector(selector);
-                    if (elem) {
-                        return elem.getAttribute('data-sitekey');
-                    }
-                }
-                return null;
-            }
-        """)
-
+        sitekey = page.evaluate(_SITEKEY_JS)
         if sitekey:
             return sitekey
 
         # Method 2: Extract from iframe URL
         iframe = page.query_selector('iframe[src*="recaptcha"]')
         if iframe:
-            src = iframe.get_attribute("src")
-            if src and "k=" in src:
-                # Parse sitekey from URL like: ...recaptcha/api2/anchor?k=SITEKEY&...
-                import re
-                match = re.search(r'[?&]k=([^&]+)', src)
-                if match:
-                    return match.group(1)
+            return _sitekey_from_iframe_src(iframe.get_attribute("src"))
 
         return None
 
@@ -203,49 +281,37 @@ def inject_captcha_response(page, token: str, trigger_callback: bool = False) ->
         True if injection was successful
     """
     try:
-        result = page.evaluate("""
-            (args) => {
-                const token = args.token;
-                const triggerCallback = args.triggerCallback;
-
-                // Find and fill ALL g-recaptcha-response textareas
-                const responseTextareas = document.querySelectorAll('[name="g-recaptcha-response"], #g-recaptcha-response');
-                responseTextareas.forEach(ta => {
-                    ta.value = token;
-                    ta.innerHTML = token;
-                });
-                console.log('Filled', responseTextareas.length, 'response textareas');
-
-                // Enable the submit button directly
-                // The server will validate the token when the form is submitted
-                const submitBtn = document.querySelector('.get-manual-btn, input[type="submit"][disabled]');
-                if (submitBtn) {
-                    submitBtn.disabled = false;
-                    submitBtn.removeAttribute('disabled');
-                    console.log('Enabled submit button');
-                }
+        result = page.evaluate(_INJECT_RESPONSE_JS, {"token": token, "triggerCallback": trigger_callback})
+        logger.info(f"Token injection result: {result}")
+        return result
 
-                // Only try callbacks if explicitly requested (they can cause errors)
-                if (triggerCallback) {
-                    try {
-                        // Look for data-callback attribute on recaptcha element
-                        const recaptchaDiv = document.querySelector('.g-recaptcha[data-callback]');
-                        if (recaptchaDiv) {
-                            const callbackName = recaptchaDiv.getAttribute('data-callback');
-                            if (callbackName && typeof window[callbackName] === 'function') {
-                                console.log('Triggering callback:', callbackName);
-                                window[callbackName](token);
-                            }
-                        }
-                    } catch (e) {
-                        console.log('Callback error (ignored):', e.message);
-                    }
-                }
+    except Exception as e:
+        logger.error(f"Error injecting captcha response: {e}")
+        return False
 
-                return responseTextareas.length > 0;
-            }
-        """, {"token": token, "triggerCallback": trigger_callback})
 
+async def extract_sitekey_from_page_async(page) -> str | None:
+    """Async version of extract_sitekey_from_page() for playwright.async_api pages."""
+    try:
+        sitekey = await page.evaluate(_SITEKEY_JS)
+        if sitekey:
+            return sitekey
+
+        iframe = await page.query_selector('iframe[src*="recaptcha"]')
+        if iframe:
+            return _sitekey_from_iframe_src(await iframe.get_attribute("src"))
+
+        return None
+
+    except Exception as e:
+        logger.error(f"Error extracting sitekey: {e}")
+        return None
+
+
+async def inject_captcha_response_async(page, token: str, trigger_callback: bool = False) -> bool:
+    """Async version of inject_captcha_response() for playwright.async_api pages."""
+    try:
+        result = await page.evaluate(_INJECT_RESPONSE_JS, {"token": token, "triggerCallback": trigger_callback})
         logger.info(f"Token injection result: {result}")
         return result
 
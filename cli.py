@@ -79,8 +79,9 @@ def scrape_manualslib(brand, brands, discover_brands, use_discovered, index_only
 @click.option("--download-only", is_flag=True, help="Only download pending manuals")
 @click.option("--limit-brands", type=int, help="Limit number of brands to process")
 @click.option("--brands", multiple=True, help="Specific brand URLs to scrape")
+@click.option("--refresh-brands", is_flag=True, help="Re-scrape the brand index even if cached")
 @click.option("--clear", is_flag=True, help="Clear all manualsbase records")
-def scrape_manualsbase(index_only, download_only, limit_brands, brands, clear):
+def scrape_manualsbase(index_only, download_only, limit_brands, brands, refresh_brands, clear):
     """Scrape CRT manuals from ManualsBase."""
     import sys
 
@@ -93,6 +94,8 @@ def scrape_manualsbase(index_only, download_only, limit_brands, brands, clear):
         argv.extend(["--limit-brands", str(limit_brands)])
     if brands:
         argv.extend(["--brands"] + list(brands))
+    if refresh_brands:
+        argv.append("--refresh-brands")
     if clear:
         argv.append("--clear")
 
@@ -1,20 +1,192 @@
+import atexit
+import os
+import queue
 import sqlite3
+import threading
+import traceback
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
 DB_PATH = Path(__file__).parent / "manuals.db"
 
 
-def get_connection():
-    conn = sqlite3.connect(DB_PATH)
+# Writes queued with queue_write() are applied by one background thread, up to
+# WRITE_BATCH_SIZE per transaction, so callers don't wait on SQLite commits.
+WRITE_BATCH_SIZE = 128
+_write_queue: queue.Queue = queue.Queue(maxsize=1024)
+_writer_thread: threading.Thread | None = None
+_writer_lock = threading.Lock()
+_local = threading.local()
+
+
+# Idle connections kept open for reuse. Reusing a connection skips reopening
+# the database and WAL files and keeps sqlite3's prepared-statement cache warm.
+POOL_SIZE = 8
+_pool: queue.LifoQueue = queue.LifoQueue(maxsize=POOL_SIZE)
+
+# How long a connection waits for another writer's lock before failing
+BUSY_TIMEOUT = 30
+
+
+class _PooledConnection(sqlite3.Connection):
+    """Connection whose close() hands it back to the pool.
+
+    While it is shared by a batch(), the database functions' own commit()
+    and close() calls are no-ops and the batch commits once at the end.
+    """
+
+    in_batch = False
+
+    def commit(self):
+        if not self.in_batch:
+            super().commit()
+
+    def close(self):
+        if self.in_batch:
+            return
+        if self.in_transaction:
+            self.rollback()  # Same as closing without committing
+        try:
+            _pool.put_nowait(self)
+        except queue.Full:
+            super().close()
+
+
+def _connect() -> _PooledConnection:
+    # Pooled connections move between threads, but only one uses each at a time
+    conn = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT, factory=_PooledConnection, check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    # Safe with WAL (a crash can only lose the last commits, not corrupt the
+    # database) and saves an fsync per commit
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     return conn
 
 
+def get_connection():
+    conn = getattr(_local, "batch_conn", None)
+    if conn is not None:
+        return conn
+    try:
+        return _pool.get_nowait()
+    except queue.Empty:
+        return _connect()
+
+
+# Connections (and their locks) inherited over fork() belong to the parent.
+# Kept here so the child never closes or reuses them; SQLite doesn't support
+# using a connection in a different process from the one that opened it.
+_inherited_connections: list = []
+
+
+def _reset_after_fork():
+    """Give a forked child (e.g. a multiprocessing worker) its own pool and writer."""
+    global _pool, _local, _write_queue, _writer_thread, _writer_lock
+    while True:
+        try:
+            _inherited_connections.append(_pool.get_nowait())
+        except queue.Empty:
+            break
+    batch_conn = getattr(_local, "batch_conn", None)
+    if batch_conn is not None:
+        _inherited_connections.append(batch_conn)
+    _pool = queue.LifoQueue(maxsize=POOL_SIZE)
+    _local = threading.local()
+    # The writer thread doesn't survive the fork; the child starts its own
+    _write_queue = queue.Queue(maxsize=1024)
+    _writer_thread = None
+    _writer_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+@contextmanager
+def batch():
+    """Run every database call made by this thread inside the block as one transaction.
+
+    Takes the write lock up front (BEGIN IMMEDIATE) and commits once at the
+    end, or rolls everything back if the block raises. Nested batches join
+    the outer one.
+    """
+    if getattr(_local, "batch_conn", None) is not None:
+        yield
+        return
+
+    conn = get_connection()
+    conn.in_batch = True
+    _local.batch_conn = conn
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        yield
+        conn.in_batch = False
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.in_batch = False
+        _local.batch_conn = None
+        conn.close()
+
+
+def _writer():
+    while True:
+        ops = [_write_queue.get()]
+        while len(ops) < WRITE_BATCH_SIZE:
+            try:
+                ops.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        try:
+            with batch():
+                for func, args, kwargs in ops:
+                    try:
+                        func(*args, **kwargs)
+                    except Exception:
+                        print(f"Queued database write {func.__name__} failed:")
+                        traceback.print_exc()
+        except Exception:
+            print("Committing queued database writes failed:")
+            traceback.print_exc()
+        finally:
+            for _ in ops:
+                _write_queue.task_done()
+
+
+def queue_write(func: Callable, *args, **kwargs):
+    """Apply a write function (e.g. update_downloaded) on the background writer thread.
+
+    Returns immediately; use flush_writes() before reading back anything
+    that depends on queued writes.
+    """
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer, name="db-writer", daemon=True)
+            _writer_thread.start()
+            atexit.register(flush_writes)
+    _write_queue.put((func, args, kwargs))
+
+
+def flush_writes():
+    """Block until every queued write has been committed."""
+    _write_queue.join()
+
+
 def init_db():
     conn = get_connection()
     cursor = conn.cursor()
 
+    # Write-ahead logging lets the dashboard and other scrapers read while a
+    # scraper writes. The mode is stored in the database file, so it only
+    # needs setting once.
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     # Brands table - discovered brands with TV category
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS brands (
@@ -81,6 +253,13 @@ def init_db():
         ("downloaded_at", "TEXT"),
         ("archive_checked_at", "TEXT"),
         ("original_filename", "TEXT"),
+        ("pdf_url", "TEXT"),
+        ("pdf_url_expires_at", "INTEGER"),
+        ("claimed_at", "INTEGER"),
+        ("claimed_by", "TEXT"),
+        ("content_length", "INTEGER"),
+        ("etag", "TEXT"),
+        ("content_host", "TEXT"),
     ]:
         try:
             cursor.execute(f"ALTER TABLE manuals ADD COLUMN {col} {coltype}")
@@ -92,6 +271,11 @@ def init_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_downloaded ON manuals(downloaded)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_archived ON manuals(archived)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_source ON manuals(source)")
+    # Fingerprints only identify a file on the host that served them
+    cursor.execute("DROP INDEX IF EXISTS idx_fingerprint")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_content_fingerprint ON manuals(content_host, content_length, etag)")
+    # Covering index so get_stats() never has to touch the table rows
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_stats ON manuals(source, downloaded, archived)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_brands_slug ON brands(slug)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_brands_scraped ON brands(scraped)")
 
@@ -114,6 +298,20 @@ def init_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_variants_manual_id ON file_variants(manual_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_variants_sha1 ON file_variants(file_sha1)")
 
+    # Brand index cache for sites whose brand list is scraped from a single
+    # index page (e.g. manualsbase), so re-runs can skip that page
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS source_brands (
+            source TEXT NOT NULL,
+            brand_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            slug TEXT,
+            url TEXT NOT NULL,
+            last_seen TEXT NOT NULL,
+            PRIMARY KEY (source, brand_id)
+        )
+    """)
+
     conn.commit()
     conn.close()
 
@@ -302,6 +500,49 @@ def add_manual(
         conn.close()
 
 
+def add_manuals_bulk(manuals: list[dict]) -> int:
+    """
+    Add many manuals in one transaction, skipping URLs already present.
+
+    Each dict uses the same keys as add_manual()'s arguments (brand, model
+    and manual_url are required). Returns the number of new rows inserted.
+    """
+    if not manuals:
+        return 0
+    conn = get_connection()
+    cursor = conn.cursor()
+    scraped_at = datetime.now().isoformat()
+    before = conn.total_changes
+    cursor.executemany("""
+        INSERT OR IGNORE INTO manuals (brand, model, model_url, model_id, doc_type, doc_description, manual_url, manualslib_id, source, source_id, category, scraped_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, [
+        (
+            m["brand"], m["model"], m.get("model_url"), m.get("model_id"), m.get("doc_type"),
+            m.get("doc_description"), m["manual_url"], m.get("manualslib_id"),
+            m.get("source", "manualslib"), m.get("source_id"), m.get("category"), scraped_at,
+        )
+        for m in manuals
+    ])
+    conn.commit()
+    inserted = conn.total_changes - before
+    conn.close()
+    return inserted
+
+
+def get_manual_urls(source: str = None) -> set[str]:
+    """Get the URLs of every manual already indexed (optionally for one source)."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    if source:
+        cursor.execute("SELECT manual_url FROM manuals WHERE source = ?", (source,))
+    else:
+        cursor.execute("SELECT manual_url FROM manuals")
+    urls = {row[0] for row in cursor}
+    conn.close()
+    return urls
+
+
 def get_manual_by_url(manual_url: str) -> dict | None:
     conn = get_connection()
     cursor = conn.cursor()
@@ -338,6 +579,34 @@ def add_brand(
         conn.close()
 
 
+def add_brands_bulk(brands: list[dict]) -> int:
+    """
+    Add many discovered brands in one transaction, skipping slugs already present.
+
+    Each dict uses the same keys as add_brand()'s arguments (name and slug
+    are required). Returns the number of new rows inserted.
+    """
+    if not brands:
+        return 0
+    conn = get_connection()
+    cursor = conn.cursor()
+    before = conn.total_changes
+    cursor.executemany("""
+        INSERT OR IGNORE INTO brands (name, slug, brand_url, tv_categories, tv_category_urls, all_categories)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, [
+        (
+            b["name"], b["slug"], b.get("brand_url"), b.get("tv_categories"),
+            b.get("tv_category_urls"), b.get("all_categories"),
+        )
+        for b in brands
+    ])
+    conn.commit()
+    inserted = conn.total_changes - before
+    conn.close()
+    return inserted
+
+
 def get_all_brands(scraped: bool = None) -> list[dict]:
     """Get all discovered brands, optionally filtered by scraped status."""
     conn = get_connection()
@@ -363,6 +632,37 @@ def get_unscraped_brands() -> list[dict]:
     return get_all_brands(scraped=False)
 
 
+def iter_unscraped_brands(batch: int = 100) -> Iterator[dict]:
+    """
+    Yield brands that haven't been scraped yet, in name order.
+
+    Reads `batch` rows at a time (keyed on the last name/id seen), so the
+    list is never held in memory and no read stays open while a brand is
+    being scraped.
+    """
+    last = ("", 0)
+    while True:
+        conn = get_connection()
+        rows = conn.execute("""
+            SELECT * FROM brands
+            WHERE scraped = 0 AND (name, id) > (?, ?)
+            ORDER BY name, id LIMIT ?
+        """, (*last, batch)).fetchall()
+        conn.close()
+        if not rows:
+            return
+        last = (rows[-1]["name"], rows[-1]["id"])
+        yield from (dict(row) for row in rows)
+
+
+def count_unscraped_brands() -> int:
+    """Count brands that haven't been scraped yet."""
+    conn = get_connection()
+    count = conn.execute("SELECT COUNT(*) FROM brands WHERE scraped = 0").fetchone()[0]
+    conn.close()
+    return count
+
+
 def mark_brand_scraped(brand_id: int):
     """Mark a brand as scraped."""
     conn = get_connection()
@@ -382,16 +682,49 @@ def get_brand_by_slug(slug: str) -> dict | None:
     return dict(row) if row else None
 
 
+def get_cached_brands(source: str, max_age_days: int = 7) -> list[dict] | None:
+    """Get a source's cached brand list, or None if empty or older than max_age_days."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT brand_id AS id, name, slug, url, last_seen
+        FROM source_brands
+        WHERE source = ?
+        ORDER BY rowid
+    """, (source,))
+    rows = cursor.fetchall()
+    conn.close()
+    if not rows:
+        return None
+
+    newest = max(datetime.fromisoformat(row["last_seen"]) for row in rows)
+    if (datetime.now() - newest).days >= max_age_days:
+        return None
+    return [dict(row) for row in rows]
+
+
+def save_cached_brands(source: str, brands: list[dict]):
+    """Replace a source's cached brand list. Each brand needs id, name, slug, url."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    last_seen = datetime.now().isoformat()
+    cursor.execute("DELETE FROM source_brands WHERE source = ?", (source,))
+    cursor.executemany("""
+        INSERT OR REPLACE INTO source_brands (source, brand_id, name, slug, url, last_seen)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, [(source, b["id"], b["name"], b.get("slug"), b["url"], last_seen) for b in brands])
+    conn.commit()
+    conn.close()
+
+
 def get_brand_stats() -> dict:
     """Get statistics about discovered brands."""
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("SELECT COUNT(*) as total FROM brands")
-    total = cursor.fetchone()["total"]
-
-    cursor.execute("SELECT COUNT(*) as scraped FROM brands WHERE scraped = 1")
-    scraped = cursor.fetchone()["scraped"]
+    cursor.execute("SELECT COUNT(*) as total, COALESCE(SUM(scraped = 1), 0) as scraped FROM brands")
+    row = cursor.fetchone()
+    total, scraped = row["total"], row["scraped"]
 
     conn.close()
 
@@ -479,6 +812,68 @@ def update_archived(manual_id: int, archive_url: str):
     conn.close()
 
 
+def mark_archived_bulk(archive_urls: dict[int, str]):
+    """Mark many manuals as archived at once, given {manual_id: archive_url}."""
+    if not archive_urls:
+        return
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.executemany("""
+        UPDATE manuals
+        SET archived = 1, archive_url = ?
+        WHERE id = ?
+    """, [(archive_url, manual_id) for manual_id, archive_url in archive_urls.items()])
+    conn.commit()
+    conn.close()
+
+
+def update_pdf_url(manual_id: int, pdf_url: str, expires_at: int = None):
+    """Remember a manual's direct PDF link and when it expires (Unix time, if signed)."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE manuals
+        SET pdf_url = ?, pdf_url_expires_at = ?
+        WHERE id = ?
+    """, (pdf_url, expires_at, manual_id))
+    conn.commit()
+    conn.close()
+
+
+def update_fingerprint(manual_id: int, content_length: int, etag: str, host: str):
+    """Record the Content-Length, ETag and host the manual's PDF was served with."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        UPDATE manuals
+        SET content_length = ?, etag = ?, content_host = ?
+        WHERE id = ?
+    """, (content_length, etag, host, manual_id))
+    conn.commit()
+    conn.close()
+
+
+def find_by_fingerprint(content_length: int, etag: str, host: str, source: str) -> dict | None:
+    """
+    Find a downloaded manual from the same source whose PDF was served by
+    the same host with this Content-Length and ETag.
+
+    An ETag only means something to the server that issued it, so matches
+    are never made across hosts or sources.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT * FROM manuals
+        WHERE content_host = ? AND content_length = ? AND etag = ?
+        AND source = ? AND downloaded = 1 AND file_sha1 IS NOT NULL
+        LIMIT 1
+    """, (host, content_length, etag, source))
+    row = cursor.fetchone()
+    conn.close()
+    return dict(row) if row else None
+
+
 def update_manualslib_id(manual_id: int, manualslib_id: str):
     conn = get_connection()
     cursor = conn.cursor()
@@ -491,6 +886,21 @@ def update_manualslib_id(manual_id: int, manualslib_id: str):
     conn.close()
 
 
+def update_manualslib_ids(manualslib_ids: dict[int, str]):
+    """Set many manuals' manualslib_id at once, given {manual_id: manualslib_id}."""
+    if not manualslib_ids:
+        return
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.executemany("""
+        UPDATE manuals
+        SET manualslib_id = ?
+        WHERE id = ?
+    """, [(manualslib_id, manual_id) for manual_id, manualslib_id in manualslib_ids.items()])
+    conn.commit()
+    conn.close()
+
+
 def get_manuals_needing_archive_check(limit: int = 100) -> list[dict]:
     """Get manuals that haven't been checked on archive.org recently.
 
@@ -538,6 +948,22 @@ def update_archive_checked(manual_id: int, is_archived: bool, archive_url: str =
     conn.close()
 
 
+def update_archive_checked_many(manual_ids: list[int]):
+    """Record a negative archive check (not archived) for many manuals at once."""
+    if not manual_ids:
+        return
+    conn = get_connection()
+    cursor = conn.cursor()
+    checked_at = datetime.now().isoformat()
+    cursor.executemany("""
+        UPDATE manuals
+        SET archive_checked_at = ?
+        WHERE id = ?
+    """, [(checked_at, manual_id) for manual_id in manual_ids])
+    conn.commit()
+    conn.close()
+
+
 def get_archive_check_stats() -> dict:
     """Get statistics about archive checking progress."""
     conn = get_connection()
@@ -634,6 +1060,87 @@ def get_undownloaded_manuals(brand: str = None, include_archived: bool = False,
     return [dict(row) for row in rows]
 
 
+def claim_batch(worker_id: str, n: int = 50, lease_seconds: int = 600, brand: str = None, source: str = None) -> list[dict]:
+    """
+    Atomically claim up to n pending manuals for one worker.
+
+    Skips manuals another worker claimed less than lease_seconds ago, so
+    several processes can work through the same database without
+    downloading the same manual twice. Claimed rows are returned in id order.
+    """
+    now = int(datetime.now().timestamp())
+    query = """
+        UPDATE manuals
+        SET claimed_at = ?, claimed_by = ?
+        WHERE id IN (
+            SELECT id FROM manuals
+            WHERE downloaded = 0 AND archived = 0
+            AND (claimed_at IS NULL OR claimed_at < ?)
+    """
+    params = [now, worker_id, now - lease_seconds]
+
+    if brand:
+        query += " AND brand = ?"
+        params.append(brand)
+
+    if source:
+        query += " AND source = ?"
+        params.append(source)
+
+    query += " ORDER BY id LIMIT ?) RETURNING *"
+    params.append(n)
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    conn.commit()
+    conn.close()
+    return sorted((dict(row) for row in rows), key=lambda m: m["id"])
+
+
+def release_claims(worker_id: str, brand: str = None):
+    """Release every claim held by a worker (e.g. when it stops), optionally for one brand only."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    query = """
+        UPDATE manuals
+        SET claimed_at = NULL, claimed_by = NULL
+        WHERE claimed_by = ?
+    """
+    params = [worker_id]
+
+    if brand:
+        query += " AND brand = ?"
+        params.append(brand)
+
+    cursor.execute(query, params)
+    conn.commit()
+    conn.close()
+
+
+def count_undownloaded_manuals(brand: str = None, source: str = None) -> int:
+    """Count manuals that haven't been downloaded or archived."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    query = "SELECT COUNT(*) FROM manuals WHERE downloaded = 0 AND archived = 0"
+    params = []
+
+    if brand:
+        query += " AND brand = ?"
+        params.append(brand)
+
+    if source:
+        query += " AND source = ?"
+        params.append(source)
+
+    cursor.execute(query, params)
+    count = cursor.fetchone()[0]
+    conn.close()
+    return count
+
+
 def get_stats(source: str = None) -> dict:
     conn = get_connection()
     cursor = conn.cursor()
@@ -644,14 +1151,15 @@ def get_stats(source: str = None) -> dict:
         source_filter = " WHERE source = ?"
         params = [source]
 
-    cursor.execute(f"SELECT COUNT(*) as total FROM manuals{source_filter}", params)
-    total = cursor.fetchone()["total"]
-
-    cursor.execute(f"SELECT COUNT(*) as downloaded FROM manuals WHERE downloaded = 1{' AND source = ?' if source else ''}", params)
-    downloaded = cursor.fetchone()["downloaded"]
-
-    cursor.execute(f"SELECT COUNT(*) as archived FROM manuals WHERE archived = 1{' AND source = ?' if source else ''}", params)
-    archived = cursor.fetchone()["archived"]
+    # One pass over idx_stats for all three counts
+    cursor.execute(f"""
+        SELECT COUNT(*) as total,
+               COALESCE(SUM(downloaded = 1), 0) as downloaded,
+               COALESCE(SUM(archived = 1), 0) as archived
+        FROM manuals{source_filter}
+    """, params)
+    row = cursor.fetchone()
+    total, downloaded, archived = row["total"], row["downloaded"], row["archived"]
 
     by_brand_query = """
         SELECT brand,
@@ -2,8 +2,12 @@
 """Internet Archive uploader for manual PDFs (ManualsLib, ManualsBase, etc.)."""
 
 import logging
+import mmap
+import multiprocessing
 import re
 import subprocess
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 import internetarchive as ia
@@ -11,8 +15,9 @@ import internetarchive as ia
 import database
 
 
+@lru_cache(maxsize=1)
 def get_git_commit() -> str | None:
-    """Get the current git commit hash."""
+    """Get the current git commit hash (looked up once per process)."""
     try:
         result = subprocess.run(
             ["git", "rev-parse", "--short", "HEAD"],
@@ -28,6 +33,12 @@ def get_git_commit() -> str | None:
 
 logger = logging.getLogger(__name__)
 
+# Control characters not allowed in XML 1.0 (tab, newline and CR are kept)
+XML_INVALID_CHARS_PATTERN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+# Runs of characters (including underscores) that collapse to a single "_"
+# in an IA identifier
+IDENTIFIER_INVALID_RUN_PATTERN = re.compile(r'[^a-zA-Z0-9-]+')
+
 
 def sanitize_xml_string(text: str) -> str:
     """
@@ -38,8 +49,7 @@ def sanitize_xml_string(text: str) -> str:
     if not text:
         return text
     # Remove control characters (0x00-0x1F except tab, newline, carriage return)
-    cleaned = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-    return cleaned
+    return XML_INVALID_CHARS_PATTERN.sub('', text)
 
 
 def sanitize_identifier(text: str) -> str:
@@ -48,10 +58,8 @@ def sanitize_identifier(text: str) -> str:
 
     IA identifiers must be 5-100 chars, alphanumeric with underscores/dashes.
     """
-    # Replace spaces and special chars with underscores
-    identifier = re.sub(r'[^a-zA-Z0-9_-]', '_', text)
-    # Collapse multiple underscores
-    identifier = re.sub(r'_+', '_', identifier)
+    # Replace spaces and special chars with underscores, collapsing runs
+    identifier = IDENTIFIER_INVALID_RUN_PATTERN.sub('_', text)
     # Remove leading/trailing underscores
     identifier = identifier.strip('_')
     # Ensure minimum length
@@ -63,20 +71,38 @@ def sanitize_identifier(text: str) -> str:
     return identifier
 
 
+def prefixed_identifier(prefix: str, brand: str, model: str) -> str:
+    """
+    Build a fallback IA identifier of the form "<prefix>-<brand>-<model>".
+
+    Only the brand/model part is sanitized; the prefix is already a valid
+    identifier and long enough to satisfy the 5 char minimum. Produces the
+    same result as sanitize_identifier() on the full string.
+    """
+    suffix = IDENTIFIER_INVALID_RUN_PATTERN.sub('_', f"{brand}-{model}").rstrip('_')
+    return f"{prefix}-{suffix}"[:100]
+
+
 def build_upload_metadata(manual: dict) -> dict:
     """
     Build metadata dict for an Internet Archive upload.
 
-    Returns dict with: identifier, title, metadata, local_file, remote_filename
+    Returns dict with: identifier, title, metadata, local_file, remote_filename, md5
     """
     # Get primary variant for file path, fallback to legacy column
     primary_variant = database.get_primary_variant(manual["id"])
     if primary_variant:
         file_path = primary_variant["file_path"]
+        file_md5 = primary_variant["file_md5"]
     else:
         file_path = manual.get("file_path")
+        file_md5 = manual.get("file_md5")
 
-    source = manual.get("source", "manualslib")
+    # brand and model are NOT NULL in the schema; the rest are nullable or
+    # added by migrations, so they keep .get()
+    raw_brand = manual["brand"]
+    raw_model = manual["model"]
+    source = manual.get("source") or "manualslib"
 
     # Create identifier based on source
     if source == "manualsbase":
@@ -84,14 +110,14 @@ def build_upload_metadata(manual: dict) -> dict:
         if source_id:
             identifier = f"manualsbase-id-{source_id}"
         else:
-            identifier = sanitize_identifier(f"manualsbase-{manual['brand']}-{manual['model']}")
+            identifier = prefixed_identifier("manualsbase", raw_brand, raw_model)
         subjects = ["manualsbase", "manuals"]
     elif source == "manualzz":
         source_id = manual.get("source_id")
         if source_id:
             identifier = f"manualzz-id-{source_id}"
         else:
-            identifier = sanitize_identifier(f"manualzz-{manual['brand']}-{manual['model']}")
+            identifier = prefixed_identifier("manualzz", raw_brand, raw_model)
         subjects = ["manualzz", "manuals"]
     else:
         # ManualsLib (default)
@@ -99,20 +125,22 @@ def build_upload_metadata(manual: dict) -> dict:
         if manualslib_id:
             identifier = f"manualslib-id-{manualslib_id}"
         else:
-            identifier = sanitize_identifier(f"manualslib-{manual['brand']}-{manual['model']}")
+            identifier = prefixed_identifier("manualslib", raw_brand, raw_model)
         subjects = ["manualslib", "manuals"]
 
     # Build title: "Brand Model Document Type"
-    brand = sanitize_xml_string(manual.get("brand", "Unknown"))
-    model = sanitize_xml_string(manual.get("model", ""))
-    doc_type = sanitize_xml_string(manual.get("doc_type", "Manual"))
+    brand = sanitize_xml_string(raw_brand)
+    model = sanitize_xml_string(raw_model)
+    doc_type = sanitize_xml_string(manual.get("doc_type") or "Manual")
 
     # Clean up model field - remove brand prefix if present
-    if model.lower().startswith(brand.lower()):
+    model_lower = model.lower()
+    if model_lower.startswith(brand.lower()):
         model = model[len(brand):].strip()
+        model_lower = model.lower()
 
     # Don't append doc_type if model already contains it
-    if doc_type.lower() in model.lower():
+    if doc_type.lower() in model_lower:
         title = f"{brand} {model}".strip()
     else:
         title = f"{brand} {model} {doc_type}".strip()
@@ -137,12 +165,14 @@ def build_upload_metadata(manual: dict) -> dict:
     }
 
     # Add description
-    if manual.get("doc_description"):
-        metadata["description"] = sanitize_xml_string(manual["doc_description"])
+    doc_description = manual.get("doc_description")
+    if doc_description:
+        metadata["description"] = sanitize_xml_string(doc_description)
 
     # Add source URL
-    if manual.get("manual_url"):
-        metadata["source"] = sanitize_xml_string(manual["manual_url"])
+    manual_url = manual["manual_url"]
+    if manual_url:
+        metadata["source"] = sanitize_xml_string(manual_url)
 
     # Add checksums as external identifiers (searchable on IA)
     # Include checksums from all file variants
@@ -160,15 +190,19 @@ def build_upload_metadata(manual: dict) -> dict:
                 external_ids.append(f"urn:{v['variant_type']}-sha1:{v['file_sha1']}")
     else:
         # Fallback to legacy columns
-        if manual.get("file_md5"):
-            external_ids.append(f"urn:md5:{manual['file_md5']}")
-        if manual.get("file_sha1"):
-            external_ids.append(f"urn:sha1:{manual['file_sha1']}")
+        legacy_md5 = manual.get("file_md5")
+        legacy_sha1 = manual.get("file_sha1")
+        original_md5 = manual.get("original_file_md5")
+        original_sha1 = manual.get("original_file_sha1")
+        if legacy_md5:
+            external_ids.append(f"urn:md5:{legacy_md5}")
+        if legacy_sha1:
+            external_ids.append(f"urn:sha1:{legacy_sha1}")
         # Include original (pre-watermark-strip) checksums if they differ from final
-        if manual.get("original_file_md5") and manual.get("original_file_md5") != manual.get("file_md5"):
-            external_ids.append(f"urn:original-md5:{manual['original_file_md5']}")
-        if manual.get("original_file_sha1") and manual.get("original_file_sha1") != manual.get("file_sha1"):
-            external_ids.append(f"urn:original-sha1:{manual['original_file_sha1']}")
+        if original_md5 and original_md5 != legacy_md5:
+            external_ids.append(f"urn:original-md5:{original_md5}")
+        if original_sha1 and original_sha1 != legacy_sha1:
+            external_ids.append(f"urn:original-sha1:{original_sha1}")
     # Deduplicate while preserving order
     external_ids = list(dict.fromkeys(external_ids))
     if external_ids:
@@ -180,6 +214,7 @@ def build_upload_metadata(manual: dict) -> dict:
         "metadata": metadata,
         "local_file": file_path,
         "remote_filename": remote_filename,
+        "md5": file_md5,
     }
 
 
@@ -216,20 +251,45 @@ def upload_manual_to_ia(manual: dict) -> str | None:
             logger.info(f"Item already exists: https://archive.org/details/{identifier}")
             return f"https://archive.org/details/{identifier}"
 
+        # The MD5 was computed when the file was downloaded, so hand it to IA
+        # as Content-MD5 instead of letting the client re-read the whole file
+        # (verify=True would hash it again before sending).
+        headers = {}
+        if upload_info["md5"]:
+            headers["Content-MD5"] = upload_info["md5"]
+
         # Upload with custom remote filename
-        # files dict maps remote filename -> local path
-        result = ia.upload(
-            identifier,
-            files={remote_filename: file_path},
-            metadata=metadata,
-            verbose=True,
-        )
+        # files dict maps remote filename -> local file (path or file-like)
+        with open(file_path, "rb") as f:
+            # Memory-map the PDF so the upload reads straight from the page
+            # cache. mmap can't map an empty file, so those go up as a path.
+            if Path(file_path).stat().st_size > 0:
+                body = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                body = file_path
+            try:
+                result = ia.upload(
+                    identifier,
+                    files={remote_filename: body},
+                    metadata=metadata,
+                    headers=headers,
+                    verify=False,
+                    verbose=True,
+                )
+            finally:
+                if isinstance(body, mmap.mmap):
+                    body.close()
 
         # Check result
-        if result and all(r.status_code == 200 for r in result):
+        bad = [r for r in result or [] if r.status_code != 200]
+        if result and not bad:
             archive_url = f"https://archive.org/details/{identifier}"
             logger.info(f"Upload successful: {archive_url}")
             return archive_url
+        elif bad:
+            for r in bad:
+                logger.error(f"Upload failed: {r.status_code} {r.request.url} - {r.text[:200]}")
+            return None
         else:
             logger.error(f"Upload failed: {result}")
             return None
@@ -310,24 +370,32 @@ def upload_all_pending(
     return success, failed
 
 
-def print_upload_preview(manual: dict):
-    """Print a detailed preview of what would be uploaded."""
+def _format_preview(manual: dict) -> str:
+    """Build the dry-run preview text for a single manual."""
     upload_info = build_upload_metadata(manual)
 
-    print("=" * 70)
-    print(f"Identifier:      {upload_info['identifier']}")
-    print(f"Title:           {upload_info['title']}")
-    print(f"Local file:      {upload_info['local_file']}")
-    print(f"Remote filename: {upload_info['remote_filename']}")
-    print(f"URL:             https://archive.org/details/{upload_info['identifier']}")
-    print()
-    print("Metadata:")
+    lines = [
+        "=" * 70,
+        f"Identifier:      {upload_info['identifier']}",
+        f"Title:           {upload_info['title']}",
+        f"Local file:      {upload_info['local_file']}",
+        f"Remote filename: {upload_info['remote_filename']}",
+        f"URL:             https://archive.org/details/{upload_info['identifier']}",
+        "",
+        "Metadata:",
+    ]
     for key, value in upload_info['metadata'].items():
         if isinstance(value, list):
-            print(f"  {key}: {', '.join(value)}")
+            lines.append(f"  {key}: {', '.join(value)}")
         else:
-            print(f"  {key}: {value}")
-    print()
+            lines.append(f"  {key}: {value}")
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def print_upload_preview(manual: dict):
+    """Print a detailed preview of what would be uploaded."""
+    sys.stdout.write(_format_preview(manual))
 
 
 def main():
@@ -349,8 +417,11 @@ def main():
     if args.dry_run:
         manuals = get_uploadable_manuals(source=args.source, limit=args.limit)
         print(f"Would upload {len(manuals)} manual(s):\n")
-        for m in manuals:
-            print_upload_preview(m)
+        # Previews are independent, so build them across cores. imap keeps
+        # the brand/model ordering from the query.
+        with multiprocessing.Pool() as pool:
+            for preview in pool.imap(_format_preview, manuals, chunksize=64):
+                sys.stdout.write(preview)
     else:
         success, failed = upload_all_pending(
             source=args.source,
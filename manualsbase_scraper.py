@@ -2,28 +2,39 @@
 """Scraper for manualsbase.com TV/monitor manuals."""
 
 import argparse
+import asyncio
 import hashlib
 import logging
+import mmap
 import os
 import random
 import re
-import shutil
 import tempfile
-import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cache, lru_cache
 from pathlib import Path
 
 import yaml
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright, Page
+from playwright.async_api import async_playwright, Page
 
 load_dotenv()
 
 import database
-from browser_helper import launch_browser_with_extension, get_extension_path, setup_bandwidth_saving, apply_stealth
-from captcha_solver import TwoCaptchaSolver, extract_sitekey_from_page, inject_captcha_response
+from browser_helper import (
+    PagePool,
+    apply_stealth_async,
+    get_extension_path,
+    launch_browser_with_extension_async,
+    set_resource_blocking_async,
+    setup_bandwidth_saving_async,
+)
+from captcha_solver import TwoCaptchaSolver, extract_sitekey_from_page_async, inject_captcha_response_async
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,9 +45,19 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://www.manualsbase.com"
 ARCHIVE_ORG_BASE = "https://archive.org/details/manualsbase-id-"
 
+# URL patterns, compiled once since they run for every link on a page
+_MANUAL_NUMERIC_RE = re.compile(r'/manual/(\d+)/')
+_MANUAL_SLUG_RE = re.compile(r'/manual/[^/]+/[^/]+/([^/]+)/')
+_BRAND_DETAILS_RE = re.compile(r'/brand/details/(\d+)/([^/]+)/')
+_CATEGORY_URL_RE = re.compile(r'/manuals/\d+/(\d+)/[^/]+/([^/]+)/')
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+
+def check_archive_org(source_id: str) -> tuple[bool | None, str]:
+    """Check if a manual exists on archive.org. Returns (exists, archive_url).
 
-def check_archive_org(source_id: str) -> tuple[bool, str]:
-    """Check if a manual exists on archive.org. Returns (exists, archive_url)."""
+    `exists` is None if the check itself failed (timeout, non-404 HTTP error).
+    """
     archive_url = f"{ARCHIVE_ORG_BASE}{source_id}"
     try:
         req = urllib.request.Request(archive_url, method='HEAD')
@@ -47,10 +68,50 @@ def check_archive_org(source_id: str) -> tuple[bool, str]:
         if e.code == 404:
             return False, archive_url
         logger.warning(f"HTTP error checking archive.org: {e.code}")
-        return False, archive_url
+        return None, archive_url
     except Exception as e:
         logger.warning(f"Error checking archive.org: {e}")
-        return False, archive_url
+        return None, archive_url
+
+
+ARCHIVE_CHECK_CONCURRENCY = 32
+# How long a "not archived" result is trusted (same window as archive_checker)
+ARCHIVE_CHECK_TTL = timedelta(days=7)
+
+
+def archive_check_is_fresh(manual_record: dict) -> bool:
+    """True if the manual was checked against archive.org within ARCHIVE_CHECK_TTL."""
+    checked_at = manual_record.get("archive_checked_at")
+    if not checked_at:
+        return False
+    try:
+        return datetime.now() - datetime.fromisoformat(checked_at) < ARCHIVE_CHECK_TTL
+    except ValueError:
+        return False
+
+
+async def batch_check_archive_org(source_ids: list[str]) -> tuple[set[str], set[str]]:
+    """Check many source IDs against archive.org concurrently.
+
+    Runs check_archive_org() on a pool of ARCHIVE_CHECK_CONCURRENCY threads
+    and returns (source IDs that already exist, source IDs whose check failed).
+    """
+    source_ids = list(dict.fromkeys(source_ids))
+    if not source_ids:
+        return set(), set()
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=ARCHIVE_CHECK_CONCURRENCY) as executor:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, check_archive_org, source_id)
+            for source_id in source_ids
+        ))
+    archived = {source_id for source_id, (exists, _) in zip(source_ids, results) if exists}
+    failed = {source_id for source_id, (exists, _) in zip(source_ids, results) if exists is None}
+    return archived, failed
+
+# Days before the cached brand index is scraped again
+BRAND_CACHE_DAYS = 7
 
 # Default categories to look for (can be overridden in config.yaml)
 DEFAULT_TARGET_CATEGORIES = ["tv", "television", "monitor", "crt", "remote"]
@@ -60,7 +121,9 @@ captcha_solver: TwoCaptchaSolver | None = None
 CAPTCHA_TIMEOUT = 300  # 5 minutes for manual solving
 
 
+@lru_cache(maxsize=1)
 def load_config() -> dict:
+    """Load config.yaml (parsed once per process)."""
     config_path = Path(__file__).parent / "config.yaml"
     with open(config_path) as f:
         return yaml.safe_load(f)
@@ -78,21 +141,58 @@ def get_config(config: dict, key: str, default=None, namespace: str = "manualsba
     return config.get(key, default)
 
 
-# Global delay settings (updated from config in main())
-DELAY_MIN = 2.0
-DELAY_MAX = 5.0
+def compile_target_pattern(targets: tuple[str, ...]) -> re.Pattern:
+    """Single regex alternation over lowercased targets (never matches if none)."""
+    if not targets:
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(map(re.escape, targets)))
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Config-derived values, resolved once in main()."""
+
+    delay_min: float = 2.0
+    delay_max: float = 5.0
+    targets: tuple[str, ...] = tuple(DEFAULT_TARGET_CATEGORIES)
+    target_re: re.Pattern = compile_target_pattern(tuple(DEFAULT_TARGET_CATEGORIES))
+    download_dir: Path = Path("./downloads")
+    extension_path: Path | None = None
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Settings":
+        targets = tuple(t.lower() for t in get_config(config, "categories", DEFAULT_TARGET_CATEGORIES))
+        return cls(
+            delay_min=config.get("delay_min", 2.0),
+            delay_max=config.get("delay_max", 5.0),
+            targets=targets,
+            target_re=compile_target_pattern(targets),
+            download_dir=Path(config.get("download_dir", "./downloads")).resolve(),
+            extension_path=get_extension_path(config, Path(__file__).parent),
+        )
+
 
+# Replaced with the values from config.yaml in main()
+SETTINGS = Settings()
 
-def random_delay(min_sec: float = None, max_sec: float = None):
-    """Sleep for a random delay. Uses global DELAY_MIN/MAX if not specified."""
-    min_sec = min_sec if min_sec is not None else DELAY_MIN
-    max_sec = max_sec if max_sec is not None else DELAY_MAX
+
+async def random_delay(min_sec: float = None, max_sec: float = None):
+    """Sleep for a random delay. Uses the configured delay range if not specified."""
+    min_sec = min_sec if min_sec is not None else SETTINGS.delay_min
+    max_sec = max_sec if max_sec is not None else SETTINGS.delay_max
     delay = random.uniform(min_sec, max_sec)
-    time.sleep(delay)
+    await asyncio.sleep(delay)
 
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]', '_', name)
+    return _SANITIZE_RE.sub('_', name)
+
+
+@cache
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per run."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def get_sha1_storage_path(download_dir: Path, sha1: str, extension: str = ".pdf") -> Path:
@@ -105,14 +205,35 @@ def get_sha1_storage_path(download_dir: Path, sha1: str, extension: str = ".pdf"
     return download_dir / dir1 / dir2 / filename
 
 
+HASH_CHUNK_SIZE = 1024 * 1024  # Read size when a file can't be memory-mapped
+
+
 def compute_checksums(file_path: Path) -> tuple[str, str]:
-    """Compute SHA1 and MD5 checksums for a file. Returns (sha1, md5)."""
+    """Compute SHA1 and MD5 checksums for a file. Returns (sha1, md5).
+
+    Both digests are load-bearing: SHA1 names the file in the storage trie,
+    and MD5 is stored on the file variant (NOT NULL), published as an
+    urn:md5 external identifier and sent as Content-MD5 on IA upload.
+    """
     sha1 = hashlib.sha1()
     md5 = hashlib.md5()
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            sha1.update(chunk)
-            md5.update(chunk)
+        try:
+            # Hash the whole file in one call per digest. hashlib releases the
+            # GIL on large buffers, so SHA1 and MD5 run on separate cores.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    sha1_done = executor.submit(sha1.update, mm)
+                    md5_done = executor.submit(md5.update, mm)
+                    sha1_done.result()
+                    md5_done.result()
+        except (ValueError, OSError):
+            # Empty files can't be mapped; fall back to large buffered reads
+            buf = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                sha1.update(view[:n])
+                md5.update(view[:n])
     return sha1.hexdigest(), md5.hexdigest()
 
 
@@ -124,65 +245,91 @@ def extract_manualsbase_id(url: str) -> str | None:
     - /manual/lcd-tvs/sony/model-name/ (slug-based, use model as ID)
     """
     # Try numeric ID first
-    match = re.search(r'/manual/(\d+)/', url)
+    match = _MANUAL_NUMERIC_RE.search(url)
     if match:
         return match.group(1)
 
     # Fall back to extracting model slug as identifier
     # Pattern: /manual/{category}/{brand}/{model}/
-    match = re.search(r'/manual/[^/]+/[^/]+/([^/]+)/', url)
+    match = _MANUAL_SLUG_RE.search(url)
     if match:
         return match.group(1)
 
     return None
 
 
-def get_target_categories() -> list[str]:
-    """Get target categories from config or use defaults."""
-    config = load_config()
-    return get_config(config, "categories", DEFAULT_TARGET_CATEGORIES)
-
-
 def matches_target_category(category_name: str) -> bool:
     """Check if a category name matches our target categories."""
-    category_lower = category_name.lower()
-    for target in get_target_categories():
-        if target.lower() in category_lower:
-            return True
-    return False
+    return SETTINGS.target_re.search(category_name.lower()) is not None
+
+
+# Returns [{url, text}] for links matching the selector (absolute URLs,
+# optionally first occurrence only)
+_READ_LINKS_JS = """
+    ([selector, baseUrl, dedupe]) => {
+        const links = [];
+        const seen = new Set();
+        for (const a of document.querySelectorAll(selector)) {
+            const href = a.getAttribute('href');
+            if (!href) continue;
+            const url = href.startsWith('http') ? href : baseUrl + href;
+            if (dedupe) {
+                if (seen.has(url)) continue;
+                seen.add(url);
+            }
+            links.push({url, text: (a.innerText || '').trim()});
+        }
+        return links;
+    }
+"""
+
+
+# True once at least one link matches and the count is unchanged since the
+# previous poll
+_LINK_COUNT_STABLE_JS = """
+    selector => {
+        const count = document.querySelectorAll(selector).length;
+        const stable = count > 0 && count === window.__salliLinkCount;
+        window.__salliLinkCount = count;
+        return stable;
+    }
+"""
+
+
+async def read_links(page: Page, selector: str, dedupe: bool = True) -> list[dict]:
+    """Read all matching links as [{url, text}] in a single evaluate() call.
+
+    URLs are made absolute against BASE_URL and, with dedupe, only the
+    first link for each URL is kept.
+    """
+    return await page.evaluate(_READ_LINKS_JS, [selector, BASE_URL, dedupe])
 
 
-def scrape_all_brands(page: Page) -> list[dict]:
+async def scrape_all_brands(page: Page) -> list[dict]:
     """Scrape the all brands page to get list of brands with their URLs."""
     brands_url = f"{BASE_URL}/brand/allbrands/"
     logger.info(f"Scraping all brands from: {brands_url}")
 
-    page.goto(brands_url, wait_until="domcontentloaded")
-    random_delay(1, 2)
+    await page.goto(brands_url, wait_until="domcontentloaded")
+    await random_delay(1, 2)
 
     # Wait for content to load
     try:
-        page.wait_for_selector('a[href*="/brand/details/"]', timeout=30000)
+        await page.wait_for_selector('a[href*="/brand/details/"]', timeout=30000)
     except Exception:
         logger.warning("Timeout waiting for brand links")
 
     # Extract all brand links
-    brand_links = page.query_selector_all('a[href*="/brand/details/"]')
+    brand_links = await read_links(page, 'a[href*="/brand/details/"]')
 
     brands = []
-    seen_urls = set()
 
     for link in brand_links:
-        href = link.get_attribute("href")
-        if not href or href in seen_urls:
-            continue
-        seen_urls.add(href)
-
-        brand_name = link.inner_text().strip()
-        brand_url = href if href.startswith("http") else BASE_URL + href
+        brand_url = link["url"]
+        brand_name = link["text"]
 
         # Extract brand ID from URL
-        match = re.search(r'/brand/details/(\d+)/([^/]+)/', href)
+        match = _BRAND_DETAILS_RE.search(brand_url)
         if match:
             brand_id = match.group(1)
             brand_slug = match.group(2)
@@ -197,107 +344,102 @@ def scrape_all_brands(page: Page) -> list[dict]:
     return brands
 
 
-def scrape_brand_categories(page: Page, brand: dict) -> list[dict]:
+async def scrape_brand_categories(page: Page, brand: dict) -> list[dict]:
     """Scrape a brand page to find TV-related categories."""
     logger.info(f"Checking brand: {brand['name']} ({brand['url']})")
 
-    page.goto(brand["url"], wait_until="domcontentloaded")
-    random_delay(1, 2)
+    await page.goto(brand["url"], wait_until="domcontentloaded")
+    await random_delay(1, 2)
 
     # Wait for content
     try:
-        page.wait_for_selector('a[href*="/manuals/"]', timeout=15000)
+        await page.wait_for_selector('a[href*="/manuals/"]', timeout=15000)
     except Exception:
         logger.debug(f"No category links found for {brand['name']}")
         return []
 
     # Find "Show all user manuals" links
-    show_all_links = page.query_selector_all('a[href*="/manuals/"]')
+    # Not deduplicated: a plain link can share a URL with the "Show all" one
+    show_all_links = await read_links(page, 'a[href*="/manuals/"]', dedupe=False)
 
     matching_categories = []
     seen_urls = set()
 
     for link in show_all_links:
-        href = link.get_attribute("href")
-        if not href or href in seen_urls:
+        category_url = link["url"]
+        if category_url in seen_urls:
             continue
 
-        link_text = link.inner_text().strip()
+        link_text = link["text"]
 
         # Check if this is a "Show all" link for a target category
         # The link text is like "Show all user manuals Sony from the TV category"
         if "show all" in link_text.lower():
             # Extract category from link text or URL
             # URL pattern: /manuals/{brand-id}/{category-id}/{brand-slug}/{category-slug}/
-            match = re.search(r'/manuals/\d+/(\d+)/[^/]+/([^/]+)/', href)
+            match = _CATEGORY_URL_RE.search(category_url)
             if match:
                 category_id = match.group(1)
                 category_slug = match.group(2)
                 category_name = category_slug.replace("_", " ").title()
 
                 if matches_target_category(category_name) or matches_target_category(category_slug):
-                    category_url = href if href.startswith("http") else BASE_URL + href
-                    if category_url not in seen_urls:
-                        seen_urls.add(category_url)
-                        matching_categories.append({
-                            "name": category_name,
-                            "url": category_url,
-                            "id": category_id,
-                            "slug": category_slug,
-                            "brand": brand["name"],
-                            "brand_id": brand["id"],
-                        })
-                        logger.info(f"  Found matching category: {category_name}")
+                    seen_urls.add(category_url)
+                    matching_categories.append({
+                        "name": category_name,
+                        "url": category_url,
+                        "id": category_id,
+                        "slug": category_slug,
+                        "brand": brand["name"],
+                        "brand_id": brand["id"],
+                    })
+                    logger.info(f"  Found matching category: {category_name}")
 
     return matching_categories
 
 
-def scrape_category_manuals(page: Page, category: dict) -> list[dict]:
+async def scrape_category_manuals(page: Page, category: dict) -> list[dict]:
     """Scrape all manuals from a category page."""
     logger.info(f"Scraping category: {category['brand']} - {category['name']}")
 
-    page.goto(category["url"], wait_until="domcontentloaded")
-    random_delay(1, 2)
+    await page.goto(category["url"], wait_until="domcontentloaded")
+    await random_delay(1, 2)
 
     # Wait for manual links to appear (JS rendering)
     try:
-        page.wait_for_selector('a[href*="/manual/"]', timeout=30000)
+        await page.wait_for_selector('a[href*="/manual/"]', timeout=30000)
         logger.debug("Manual links appeared")
     except Exception:
         logger.warning(f"Timeout waiting for manual links for {category['name']}")
 
-    # Extra wait for JS to finish rendering
-    time.sleep(2)
+    # Wait for JS to finish rendering: the link count holds steady between polls
+    try:
+        await page.wait_for_function(_LINK_COUNT_STABLE_JS, arg='a[href*="/manual/"]', polling=250, timeout=10000)
+    except Exception:
+        logger.debug("Manual link count still changing, reading what is there")
 
     # Find all manual links - broader selector to catch all patterns
     # Pattern 1: /manual/{id}/... (numeric)
     # Pattern 2: /manual/{category}/{brand}/{model}/
-    manual_links = page.query_selector_all('a[href*="/manual/"]')
+    manual_links = await read_links(page, 'a[href*="/manual/"]')
 
     manuals = []
-    seen_urls = set()
 
     for link in manual_links:
-        href = link.get_attribute("href")
-        if not href or href in seen_urls:
-            continue
+        manual_url = link["url"]
 
         # Skip download links and non-manual pages
-        if "/download/" in href:
+        if "/download/" in manual_url:
             continue
-        if "/manuals/" in href:  # This is a category link, not a manual
+        if "/manuals/" in manual_url:  # This is a category link, not a manual
             continue
 
-        seen_urls.add(href)
-
-        title = link.inner_text().strip()
+        title = link["text"]
         if not title or len(title) < 3:
             continue
 
-        manual_url = href if href.startswith("http") else BASE_URL + href
-
         # Extract manual ID
-        manual_id = extract_manualsbase_id(href)
+        manual_id = extract_manualsbase_id(manual_url)
 
         if manual_id:
             manuals.append({
@@ -312,50 +454,64 @@ def scrape_category_manuals(page: Page, category: dict) -> list[dict]:
 
     # Debug: if no manuals found, log some info
     if len(manuals) == 0:
-        all_links = page.query_selector_all('a[href*="/manual/"]')
-        logger.warning(f"  Debug: Found {len(all_links)} raw /manual/ links on page")
-        for link in all_links[:5]:
-            logger.warning(f"    - {link.get_attribute('href')}")
+        logger.warning(f"  Debug: Found {len(manual_links)} raw /manual/ links on page")
+        for link in manual_links[:5]:
+            logger.warning(f"    - {link['url']}")
 
     return manuals
 
 
-def add_manual_to_database(manual: dict) -> int | None:
-    """Add a manual to the database."""
-    # Extract model from title (usually "Brand Model Document Type")
-    title = manual.get("title", "")
-    brand = manual.get("brand", "Unknown")
+# Document types recognised in titles, as (lowercase needle, label); first match wins
+_DOC_TYPES = tuple((dt.lower(), dt) for dt in [
+    "User manual", "Operating instructions", "User guide", "Installation manual", "Quick start guide",
+])
+
+
+def doc_type_from_title(title: str) -> str:
+    """Guess the document type from a manual title."""
+    title_lower = title.lower()
+    for needle, doc_type in _DOC_TYPES:
+        if needle in title_lower:
+            return doc_type
+    return "User Manual"
+
 
-    # Try to extract doc_type from title
-    doc_type = "User Manual"
-    for dt in ["User manual", "Operating instructions", "User guide", "Installation manual", "Quick start guide"]:
-        if dt.lower() in title.lower():
-            doc_type = dt
-            break
+def add_manuals_to_database(manuals: list[dict]) -> int:
+    """Add scraped manuals to the database in one transaction. Returns count of new rows."""
+    return database.add_manuals_bulk([
+        {
+            # Model is the full title (usually "Brand Model Document Type")
+            "brand": manual.get("brand", "Unknown"),
+            "model": manual.get("title", ""),
+            "manual_url": manual["url"],
+            "source": "manualsbase",
+            "source_id": manual["id"],
+            "category": manual.get("category", ""),
+            "doc_type": doc_type_from_title(manual.get("title", "")),
+        }
+        for manual in manuals
+    ])
 
-    return database.add_manual(
-        brand=brand,
-        model=title,
-        manual_url=manual["url"],
-        source="manualsbase",
-        source_id=manual["id"],
-        category=manual.get("category", ""),
-        doc_type=doc_type,
-    )
 
+# True once a sitekey is exposed, via data-sitekey or the anchor iframe URL
+_SITEKEY_PRESENT_JS = """
+    () => !!document.querySelector('[data-sitekey]')
+        || !!document.querySelector('iframe[src*="recaptcha"][src*="k="]')
+"""
 
-def wait_for_recaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> bool:
+
+async def wait_for_recaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> bool:
     """Wait for reCAPTCHA to be solved (manually or via 2captcha)."""
     global captcha_solver
 
     # Wait for reCAPTCHA iframe to appear
     logger.info("Waiting for reCAPTCHA to load...")
     try:
-        page.wait_for_selector('iframe[src*="recaptcha"]', timeout=15000)
+        await page.wait_for_selector('iframe[src*="recaptcha"]', timeout=15000)
         logger.info("reCAPTCHA iframe detected")
     except Exception:
         # Check if button is already enabled (no captcha needed?)
-        submit_btn = page.query_selector('input.get-manual-btn:not([disabled])')
+        submit_btn = await page.query_selector('input.get-manual-btn:not([disabled])')
         if submit_btn:
             logger.info("No reCAPTCHA found and button already enabled")
             return True
@@ -363,7 +519,7 @@ def wait_for_recaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> boo
         # Continue anyway in case captcha loads later
 
     # Check if there's a reCAPTCHA on the page
-    recaptcha_frame = page.query_selector('iframe[src*="recaptcha"]')
+    recaptcha_frame = await page.query_selector('iframe[src*="recaptcha"]')
     if not recaptcha_frame:
         logger.debug("No reCAPTCHA found on page")
         return True
@@ -373,7 +529,7 @@ def wait_for_recaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> boo
     logger.info("Waiting for reCAPTCHA to fully initialize...")
     try:
         # Wait for the anchor iframe (the one with the checkbox) to have proper dimensions
-        page.wait_for_function("""
+        await page.wait_for_function("""
             () => {
                 const iframe = document.querySelector('iframe[src*="recaptcha/api2/anchor"], iframe[src*="recaptcha/enterprise/anchor"]');
                 if (!iframe) return false;
@@ -385,27 +541,38 @@ def wait_for_recaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> boo
     except Exception:
         logger.warning("Timeout waiting for reCAPTCHA to initialize, proceeding anyway")
 
-    # Extra wait for reCAPTCHA JS to fully load
-    time.sleep(2)
+    # Wait for the reCAPTCHA JS API to load
+    try:
+        await page.wait_for_function(
+            "() => typeof grecaptcha !== 'undefined' && typeof grecaptcha.getResponse === 'function'",
+            timeout=5000,
+        )
+    except Exception:
+        logger.debug("grecaptcha API not detected, continuing")
 
     # Verify the sitekey is available before proceeding
-    sitekey = extract_sitekey_from_page(page)
+    sitekey = await extract_sitekey_from_page_async(page)
     if not sitekey:
         logger.warning("Could not extract sitekey, waiting longer...")
-        time.sleep(3)
-        sitekey = extract_sitekey_from_page(page)
+        try:
+            await page.wait_for_function(_SITEKEY_PRESENT_JS, timeout=5000)
+        except Exception:
+            pass
+        sitekey = await extract_sitekey_from_page_async(page)
 
     # Try automatic solving with 2captcha if available
     if captcha_solver and sitekey:
         logger.info(f"Attempting automatic reCAPTCHA solve with 2captcha (sitekey: {sitekey[:20]}...)")
-        token = captcha_solver.solve_recaptcha(sitekey, page.url)
+        # The solver polls 2captcha with blocking HTTP calls; keep it off the event loop
+        token = await asyncio.to_thread(captcha_solver.solve_recaptcha, sitekey, page.url)
         if token:
             logger.info("Got token from 2captcha, injecting response...")
-            inject_captcha_response(page, token)
+            await inject_captcha_response_async(page, token)
             # Wait for the page to process the token and enable the button
-            time.sleep(3)
-            # Check if button is now enabled
-            submit_btn = page.query_selector('input.get-manual-btn:not([disabled])')
+            try:
+                submit_btn = await page.wait_for_selector('input.get-manual-btn:not([disabled])', timeout=3000)
+            except Exception:
+                submit_btn = None
             if submit_btn:
                 logger.info("Button enabled after 2captcha solve!")
                 return True
@@ -422,80 +589,70 @@ def wait_for_recaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> boo
     print("RECAPTCHA DETECTED - Please solve it in the browser window")
     print("=" * 60 + "\n")
 
-    start_time = time.time()
-
-    while time.time() - start_time < timeout:
-        # Check if captcha is solved (response token present)
-        try:
-            captcha_response = page.evaluate("""
-                () => {
-                    const response = document.querySelector('[name="g-recaptcha-response"]');
-                    return response && response.value.length > 0;
-                }
-            """)
-            if captcha_response:
-                logger.info("reCAPTCHA solved")
-                return True
-        except Exception:
-            pass
-
-        # Also check if the submit button is enabled (indicates captcha solved)
-        # When enabled, the disabled attribute is removed entirely
-        submit_btn = page.query_selector('input.get-manual-btn:not([disabled])')
-        if submit_btn:
-            logger.info("Submit button enabled - reCAPTCHA appears solved")
-            return True
-
-        time.sleep(2)
+    # Solved once the response token is filled in or the submit button is
+    # enabled (the disabled attribute is removed entirely). The textarea value
+    # doesn't fire DOM mutations, so poll in the page rather than on mutation.
+    try:
+        await page.wait_for_function("""
+            () => {
+                const response = document.querySelector('[name="g-recaptcha-response"]');
+                const submitBtn = document.querySelector('input.get-manual-btn:not([disabled])');
+                return (response && response.value.length > 0) || !!submitBtn;
+            }
+        """, polling=500, timeout=timeout * 1000)
+        logger.info("reCAPTCHA solved")
+        return True
+    except Exception:
+        pass
 
     logger.warning("reCAPTCHA timeout")
     return False
 
 
-def download_manual(page: Page, manual: dict, download_dir: Path) -> tuple[str, str, str, int, str] | None:
+async def download_manual(page: Page, manual: dict, download_dir: Path) -> tuple[str, str, str, int, str] | None:
     """Download a single manual from manualsbase."""
     logger.info(f"Downloading: {manual['title'][:60]}...")
 
     # Step 1: Navigate to manual page
-    page.goto(manual["url"], wait_until="domcontentloaded")
-    random_delay(1, 2)
+    await page.goto(manual["url"], wait_until="domcontentloaded")
+    await random_delay(1, 2)
 
     # Wait for page to fully load
     try:
-        page.wait_for_selector('a[href*="/manual/download/"], a.button.red', timeout=15000)
+        await page.wait_for_selector('a[href*="/manual/download/"], a.button.red', timeout=15000)
     except Exception:
         logger.warning("Timeout waiting for download button on manual page")
 
     # Step 2: Find and click the download button to go to download page
     # The button looks like: <a href="/manual/download/..." class="button medium red">
-    download_btn = page.query_selector('a[href*="/manual/download/"].button, a[href*="/manual/download/"]')
+    download_btn = await page.query_selector('a[href*="/manual/download/"].button, a[href*="/manual/download/"]')
 
     if not download_btn:
         logger.warning(f"No download button found for {manual['title']}")
         return None
 
-    download_href = download_btn.get_attribute("href")
+    download_href = await download_btn.get_attribute("href")
     download_page_url = download_href if download_href.startswith("http") else BASE_URL + download_href
 
     logger.info(f"Navigating to download page: {download_page_url}")
-    page.goto(download_page_url, wait_until="domcontentloaded")
-    random_delay(1, 2)
+    await page.goto(download_page_url, wait_until="domcontentloaded")
+    await random_delay(1, 2)
 
     # Step 3: Wait for the download page with reCAPTCHA
     try:
-        page.wait_for_selector('.get-manual-btn, iframe[src*="recaptcha"]', timeout=15000)
+        await page.wait_for_selector('.get-manual-btn, iframe[src*="recaptcha"]', timeout=15000)
     except Exception:
         logger.warning("Timeout waiting for download page elements")
 
     # Step 4: Handle reCAPTCHA
-    if not wait_for_recaptcha_solved(page):
+    if not await wait_for_recaptcha_solved(page):
         logger.warning("Could not solve reCAPTCHA, skipping")
         return None
 
     # Step 5: Wait for submit button to be enabled and click it
     try:
         # Wait for button to become enabled (disabled attribute removed)
-        page.wait_for_selector('input.get-manual-btn:not([disabled])', timeout=30000)
+        await page.wait_for_selector('input.get-manual-btn:not([disabled])', timeout=30000)
         logger.info("Download button enabled")
     except Exception:
         logger.warning("Download button did not become enabled")
@@ -506,18 +663,19 @@ def download_manual(page: Page, manual: dict, download_dir: Path) -> tuple[str,
 
     # Step 6: Click download and capture the file
     logger.info("Clicking download button and waiting for file...")
+    temp_path = None
     try:
-        with page.expect_download(timeout=60000) as download_info:
-            submit_btn = page.query_selector('input.get-manual-btn')
+        async with page.expect_download(timeout=60000) as download_info:
+            submit_btn = await page.query_selector('input.get-manual-btn')
             if submit_btn:
-                submit_btn.click()
+                await submit_btn.click()
                 logger.info("Clicked submit button, waiting for download...")
             else:
                 # Try form submit
-                page.click('input[type="submit"].get-manual-btn')
+                await page.click('input[type="submit"].get-manual-btn')
                 logger.info("Clicked form submit, waiting for download...")
 
-            download = download_info.value
+        download = await download_info.value
 
         logger.info(f"Download captured: {download.suggested_filename}")
 
@@ -526,24 +684,25 @@ def download_manual(page: Page, manual: dict, download_dir: Path) -> tuple[str,
         if not original_filename.lower().endswith('.pdf'):
             original_filename += '.pdf'
 
-        # Save to temp file first
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-            temp_path = Path(tmp.name)
-        download.save_as(temp_path)
-
-        # Compute checksums
-        sha1, md5 = compute_checksums(temp_path)
-        file_size = temp_path.stat().st_size
+        # Hash the file where Playwright already wrote it (off the event loop
+        # so other pages keep going), before copying it anywhere
+        artifact_path = Path(await download.path())
+        sha1, md5 = await asyncio.to_thread(compute_checksums, artifact_path)
+        file_size = artifact_path.stat().st_size
 
         # Move to SHA1-based storage path
         final_path = get_sha1_storage_path(download_dir, sha1)
-        final_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(final_path.parent)
 
         if final_path.exists():
             logger.info(f"File already exists at {final_path} (duplicate content)")
-            temp_path.unlink()
         else:
-            shutil.move(str(temp_path), str(final_path))
+            # Copy out via a temp file inside download_dir, then rename into
+            # place so a partial copy is never visible at the final path
+            with tempfile.NamedTemporaryFile(dir=ensure_dir(download_dir / ".tmp"), suffix='.pdf', delete=False) as tmp:
+                temp_path = Path(tmp.name)
+            await download.save_as(temp_path)
+            os.replace(temp_path, final_path)
 
         logger.info(f"Downloaded: {final_path} ({file_size} bytes, SHA1: {sha1[:8]}...)")
         logger.info(f"Original filename: {original_filename}")
@@ -551,24 +710,89 @@ def download_manual(page: Page, manual: dict, download_dir: Path) -> tuple[str,
 
     except Exception as e:
         logger.error(f"Download failed: {e}")
+        if temp_path:
+            temp_path.unlink(missing_ok=True)
         return None
 
 
-def scrape_manualsbase(
-    page: Page,
+async def download_pending(pool: PagePool, download_dir: Path, concurrency: int = 1):
+    """Download all pending manualsbase manuals, up to `concurrency` at a time."""
+    pending = database.get_undownloaded_manuals(source="manualsbase")
+    logger.info(f"Found {len(pending)} manuals to download")
+
+    # Check archive.org for every pending manual up front, skipping ones
+    # recently confirmed as not archived (by a previous run or archive_checker)
+    to_check = [m for m in pending if m.get("source_id") and not archive_check_is_fresh(m)]
+    logger.info(f"Checking archive.org for {len(to_check)} manuals ({len(pending) - len(to_check)} checked recently or without ID)...")
+    archived_ids, failed_ids = await batch_check_archive_org([m["source_id"] for m in to_check])
+    logger.info(f"{len(archived_ids)} already archived on archive.org")
+    if failed_ids:
+        logger.warning(f"Could not check {len(failed_ids)} manuals against archive.org, will check again next time")
+    # Only confirmed misses are remembered; failed checks are retried next run
+    database.update_archive_checked_many([
+        m["id"] for m in to_check
+        if m["source_id"] not in archived_ids and m["source_id"] not in failed_ids
+    ])
+
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def download_one(manual_record: dict):
+        try:
+            source_id = manual_record.get("source_id")
+
+            # Skip if already archived on archive.org
+            if source_id in archived_ids:
+                archive_url = f"{ARCHIVE_ORG_BASE}{source_id}"
+                logger.info(f"Already archived: {archive_url}")
+                database.update_archive_checked(manual_record["id"], True, archive_url)
+                return
+
+            async with slots, pool.page() as page:
+                result = await download_manual(
+                    page,
+                    {
+                        "title": manual_record["model"],
+                        "url": manual_record["manual_url"],
+                        "id": source_id,
+                        "brand": manual_record["brand"],
+                    },
+                    download_dir
+                )
+                if result:
+                    file_path, sha1, md5, file_size, original_filename = result
+                    database.update_downloaded(
+                        manual_record["id"], file_path, sha1, md5, file_size, original_filename
+                    )
+                await random_delay()
+        except Exception as e:
+            logger.error(f"Error downloading {manual_record['model']}: {e}")
+
+    await asyncio.gather(*(download_one(manual_record) for manual_record in pending))
+
+
+async def scrape_manualsbase(
+    pool: PagePool,
     download_dir: Path,
     download: bool = True,
     limit_brands: int = None,
     specific_brands: list[str] = None,
+    download_concurrency: int = 1,
+    refresh_brands: bool = False,
 ):
-    """Main scraping function for manualsbase."""
+    """Main scraping function for manualsbase.
+
+    Brand and category pages are fetched concurrently, one per page in the
+    pool; downloads run up to `download_concurrency` at a time.
+    """
+    # Only links are read while indexing, so skip images, fonts and CSS
+    await set_resource_blocking_async(pool.context, True)
 
     # Step 1: Get all brands
     if specific_brands:
         # Use specific brands instead of scraping all
         brands = []
         for brand_url in specific_brands:
-            match = re.search(r'/brand/details/(\d+)/([^/]+)/', brand_url)
+            match = _BRAND_DETAILS_RE.search(brand_url)
             if match:
                 brands.append({
                     "name": match.group(2).replace("-", " ").title(),
@@ -577,76 +801,118 @@ def scrape_manualsbase(
                     "slug": match.group(2),
                 })
     else:
-        brands = scrape_all_brands(page)
+        brands = None if refresh_brands else database.get_cached_brands("manualsbase", BRAND_CACHE_DAYS)
+        if brands:
+            logger.info(f"Using {len(brands)} cached brands (use --refresh-brands to re-scrape)")
+        else:
+            async with pool.page() as page:
+                brands = await scrape_all_brands(page)
+            if brands:
+                database.save_cached_brands("manualsbase", brands)
 
     if limit_brands:
         brands = brands[:limit_brands]
         logger.info(f"Limited to {limit_brands} brands")
 
     # Step 2: For each brand, find TV-related categories
-    all_categories = []
-    for brand in brands:
-        categories = scrape_brand_categories(page, brand)
-        all_categories.extend(categories)
-        random_delay()
+    # One failing page is logged and skipped rather than ending the crawl
+    async def brand_categories(brand: dict) -> list[dict]:
+        try:
+            async with pool.page() as page:
+                categories = await scrape_brand_categories(page, brand)
+                await random_delay()
+                return categories
+        except Exception as e:
+            logger.error(f"Error checking brand {brand['name']}: {e}")
+            return []
+
+    results = await asyncio.gather(*(brand_categories(brand) for brand in brands))
+    all_categories = [category for categories in results for category in categories]
 
     logger.info(f"Found {len(all_categories)} matching categories across all brands")
 
     # Step 3: For each category, scrape all manuals
-    total_manuals = 0
-    for category in all_categories:
-        manuals = scrape_category_manuals(page, category)
+    async def category_manuals(category: dict) -> int:
+        try:
+            async with pool.page() as page:
+                manuals = await scrape_category_manuals(page, category)
+
+                # Add to database
+                added = add_manuals_to_database(manuals)
 
-        # Add to database
-        for manual in manuals:
-            manual_id = add_manual_to_database(manual)
-            if manual_id:
-                total_manuals += 1
+                await random_delay()
+                return added
+        except Exception as e:
+            logger.error(f"Error scraping category {category['brand']} - {category['name']}: {e}")
+            return 0
 
-        random_delay()
+    total_manuals = sum(await asyncio.gather(*(category_manuals(category) for category in all_categories)))
 
     logger.info(f"Added {total_manuals} manuals to database")
 
+    # Download pages need full rendering for the reCAPTCHA widget
+    await set_resource_blocking_async(pool.context, False)
+
     if not download:
         logger.info("Scraping complete. Skipping downloads.")
         return
 
     # Step 4: Download pending manuals
-    pending = database.get_undownloaded_manuals(source="manualsbase")
-    logger.info(f"Found {len(pending)} manuals to download")
+    await download_pending(pool, download_dir, concurrency=download_concurrency)
 
-    for manual_record in pending:
-        try:
-            source_id = manual_record.get("source_id")
 
-            # Check if already archived on archive.org
-            if source_id:
-                logger.info(f"Checking archive.org for {manual_record['model']} (ID: {source_id})...")
-                is_archived, archive_url = check_archive_org(source_id)
-                if is_archived:
-                    logger.info(f"Already archived: {archive_url}")
-                    database.update_archived(manual_record["id"], archive_url)
-                    continue
-
-            result = download_manual(
-                page,
-                {
-                    "title": manual_record["model"],
-                    "url": manual_record["manual_url"],
-                    "id": source_id,
-                    "brand": manual_record["brand"],
-                },
-                download_dir
-            )
-            if result:
-                file_path, sha1, md5, file_size, original_filename = result
-                database.update_downloaded(
-                    manual_record["id"], file_path, sha1, md5, file_size, original_filename
+async def run_browser(args, config: dict, download_dir: Path):
+    """Launch the browser and run the requested scrape/download mode."""
+    # Get browser settings from config (with namespace override support)
+    browser_type = get_config(config, "browser", "chromium")
+    headless = get_config(config, "headless", False)
+    use_stealth = get_config(config, "stealth", False)
+    use_proxy = get_config(config, "use_proxy", False)
+    concurrency = get_config(config, "concurrency", 5)
+    # Parallel downloads only make sense when captchas are solved by 2captcha
+    download_concurrency = get_config(config, "download_concurrency", 3 if captcha_solver else 1)
+
+    async with async_playwright() as p:
+        context, extension_loaded = await launch_browser_with_extension_async(
+            p,
+            extension_path=SETTINGS.extension_path,
+            headless=headless,
+            browser=browser_type,
+            use_proxy=use_proxy,
+        )
+
+        async def setup_page(page: Page):
+            if use_stealth:
+                await apply_stealth_async(page)
+            if not extension_loaded:
+                await setup_bandwidth_saving_async(page)
+
+        pool_size = download_concurrency if args.download_only else max(concurrency, download_concurrency)
+        pool = PagePool(
+            context,
+            size=pool_size,
+            setup=setup_page,
+            max_uses=get_config(config, "page_max_uses", 50),
+            max_age=get_config(config, "page_max_age", 1800),
+        )
+        await pool.start()
+
+        try:
+            if args.download_only:
+                # Only download pending manuals
+                await download_pending(pool, download_dir, concurrency=download_concurrency)
+            else:
+                await scrape_manualsbase(
+                    pool,
+                    download_dir,
+                    download=not args.index_only,
+                    limit_brands=args.limit_brands,
+                    specific_brands=args.brands,
+                    download_concurrency=download_concurrency,
+                    refresh_brands=args.refresh_brands,
                 )
-            random_delay()
-        except Exception as e:
-            logger.error(f"Error downloading {manual_record['model']}: {e}")
-            continue
+        finally:
+            await context.close()
 
 
 def main():
@@ -655,18 +921,17 @@ def main():
     parser.add_argument("--download-only", action="store_true", help="Only download pending manuals")
     parser.add_argument("--limit-brands", type=int, help="Limit number of brands to process")
     parser.add_argument("--brands", nargs="*", help="Specific brand URLs to scrape")
+    parser.add_argument("--refresh-brands", action="store_true", help="Re-scrape the brand index even if cached")
     parser.add_argument("--clear", action="store_true", help="Clear all manualsbase records from database")
     args = parser.parse_args()
 
     config = load_config()
-    download_dir = Path(config.get("download_dir", "./downloads")).resolve()
-    download_dir.mkdir(parents=True, exist_ok=True)
 
-    # Set delay values from config
-    global DELAY_MIN, DELAY_MAX
-    DELAY_MIN = config.get("delay_min", 2.0)
-    DELAY_MAX = config.get("delay_max", 5.0)
-    logger.info(f"Request delays: {DELAY_MIN}-{DELAY_MAX} seconds")
+    global SETTINGS
+    SETTINGS = Settings.from_config(config)
+    download_dir = SETTINGS.download_dir
+    download_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Request delays: {SETTINGS.delay_min}-{SETTINGS.delay_max} seconds")
 
     database.init_db()
 
@@ -688,83 +953,7 @@ def main():
         database.clear_manuals_by_source("manualsbase")
         logger.info("ManualsBase records cleared.")
 
-    # Get browser settings from config (with namespace override support)
-    browser_type = get_config(config, "browser", "chromium")
-    headless = get_config(config, "headless", False)
-    use_stealth = get_config(config, "stealth", False)
-    use_proxy = get_config(config, "use_proxy", False)
-
-    # Get extension path
-    project_dir = Path(__file__).parent
-    extension_path = get_extension_path(config, project_dir)
-
-    with sync_playwright() as p:
-        context, extension_loaded = launch_browser_with_extension(
-            p,
-            extension_path=extension_path,
-            headless=headless,
-            browser=browser_type,
-            use_proxy=use_proxy,
-        )
-
-        if context.pages:
-            page = context.pages[0]
-        else:
-            page = context.new_page()
-
-        if use_stealth:
-            apply_stealth(page)
-
-        if not extension_loaded:
-            setup_bandwidth_saving(page)
-
-        try:
-            if args.download_only:
-                # Only download pending manuals
-                pending = database.get_undownloaded_manuals(source="manualsbase")
-                logger.info(f"Found {len(pending)} pending manualsbase downloads")
-
-                for manual_record in pending:
-                    try:
-                        source_id = manual_record.get("source_id")
-
-                        # Check if already archived on archive.org
-                        if source_id:
-                            logger.info(f"Checking archive.org for {manual_record['model']} (ID: {source_id})...")
-                            is_archived, archive_url = check_archive_org(source_id)
-                            if is_archived:
-                                logger.info(f"Already archived: {archive_url}")
-                                database.update_archived(manual_record["id"], archive_url)
-                                continue
-
-                        result = download_manual(
-                            page,
-                            {
-                                "title": manual_record["model"],
-                                "url": manual_record["manual_url"],
-                                "id": source_id,
-                                "brand": manual_record["brand"],
-                            },
-                            download_dir
-                        )
-                        if result:
-                            file_path, sha1, md5, file_size, original_filename = result
-                            database.update_downloaded(
-                                manual_record["id"], file_path, sha1, md5, file_size, original_filename
-                            )
-                        random_delay()
-                    except Exception as e:
-                        logger.error(f"Error downloading {manual_record['model']}: {e}")
-            else:
-                scrape_manualsbase(
-                    page,
-                    download_dir,
-                    download=not args.index_only,
-                    limit_brands=args.limit_brands,
-                    specific_brands=args.brands,
-                )
-        finally:
-            context.close()
+    asyncio.run(run_browser(args, config, download_dir))
 
     stats = database.get_stats(source="manualsbase")
     logger.info(f"ManualsBase scraping complete. Total: {stats['total']}, Downloaded: {stats['downloaded']}, Pending: {stats['pending']}")
@@ -1,29 +1,47 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import argparse
+import asyncio
+import email.message
+import functools
 import hashlib
 import logging
+import mmap
 import os
 import random
 import re
 import shutil
+import socket
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+import requests
 import yaml
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright, Page
-
-from pdf_utils import strip_manualslib_watermark
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables from .env file
 load_dotenv()
 
 import database
-from browser_helper import launch_browser_with_extension, get_extension_path, setup_route_ad_blocking, apply_stealth, setup_bandwidth_saving
-from captcha_solver import TwoCaptchaSolver, extract_sitekey_from_page, inject_captcha_response
+from captcha_solver import TwoCaptchaSolver, extract_sitekey_from_page_async, inject_captcha_response_async
+
+# Playwright (via browser_helper) and pikepdf (via pdf_utils) are imported
+# where they are used, so runs that never start a browser or strip a PDF
+# (--clear, --upload-to-ia, ...) don't pay for loading them
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+    from browser_helper import PagePool
 
 logging.basicConfig(
     level=logging.INFO,
@@ -48,38 +66,158 @@ class DownloadLimitReached(Exception):
 
 
 ARCHIVE_ORG_BASE = "https://archive.org/details/manualslib-id-"
+ARCHIVE_METADATA_BASE = "https://archive.org/metadata/manualslib-id-"
+ARCHIVE_SEARCH_URL = "https://archive.org/advancedsearch.php"
 CAPTCHA_TIMEOUT = 300  # 5 minutes to solve captcha
 
+# URL patterns, compiled once since they run for every link on a page
+_MANUAL_ID_RE = re.compile(r'/manual/(\d+)/')
+_MODEL_ID_RE = re.compile(r'-(\d+)\.html')
+_BRAND_SLUG_RE = re.compile(r'/brand/([^/]+)/?')
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 def extract_manualslib_id(url: str) -> str | None:
     """Extract the numeric ID from a manualslib URL like /manual/331384/..."""
-    match = re.search(r'/manual/(\d+)/', url)
+    match = _MANUAL_ID_RE.search(url)
     return match.group(1) if match else None
 
 
 def extract_model_id(url: str) -> str | None:
     """Extract the model ID from a product URL like /products/Rca-35v432t-328381.html"""
-    match = re.search(r'-(\d+)\.html', url)
+    match = _MODEL_ID_RE.search(url)
     return match.group(1) if match else None
 
 
-def check_archive_org(manualslib_id: str) -> tuple[bool, str]:
-    """Check if a manual exists on archive.org. Returns (exists, archive_url)."""
+ARCHIVE_CHECK_CONCURRENCY = 16
+# manualslib IDs looked up per archive.org search query
+ARCHIVE_SEARCH_BATCH_SIZE = 100
+# Pending manuals claimed from the database and archive-checked per round
+PENDING_BATCH_SIZE = 50
+# A claim older than this is considered abandoned and can be taken over
+CLAIM_LEASE_SECONDS = 3600
+# Identifies this process's claims when several scrapers share the database
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+# How long a "not archived" result is trusted (same window as archive_checker)
+ARCHIVE_CHECK_TTL = timedelta(days=7)
+
+# Keep-alive session for archive.org checks and PDF downloads, so only the
+# first request to each host pays for the TCP+TLS handshake. Sessions are
+# safe to share between threads for plain GET requests like these.
+http_session = requests.Session()
+http_session.headers["User-Agent"] = "Mozilla/5.0 (compatible; ManualsLibScraper/1.0)"
+http_session.mount("https://", HTTPAdapter(
+    # One pool per host: archive.org plus the PDF CDN hosts, so switching
+    # between them doesn't evict (and close) the other host's connections
+    pool_connections=10,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+))
+
+
+def check_archive_org(manualslib_id: str) -> tuple[bool | None, str]:
+    """Check if a manual exists on archive.org. Returns (exists, archive_url).
+
+    Uses the metadata API rather than the details page: it answers with a
+    small (gzipped) JSON document, and an empty object for unknown items.
+    `exists` is None if the check itself failed (timeout, HTTP error).
+    """
     archive_url = f"{ARCHIVE_ORG_BASE}{manualslib_id}"
     try:
-        req = urllib.request.Request(archive_url, method='HEAD')
-        req.add_header('User-Agent', 'Mozilla/5.0 (compatible; ManualsLibScraper/1.0)')
-        with urllib.request.urlopen(req, timeout=10) as response:
-            # 200 means it exists
-            return True, archive_url
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            return False, archive_url
-        logger.warning(f"HTTP error checking archive.org: {e.code}")
-        return False, archive_url
+        response = http_session.get(f"{ARCHIVE_METADATA_BASE}{manualslib_id}", timeout=10)
+        if response.status_code != 200:
+            logger.warning(f"HTTP error checking archive.org: {response.status_code}")
+            return None, archive_url
+        return bool(response.json()), archive_url
     except Exception as e:
         logger.warning(f"Error checking archive.org: {e}")
-        return False, archive_url
+        return None, archive_url
+
+
+def archive_check_is_fresh(manual_record: dict) -> bool:
+    """True if the manual was checked against archive.org within ARCHIVE_CHECK_TTL."""
+    checked_at = manual_record.get("archive_checked_at")
+    if not checked_at:
+        return False
+    try:
+        return datetime.now() - datetime.fromisoformat(checked_at) < ARCHIVE_CHECK_TTL
+    except ValueError:
+        return False
+
+
+def search_archive_org(manualslib_ids: list[str]) -> set[str] | None:
+    """Look up a batch of manualslib IDs with one archive.org search query.
+
+    Returns the set of IDs that exist on archive.org, or None if the search
+    failed (so the caller can fall back to checking them one by one).
+    """
+    identifiers = {f"manualslib-id-{manualslib_id}": manualslib_id for manualslib_id in manualslib_ids}
+    query = " OR ".join(f"identifier:{identifier}" for identifier in identifiers)
+    try:
+        response = http_session.get(ARCHIVE_SEARCH_URL, params={
+            "q": query,
+            "fl[]": "identifier",
+            "rows": len(identifiers),
+            "output": "json",
+        }, timeout=30)
+        response.raise_for_status()
+        docs = response.json()["response"]["docs"]
+    except Exception as e:
+        logger.warning(f"Error searching archive.org: {e}")
+        return None
+    return {identifiers[doc["identifier"]] for doc in docs if doc.get("identifier") in identifiers}
+
+
+def check_archive_org_batch(manualslib_ids: list[str]) -> tuple[list[str], list[str]]:
+    """Check a batch of IDs against archive.org. Returns (found, failed).
+
+    Uses one search query for the whole batch, falling back to the metadata
+    API per ID if the search fails. `failed` holds the IDs that couldn't be
+    checked at all, which are neither found nor known to be missing.
+    """
+    found = search_archive_org(manualslib_ids)
+    if found is not None:
+        return [manualslib_id for manualslib_id in manualslib_ids if manualslib_id in found], []
+    found, failed = [], []
+    for manualslib_id in manualslib_ids:
+        exists, _ = check_archive_org(manualslib_id)
+        if exists is None:
+            failed.append(manualslib_id)
+        elif exists:
+            found.append(manualslib_id)
+    return found, failed
+
+
+async def check_archive_org_many(manualslib_ids: list[str]) -> tuple[dict[str, str], set[str]]:
+    """Check many manualslib IDs against archive.org.
+
+    IDs are looked up ARCHIVE_SEARCH_BATCH_SIZE at a time with
+    check_archive_org_batch(), batches running concurrently on a pool of
+    ARCHIVE_CHECK_CONCURRENCY threads sharing http_session. Returns
+    ({manualslib_id: archive_url} for the IDs that already exist, the set
+    of IDs whose check failed).
+    """
+    manualslib_ids = list(dict.fromkeys(manualslib_ids))
+    if not manualslib_ids:
+        return {}, set()
+
+    batches = [
+        manualslib_ids[i:i + ARCHIVE_SEARCH_BATCH_SIZE]
+        for i in range(0, len(manualslib_ids), ARCHIVE_SEARCH_BATCH_SIZE)
+    ]
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=ARCHIVE_CHECK_CONCURRENCY) as executor:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, check_archive_org_batch, batch)
+            for batch in batches
+        ))
+    archived = {
+        manualslib_id: f"{ARCHIVE_ORG_BASE}{manualslib_id}"
+        for found, _ in results
+        for manualslib_id in found
+    }
+    failed = {manualslib_id for _, failed in results for manualslib_id in failed}
+    return archived, failed
 
 
 def load_config() -> dict:
@@ -100,10 +238,52 @@ def get_config(config: dict, key: str, default=None, namespace: str = "manualsli
     return config.get(key, default)
 
 
-# Global settings (updated from config in main())
-DELAY_MIN = 2.0
-DELAY_MAX = 5.0
-STRIP_WATERMARKS = True
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Config-derived values, resolved once in main()."""
+
+    delay_min: float = 2.0
+    delay_max: float = 5.0
+    strip_watermarks: bool = True
+    download_dir: Path = Path("./downloads")
+    browser: str = "chromium"
+    headless: bool = False
+    stealth: bool = False
+    use_proxy: bool = False
+    # Resolved in main() only when the browser is going to run
+    extension_path: Path | None = None
+    brands: tuple[str, ...] = ()
+    categories: tuple[str, ...] = ("tv",)
+    # None means "pick based on whether 2captcha is configured"
+    download_concurrency: int | None = None
+    # Brands listed in parallel by --index-only runs
+    concurrency: int = 3
+    page_max_uses: int = 50
+    page_max_age: int = 1800
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Settings":
+        return cls(
+            delay_min=config.get("delay_min", 2.0),
+            delay_max=config.get("delay_max", 5.0),
+            strip_watermarks=config.get("strip_watermarks", True),
+            download_dir=Path(config.get("download_dir", "./downloads")).resolve(),
+            browser=get_config(config, "browser", "chromium"),
+            headless=get_config(config, "headless", False),
+            stealth=get_config(config, "stealth", False),
+            use_proxy=get_config(config, "use_proxy", False),
+            brands=tuple(get_config(config, "brands", [])),
+            categories=tuple(get_config(config, "categories", ["tv"])),
+            download_concurrency=get_config(config, "download_concurrency"),
+            concurrency=get_config(config, "concurrency", 3),
+            page_max_uses=get_config(config, "page_max_uses", 50),
+            page_max_age=get_config(config, "page_max_age", 1800),
+        )
+
+
+# Replaced with the values from config.yaml in main()
+SETTINGS = Settings()
+
 DOWNLOAD_LIMIT = None
 DOWNLOAD_COUNT = 0
 
@@ -123,16 +303,27 @@ def increment_download_count():
         logger.info(f"Downloaded {DOWNLOAD_COUNT}/{DOWNLOAD_LIMIT}")
 
 
-def random_delay(min_sec: float = None, max_sec: float = None):
-    """Sleep for a random delay. Uses global DELAY_MIN/MAX if not specified."""
-    min_sec = min_sec if min_sec is not None else DELAY_MIN
-    max_sec = max_sec if max_sec is not None else DELAY_MAX
+async def random_delay(min_sec: float = None, max_sec: float = None):
+    """Sleep for a random delay. Uses the configured delay range if not specified."""
+    min_sec = min_sec if min_sec is not None else SETTINGS.delay_min
+    max_sec = max_sec if max_sec is not None else SETTINGS.delay_max
     delay = random.uniform(min_sec, max_sec)
-    time.sleep(delay)
+    await asyncio.sleep(delay)
 
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]', '_', name)
+    return _SANITIZE_RE.sub('_', name)
+
+
+@functools.cache
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per run.
+
+    Downloads keep landing in the same staging dir and storage shards, so
+    later calls skip the mkdir syscalls.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def get_sha1_storage_path(download_dir: Path, sha1: str, extension: str = ".pdf") -> Path:
@@ -154,22 +345,33 @@ def get_sha1_storage_path(download_dir: Path, sha1: str, extension: str = ".pdf"
     return download_dir / dir1 / dir2 / filename
 
 
+# Read size when streaming downloads; large enough that the loop is a
+# handful of syscalls per PDF and each update() releases the GIL
+HASH_CHUNK_SIZE = 1 << 20
+
+
 def compute_checksums(file_path: Path) -> tuple[str, str]:
-    """Compute SHA1 and MD5 checksums for a file. Returns (sha1, md5)."""
-    sha1 = hashlib.sha1()
-    md5 = hashlib.md5()
+    """Compute SHA1 and MD5 checksums for a file. Returns (sha1, md5).
 
+    SHA1 names the file in storage; MD5 is kept because the database and the
+    Internet Archive upload (Content-MD5) rely on it. The file is mapped and
+    each digest is fed the whole mapping in one C-level call.
+    """
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            sha1.update(chunk)
-            md5.update(chunk)
-
-    return sha1.hexdigest(), md5.hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # Empty files can't be mapped
+            return hashlib.sha1().hexdigest(), hashlib.md5().hexdigest()
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            # Both passes read front to back, so let the kernel read ahead
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha1(mm).hexdigest(), hashlib.md5(mm).hexdigest()
 
 
 def extract_slug_from_url(url: str) -> str | None:
     """Extract brand slug from URL like /brand/hitachi/ or /brand/hitachi/tv.html"""
-    match = re.search(r'/brand/([^/]+)/?', url)
+    match = _BRAND_SLUG_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -193,7 +395,48 @@ def is_tv_category(cat_name: str) -> bool:
     return False
 
 
-def discover_brands(page: Page) -> tuple[list[dict], set[str]]:
+# Brand index page as {rows: [{name, href, categories: [{name, href}]}], next},
+# read in one evaluate() call instead of a CDP round-trip per element.
+# `next` is the href of the following pagination page, or null on the last.
+# Pagination structure: <ul class="pagination"><li class="active">...</li><li><a class="plink" href="...">2</a></li></ul>
+_BRAND_PAGE_JS = """
+    () => ({
+        rows: Array.from(document.querySelectorAll('div.row.tabled'), row => {
+            const link = row.querySelector('div.col1 a, div.col-xs-3 a');
+            return link && {
+                name: link.innerText.trim(),
+                href: link.getAttribute('href'),
+                categories: Array.from(row.querySelectorAll('div.catel a, div.col-xs-9 a'), a => ({
+                    name: a.innerText.trim(),
+                    href: a.getAttribute('href'),
+                })),
+            };
+        }).filter(Boolean),
+        next: document.querySelector('ul.pagination li.active + li a.plink')?.getAttribute('href') || null,
+    })
+"""
+
+# Category listing page as {rows: [{name, href, manuals: [{href, text, title}]}], next}
+_LISTING_PAGE_JS = """
+    () => ({
+        rows: Array.from(document.querySelectorAll('div.row.tabled'), row => {
+            const link = row.querySelector('div.mname a');
+            return link && {
+                name: link.innerText.trim(),
+                href: link.getAttribute('href'),
+                manuals: Array.from(row.querySelectorAll('div.mlinks a[href*="/manual/"]'), a => ({
+                    href: a.getAttribute('href'),
+                    text: a.innerText.trim(),
+                    title: a.getAttribute('title') || '',
+                })),
+            };
+        }).filter(Boolean),
+        next: document.querySelector('ul.pagination li.active + li a.plink')?.getAttribute('href') || null,
+    })
+"""
+
+
+async def discover_brands(page: Page) -> tuple[list[dict], set[str]]:
     """Discover all brands that have TV in their categories.
 
     Returns:
@@ -209,17 +452,14 @@ def discover_brands(page: Page) -> tuple[list[dict], set[str]]:
 
     # First, get all the letter/number index links
     logger.info("Discovering brands with TV category...")
-    page.goto(f"{BASE_URL}/brand/", wait_until="domcontentloaded")
-    random_delay(1, 2)
+    await page.goto(f"{BASE_URL}/brand/", wait_until="domcontentloaded")
+    await random_delay(1, 2)
 
     # Find all index links in the bmap div
-    index_links = page.query_selector_all('div.bmap a')
-    index_urls = []
-    for link in index_links:
-        href = link.get_attribute("href")
-        if href:
-            url = href if href.startswith("http") else BASE_URL + href
-            index_urls.append(url)
+    index_hrefs = await page.eval_on_selector_all(
+        'div.bmap a', "links => links.map(a => a.getAttribute('href')).filter(Boolean)"
+    )
+    index_urls = [href if href.startswith("http") else BASE_URL + href for href in index_hrefs]
 
     logger.info(f"Found {len(index_urls)} index pages to scan")
 
@@ -230,35 +470,34 @@ def discover_brands(page: Page) -> tuple[list[dict], set[str]]:
 
         while current_url:
             logger.info(f"Scanning: {current_url} (page {page_num})")
-            page.goto(current_url, wait_until="domcontentloaded")
-            random_delay(1, 2)
+            await page.goto(current_url, wait_until="domcontentloaded")
+            await random_delay(1, 2)
 
             # Find all brand rows
-            brand_rows = page.query_selector_all('div.row.tabled')
-
-            for row in brand_rows:
-                # Get brand info from col1
-                brand_link = row.query_selector('div.col1 a, div.col-xs-3 a')
-                if not brand_link:
+            index_page = await page.evaluate(_BRAND_PAGE_JS)
+            page_brands = []
+
+            for row in index_page["rows"]:
+                # Brand info from col1
+                brand_name = row["name"]
+                brand_href = row["href"]
+                if not brand_href:
                     continue
 
-                brand_name = brand_link.inner_text().strip()
-                brand_href = brand_link.get_attribute("href")
                 brand_url = brand_href if brand_href.startswith("http") else BASE_URL + brand_href
                 slug = extract_slug_from_url(brand_url)
 
                 if not slug or slug in seen_slugs:
                     continue
 
-                # Get categories from catel div
-                category_links = row.query_selector_all('div.catel a, div.col-xs-9 a')
+                # Categories from catel div
                 all_categories = []
                 tv_categories = []
                 tv_category_urls = []
 
-                for cat_link in category_links:
-                    cat_name = cat_link.inner_text().strip()
-                    cat_href = cat_link.get_attribute("href")
+                for cat_link in row["categories"]:
+                    cat_name = cat_link["name"]
+                    cat_href = cat_link["href"]
                     cat_url = cat_href if cat_href and cat_href.startswith("http") else BASE_URL + (cat_href or "")
 
                     all_categories.append(cat_name)
@@ -282,32 +521,21 @@ def discover_brands(page: Page) -> tuple[list[dict], set[str]]:
                         "tv_category_urls": ", ".join(tv_category_urls),
                         "all_categories": ", ".join(all_categories),
                     }
-                    brands.append(brand_info)
-
-                    # Add to database immediately so progress is visible
-                    brand_id = database.add_brand(
-                        name=brand_info["name"],
-                        slug=brand_info["slug"],
-                        brand_url=brand_info["brand_url"],
-                        tv_categories=brand_info["tv_categories"],
-                        tv_category_urls=brand_info["tv_category_urls"],
-                        all_categories=brand_info["all_categories"],
-                    )
-                    if brand_id:
-                        logger.info(f"Added TV brand: {brand_name} ({slug}) - Categories: {', '.join(tv_categories)}")
-                    else:
-                        logger.info(f"Found TV brand (already in DB): {brand_name} ({slug})")
-
-            # Check for next page in pagination
-            next_page_link = page.query_selector('ul.pagination li.active + li a.plink')
-            if next_page_link:
-                next_href = next_page_link.get_attribute("href")
-                if next_href:
-                    current_url = next_href if next_href.startswith("http") else BASE_URL + next_href
-                    page_num += 1
-                    random_delay(1, 2)
-                else:
-                    current_url = None
+                    page_brands.append(brand_info)
+                    logger.info(f"Found TV brand: {brand_name} ({slug}) - Categories: {', '.join(tv_categories)}")
+
+            # Add this page's brands to the database so progress is visible
+            if page_brands:
+                added = database.add_brands_bulk(page_brands)
+                brands.extend(page_brands)
+                logger.info(f"Added {added} new TV brands ({len(page_brands) - added} already in DB)")
+
+            # Next page in pagination, read along with the rows
+            next_href = index_page["next"]
+            if next_href:
+                current_url = next_href if next_href.startswith("http") else BASE_URL + next_href
+                page_num += 1
+                await random_delay(1, 2)
             else:
                 current_url = None
 
@@ -315,7 +543,7 @@ def discover_brands(page: Page) -> tuple[list[dict], set[str]]:
     return brands, all_tv_related_categories
 
 
-def scrape_category_listing(page: Page, brand: str, category_url: str, category_name: str = None) -> int:
+async def scrape_category_listing(page: Page, brand: str, category_url: str, category_name: str = None) -> int:
     """Scrape all manual links from a brand's category listing pages.
 
     Args:
@@ -349,11 +577,13 @@ def scrape_category_listing(page: Page, brand: str, category_url: str, category_
 
     while current_url:
         logger.info(f"Scraping {brand} [{cat_display}] page {page_num}: {current_url}")
-        page.goto(current_url, wait_until="domcontentloaded")
-        random_delay(1, 2)
+        await page.goto(current_url, wait_until="domcontentloaded")
+        await random_delay(1, 2)
 
         # Find all model rows
-        model_rows = page.query_selector_all('div.row.tabled')
+        listing_page = await page.evaluate(_LISTING_PAGE_JS)
+        model_rows = listing_page["rows"]
+        page_manuals = []
 
         if not model_rows:
             logger.info(f"No more models found for {brand} [{cat_display}] on page {page_num}")
@@ -361,21 +591,18 @@ def scrape_category_listing(page: Page, brand: str, category_url: str, category_
             continue
 
         for row in model_rows:
-            # Get model info from the mname column
-            model_link_elem = row.query_selector('div.mname a')
-            if not model_link_elem:
+            # Model info from the mname column
+            model_name = row["name"]
+            model_href = row["href"]
+            if not model_href:
                 continue
 
-            model_name = model_link_elem.inner_text().strip()
-            model_href = model_link_elem.get_attribute("href")
             model_url = model_href if model_href.startswith("http") else BASE_URL + model_href
             model_id = extract_model_id(model_url)
 
-            # Find all manual links in the mlinks column
-            manual_links = row.query_selector_all('div.mlinks a[href*="/manual/"]')
-
-            for link in manual_links:
-                href = link.get_attribute("href")
+            # All manual links in the mlinks column
+            for link in row["manuals"]:
+                href = link["href"]
                 if not href:
                     continue
 
@@ -387,40 +614,39 @@ def scrape_category_listing(page: Page, brand: str, category_url: str, category_
                 seen_urls.add(manual_url)
 
                 # Document type is the link text
-                doc_type = link.inner_text().strip()
+                doc_type = link["text"]
 
                 # Document description is in the title attribute
-                doc_description = link.get_attribute("title") or ""
+                doc_description = link["title"]
 
                 # Extract manualslib ID from the manual URL
                 manualslib_id = extract_manualslib_id(manual_url)
 
-                # Add to database immediately for real-time progress
-                manual_id = database.add_manual(
-                    brand=brand,
-                    model=model_name,
-                    model_url=model_url,
-                    model_id=model_id,
-                    doc_type=doc_type,
-                    doc_description=doc_description,
-                    manual_url=manual_url,
-                    manualslib_id=manualslib_id,
-                )
-                if manual_id:
-                    logger.info(f"Added: {model_name} - {doc_type}")
-                manual_count += 1
-
-        # Check for next page
-        # Pagination structure: <ul class="pagination"><li class="active">...</li><li><a class="plink" href="...">2</a></li></ul>
-        next_page_link = page.query_selector('ul.pagination li.active + li a.plink')
-        if next_page_link:
-            next_href = next_page_link.get_attribute("href")
-            if next_href:
-                # Use the full URL from the link
-                current_url = next_href if next_href.startswith("http") else BASE_URL + next_href
-                page_num += 1
-                random_delay()
-                continue
+                page_manuals.append({
+                    "brand": brand,
+                    "model": model_name,
+                    "model_url": model_url,
+                    "model_id": model_id,
+                    "doc_type": doc_type,
+                    "doc_description": doc_description,
+                    "manual_url": manual_url,
+                    "manualslib_id": manualslib_id,
+                })
+
+        # Add this page's manuals in one transaction for real-time progress
+        if page_manuals:
+            added = database.add_manuals_bulk(page_manuals)
+            manual_count += len(page_manuals)
+            logger.info(f"Added {added} new manuals from page {page_num} ({len(page_manuals)} found)")
+
+        # Next page, read along with the rows
+        next_href = listing_page["next"]
+        if next_href:
+            # Use the full URL from the link
+            current_url = next_href if next_href.startswith("http") else BASE_URL + next_href
+            page_num += 1
+            await random_delay()
+            continue
 
         # No more pages
         logger.info(f"Reached last page for {brand} [{cat_display}]")
@@ -430,40 +656,80 @@ def scrape_category_listing(page: Page, brand: str, category_url: str, category_
     return manual_count
 
 
-def wait_for_captcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT, captcha_solver: TwoCaptchaSolver = None) -> bool:
+# Solved once the response token is filled in or the captcha iframe is gone.
+# The textarea value doesn't fire DOM mutations, so poll in the page rather
+# than on mutation.
+_CAPTCHA_SOLVED_JS = """
+    () => {
+        const response = document.querySelector('[name="g-recaptcha-response"]');
+        return (response && response.value.length > 0)
+            || !document.querySelector('iframe[src*="recaptcha"]');
+    }
+"""
+
+
+async def solve_captcha_with_2captcha(page: Page, captcha_solver: TwoCaptchaSolver) -> bool:
+    """Solve the page's reCAPTCHA via 2captcha and inject the token. Returns True on success."""
+    logger.info("Attempting automatic captcha solving with 2captcha...")
+
+    # Extract sitekey from page
+    sitekey = await extract_sitekey_from_page_async(page)
+    if not sitekey:
+        logger.warning("Could not extract sitekey, falling back to manual solving")
+        return False
+    logger.info(f"Found sitekey: {sitekey[:20]}...")
+
+    # Solve with 2captcha (blocking HTTP polling, so run it in a thread
+    # to let other pages keep working while this one waits)
+    token = await asyncio.to_thread(captcha_solver.solve_recaptcha, sitekey, page.url)
+    if not token:
+        logger.warning("2captcha failed, falling back to manual solving")
+        return False
+
+    # Inject the token into the page. No fixed pause needed afterwards: the
+    # caller waits for the "Get Manual" button the token unlocks
+    if not await inject_captcha_response_async(page, token):
+        logger.warning("Failed to inject captcha token, falling back to manual")
+        return False
+    logger.info("Captcha token injected successfully")
+    return True
+
+
+async def wait_for_manual_captcha_solve(page: Page, timeout: int) -> bool:
+    """Wait up to `timeout` seconds for the captcha to be solved in the browser."""
+    try:
+        await page.wait_for_function(_CAPTCHA_SOLVED_JS, polling=500, timeout=timeout * 1000)
+        logger.info("Captcha solved")
+        return True
+    except Exception:
+        return False
+
+
+async def wait_for_captcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT, captcha_solver: TwoCaptchaSolver = None) -> bool:
     """
     Wait for captcha to be solved.
 
-    If captcha_solver is provided, attempts automatic solving via 2captcha.
+    If captcha_solver is provided, 2captcha and a human solving it in the
+    browser window race each other and whichever finishes first wins.
     Otherwise, waits for human to solve in the browser window.
 
     Returns True if solved, False if timeout.
     """
-    # Try automatic solving with 2captcha if configured
+    manual = asyncio.create_task(wait_for_manual_captcha_solve(page, timeout))
+
     if captcha_solver:
-        logger.info("Attempting automatic captcha solving with 2captcha...")
-
-        # Extract sitekey from page
-        sitekey = extract_sitekey_from_page(page)
-        if sitekey:
-            logger.info(f"Found sitekey: {sitekey[:20]}...")
-            page_url = page.url
-
-            # Solve with 2captcha
-            token = captcha_solver.solve_recaptcha(sitekey, page_url)
-            if token:
-                # Inject the token into the page
-                if inject_captcha_response(page, token):
-                    logger.info("Captcha token injected successfully")
-                    # Give the page a moment to process
-                    time.sleep(1)
-                    return True
-                else:
-                    logger.warning("Failed to inject captcha token, falling back to manual")
-            else:
-                logger.warning("2captcha failed, falling back to manual solving")
-        else:
-            logger.warning("Could not extract sitekey, falling back to manual solving")
+        auto = asyncio.create_task(solve_captcha_with_2captcha(page, captcha_solver))
+        done, _ = await asyncio.wait({auto, manual}, return_when=asyncio.FIRST_COMPLETED)
+        if manual in done:
+            # The 2captcha thread can't be interrupted; its result is just dropped
+            auto.cancel()
+            if manual.result():
+                return True
+            logger.warning("Captcha timeout - skipping this manual")
+            return False
+        if auto.result():
+            manual.cancel()
+            return True
 
     # Fall back to manual solving
     logger.info("Waiting for captcha to be solved manually...")
@@ -471,38 +737,36 @@ def wait_for_captcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT, captcha_
     print("CAPTCHA DETECTED - Please solve it in the browser window")
     print("=" * 60 + "\n")
 
-    start_time = time.time()
+    if await manual:
+        return True
 
-    while time.time() - start_time < timeout:
-        # Check if captcha iframe is still present and visible
-        captcha_frame = page.query_selector('iframe[src*="recaptcha"]')
-        if not captcha_frame:
-            logger.info("Captcha appears to be solved (iframe gone)")
-            return True
+    logger.warning("Captcha timeout - skipping this manual")
+    return False
 
-        # Check if captcha is in solved state
-        try:
-            # Look for the checkmark that appears when solved
-            captcha_response = page.evaluate("""
-                () => {
-                    const response = document.querySelector('[name="g-recaptcha-response"]');
-                    return response && response.value.length > 0;
-                }
-            """)
-            if captcha_response:
-                logger.info("Captcha solved (response token present)")
-                return True
-        except Exception:
-            pass
 
-        time.sleep(2)
+# Keep a margin so a cached link doesn't expire mid-download
+PDF_URL_EXPIRY_MARGIN = 300
 
-    logger.warning("Captcha timeout - skipping this manual")
-    return False
+
+def pdf_url_expiry(pdf_url: str) -> int | None:
+    """Get the expiry (Unix time) from a signed PDF link's Expires query parameter."""
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(pdf_url).query)
+    for key, values in query.items():
+        if key.lower() in ("expires", "exp") and values and values[0].isdigit():
+            return int(values[0])
+    return None
+
+
+def pdf_url_is_fresh(manual: dict) -> bool:
+    """True if the manual has a cached PDF link that is still valid for a while."""
+    expires_at = manual.get("pdf_url_expires_at")
+    if not manual.get("pdf_url") or not expires_at:
+        return False
+    return time.time() + PDF_URL_EXPIRY_MARGIN < expires_at
 
 
 def get_proxy_url() -> str | None:
-    """Get proxy URL from environment variables (for urllib requests)."""
+    """Get proxy URL from environment variables (for direct HTTP requests)."""
     host = os.environ.get("PROXY_HOST")
     port = os.environ.get("PROXY_PORT")
     user = os.environ.get("PROXY_USER")
@@ -513,15 +777,63 @@ def get_proxy_url() -> str | None:
     return None
 
 
-def download_file_to_temp(url: str, use_proxy: bool = False) -> tuple[Path, str] | None:
+def fetch_pdf_fingerprint(url: str, use_proxy: bool = False) -> tuple[int, str, str] | None:
+    """
+    HEAD a PDF URL and return its (content_length, etag, host), or None if
+    the server doesn't send both headers with a strong ETag (or the request
+    fails). The host is the one that answered, after redirects.
+
+    Many manualslib models share the same PDF, so this lets a duplicate be
+    recognised before its body is transferred.
+    """
+    if url.startswith("//"):
+        url = "https:" + url
+
+    try:
+        proxy_url = get_proxy_url() if use_proxy else None
+        proxies = {'http': proxy_url, 'https': proxy_url} if proxy_url else None
+
+        response = http_session.head(
+            url,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            proxies=proxies,
+            allow_redirects=True,
+            timeout=30,
+        )
+        response.raise_for_status()
+    except Exception as e:
+        logger.debug(f"HEAD request failed for {url}: {e}")
+        return None
+
+    content_length = response.headers.get("Content-Length")
+    etag = response.headers.get("ETag")
+    # A compressed length says nothing about the PDF itself
+    if not content_length or not etag or response.headers.get("Content-Encoding"):
+        return None
+    # Weak ETags only promise equivalent content, not the same bytes
+    if etag.startswith("W/"):
+        return None
+    host = urllib.parse.urlparse(response.url).netloc
+    try:
+        return int(content_length), etag, host
+    except ValueError:
+        return None
+
+
+def download_file_to_temp(url: str, download_dir: Path, use_proxy: bool = False) -> tuple[Path, str, str, int, str] | None:
     """
-    Download a file to a temp location.
+    Download a file to a temp location inside download_dir, hashing it on the way.
+
+    Returns (temp_path, sha1, md5, file_size, original_filename) if successful,
+    None otherwise. The original_filename is extracted from Content-Disposition
+    header or URL.
 
-    Returns (temp_path, original_filename) if successful, None otherwise.
-    The original_filename is extracted from Content-Disposition header or URL.
+    The temp file lives in download_dir/.tmp, so moving it into its SHA1
+    storage path is a rename on the same filesystem rather than a copy.
 
     Args:
         url: URL to download
+        download_dir: Root of the content-addressable storage
         use_proxy: If True, use configured proxy. Defaults to False since signed
                    download URLs work without proxy and proxies are metered by bandwidth.
     """
@@ -531,36 +843,32 @@ def download_file_to_temp(url: str, use_proxy: bool = False) -> tuple[Path, str]
     if url.startswith("//"):
         url = "https:" + url
 
+    temp_path = None
     try:
         # Set up proxy if configured
         proxy_url = get_proxy_url() if use_proxy else None
-        if proxy_url:
-            proxy_handler = urllib.request.ProxyHandler({
-                'http': proxy_url,
-                'https': proxy_url,
-            })
-            opener = urllib.request.build_opener(proxy_handler)
-        else:
-            opener = urllib.request.build_opener()
-
-        req = urllib.request.Request(url)
-        req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
-        with opener.open(req, timeout=120) as response:
-            # Try to get filename from Content-Disposition header
-            content_disp = response.headers.get('Content-Disposition', '')
+        proxies = {'http': proxy_url, 'https': proxy_url} if proxy_url else None
+
+        with http_session.get(
+            url,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            proxies=proxies,
+            stream=True,
+            timeout=120,
+        ) as response:
+            response.raise_for_status()
+
+            # Try to get filename from Content-Disposition header, e.g.
+            # attachment; filename="file.pdf" or filename*=UTF-8''file.pdf
             original_filename = None
-
-            if 'filename=' in content_disp:
-                # Parse filename from header like: attachment; filename="file.pdf"
-                match = re.search(r'filename[*]?=["\']?([^"\';\n]+)["\']?', content_disp)
-                if match:
-                    original_filename = match.group(1).strip()
+            content_disp = response.headers.get('Content-Disposition')
+            if content_disp:
+                message = email.message.Message()
+                message['Content-Disposition'] = content_disp
+                filename = message.get_filename()
+                if filename:
                     # Handle URL-encoded filenames
-                    if original_filename.startswith("UTF-8''"):
-                        original_filename = urllib.parse.unquote(original_filename[7:])
-                    else:
-                        original_filename = urllib.parse.unquote(original_filename)
+                    original_filename = urllib.parse.unquote(filename.strip())
 
             # Fallback: extract from URL
             if not original_filename:
@@ -571,62 +879,187 @@ def download_file_to_temp(url: str, use_proxy: bool = False) -> tuple[Path, str]
             if not original_filename.lower().endswith('.pdf'):
                 original_filename += '.pdf'
 
-            # Download to temp file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                tmp.write(response.read())
+            # Body size on disk is only known up front if it isn't content-encoded
+            expected_size = None
+            if response.headers.get('Content-Length', '').isdigit() and not response.headers.get('Content-Encoding'):
+                expected_size = int(response.headers['Content-Length'])
+
+            # Stream to temp file, hashing each chunk as it is written
+            staging_dir = ensure_dir(download_dir / ".tmp")
+            sha1 = hashlib.sha1()
+            md5 = hashlib.md5()
+            file_size = 0
+            with tempfile.NamedTemporaryFile(dir=staging_dir, suffix='.pdf', delete=False) as tmp:
                 temp_path = Path(tmp.name)
+                if expected_size and hasattr(os, 'posix_fallocate'):
+                    # Reserve the whole file in one extent before writing
+                    os.posix_fallocate(tmp.fileno(), 0, expected_size)
+                for chunk in response.iter_content(chunk_size=HASH_CHUNK_SIZE):
+                    sha1.update(chunk)
+                    md5.update(chunk)
+                    tmp.write(chunk)
+                    file_size += len(chunk)
+
+            if expected_size is not None and file_size != expected_size:
+                raise IOError(f"incomplete download ({file_size} of {expected_size} bytes)")
 
-        return temp_path, original_filename
+        return temp_path, sha1.hexdigest(), md5.hexdigest(), file_size, original_filename
 
     except Exception as e:
         logger.error(f"Failed to download {url}: {e}")
+        if temp_path:
+            temp_path.unlink(missing_ok=True)
         return None
 
 
-def download_manual(page: Page, manual: dict, download_dir: Path, brand: str, captcha_solver: TwoCaptchaSolver = None) -> tuple[str, str, str, int, str, str | None, str | None, str | None, int | None] | None:
+def store_downloaded_file(temp_path: Path, original_sha1: str, original_md5: str, original_file_size: int, original_filename: str, download_dir: Path) -> tuple[str, str, str, int, str, str | None, str | None, str | None, int | None]:
     """
-    Download a single manual using content-addressable storage.
+    Move a downloaded temp file into content-addressable storage.
 
-    Files are stored based on SHA1 hash in a trie structure: downloads/ab/cd/abcdef...pdf
-    The original filename is preserved in the database for display purposes.
+    Takes the checksums computed while downloading. Runs the blocking part of
+    a download (watermark stripping, rehashing the stripped file, file moves),
+    so async callers run it in a worker thread.
+    """
+    original_file_path = None
 
-    Returns (file_path, sha1, md5, file_size, original_filename) if successful, None otherwise.
+    if SETTINGS.strip_watermarks:
+        # Store original file BEFORE stripping
+        original_storage_path = get_sha1_storage_path(download_dir, original_sha1)
+        ensure_dir(original_storage_path.parent)
+
+        if not original_storage_path.exists():
+            # Copy original to storage (keep temp for stripping)
+            shutil.copy2(str(temp_path), str(original_storage_path))
+            logger.info(f"Stored original: {original_storage_path} (SHA1: {original_sha1[:8]}...)")
+        else:
+            logger.info(f"Original already exists at {original_storage_path}")
+
+        original_file_path = str(original_storage_path)
+
+        # Strip watermark on temp file
+        from pdf_utils import strip_manualslib_watermark
+
+        modified = strip_manualslib_watermark(temp_path)
+
+        if modified:
+            # Compute final checksums after stripping
+            sha1, md5 = compute_checksums(temp_path)
+            file_size = temp_path.stat().st_size
+
+            # Move stripped file to its own storage path
+            final_path = get_sha1_storage_path(download_dir, sha1)
+            ensure_dir(final_path.parent)
+
+            if final_path.exists():
+                logger.info(f"Stripped file already exists at {final_path}")
+                temp_path.unlink()
+            else:
+                os.replace(temp_path, final_path)
+                logger.info(f"Stored stripped: {final_path} (SHA1: {sha1[:8]}...)")
+
+            logger.info(f"Original filename: {original_filename}")
+            return str(final_path), sha1, md5, file_size, original_filename, original_sha1, original_md5, original_file_path, original_file_size
+        else:
+            # Stripping didn't change file - remove temp and use original path
+            temp_path.unlink()
+            logger.info(f"Watermark stripping made no changes, using original")
+            logger.info(f"Original filename: {original_filename}")
+            return original_file_path, original_sha1, original_md5, original_file_size, original_filename, None, None, None, None
+    else:
+        # No stripping - just store as original
+        final_path = get_sha1_storage_path(download_dir, original_sha1)
+        ensure_dir(final_path.parent)
+
+        if final_path.exists():
+            logger.info(f"File already exists at {final_path} (duplicate content)")
+            temp_path.unlink()
+        else:
+            os.replace(temp_path, final_path)
+
+        logger.info(f"Downloaded: {final_path} ({original_file_size} bytes, SHA1: {original_sha1[:8]}...)")
+        logger.info(f"Original filename: {original_filename}")
+        return str(final_path), original_sha1, original_md5, original_file_size, original_filename, None, None, None, None
+
+
+async def fetch_pdf(manual: dict, pdf_url: str, download_dir: Path) -> tuple[str, str, str, int, str, str | None, str | None, str | None, int | None] | None:
     """
-    logger.info(f"Downloading: {manual['model']} - {manual['url']}")
+    Fetch a manual's PDF into content-addressable storage.
 
-    page.goto(manual["url"], wait_until="domcontentloaded")
-    random_delay(1, 2)
+    The PDF is HEADed first; if a manualslib manual already downloaded was
+    served by the same host with the same Content-Length and strong ETag,
+    its stored file is reused and the body is never transferred.
+    """
+    fingerprint = await asyncio.to_thread(fetch_pdf_fingerprint, pdf_url)
+    if fingerprint:
+        existing = database.find_by_fingerprint(*fingerprint, source="manualslib")
+        if existing and existing["file_path"] and Path(existing["file_path"]).exists():
+            logger.info(f"Same PDF as already downloaded manual {existing['id']} ({existing['model']}), reusing {existing['file_path']}")
+            if manual.get("id"):
+                database.queue_write(database.update_fingerprint, manual["id"], *fingerprint)
+            original = None
+            if existing["original_file_sha1"] and existing["original_file_sha1"] != existing["file_sha1"]:
+                original = database.get_variant_by_type(existing["id"], "original")
+            return (
+                existing["file_path"], existing["file_sha1"], existing["file_md5"], existing["file_size"],
+                existing["original_filename"],
+                existing["original_file_sha1"] if original else None,
+                existing["original_file_md5"] if original else None,
+                original["file_path"] if original else None,
+                original["file_size"] if original else None,
+            )
+
+    # Download to temp file (blocking HTTP, so off the event loop)
+    result = await asyncio.to_thread(download_file_to_temp, pdf_url, download_dir)
+    if not result:
+        return None
+
+    stored = await asyncio.to_thread(store_downloaded_file, *result, download_dir)
+    if stored and fingerprint and manual.get("id"):
+        database.queue_write(database.update_fingerprint, manual["id"], *fingerprint)
+    return stored
+
+
+async def resolve_pdf_url(page: Page, manual: dict, captcha_solver: TwoCaptchaSolver = None) -> str | None:
+    """
+    Go through a manual's download page (button, captcha, "Get Manual") and
+    return the direct PDF link, or None if it couldn't be found.
+
+    The link is also saved to the database so a retry can skip this flow
+    while it is still valid.
+    """
+    await page.goto(manual["url"], wait_until="domcontentloaded")
+    await random_delay(1, 2)
 
     # Look for download button
-    download_btn = page.query_selector('a:has-text("Download"), button:has-text("Download")')
+    download_btn = await page.query_selector('a:has-text("Download"), button:has-text("Download")')
     if not download_btn:
         # Try alternative selectors
-        download_btn = page.query_selector('.download-btn, .btn-download, [class*="download"]')
+        download_btn = await page.query_selector('.download-btn, .btn-download, [class*="download"]')
 
     if not download_btn:
         logger.warning(f"No download button found for {manual['model']}")
         return None
 
     # Click download button
-    download_btn.click()
-    random_delay(1, 2)
+    await download_btn.click()
+    await random_delay(1, 2)
 
     # Wait for reCAPTCHA to fully load before proceeding
     logger.info("Waiting for reCAPTCHA to load...")
     try:
         # Wait for the reCAPTCHA iframe to appear and be ready
-        page.wait_for_selector('iframe[src*="recaptcha"]', timeout=30000)
+        await page.wait_for_selector('iframe[src*="recaptcha"]', timeout=30000)
         # Give it a moment to fully initialize
-        random_delay(1, 2)
+        await random_delay(1, 2)
         logger.info("reCAPTCHA loaded")
     except Exception as e:
         logger.warning(f"reCAPTCHA did not load within timeout: {e}")
         # Continue anyway - maybe there's no captcha on this page
 
     # Check for captcha and solve it
-    captcha_frame = page.query_selector('iframe[src*="recaptcha"]')
+    captcha_frame = await page.query_selector('iframe[src*="recaptcha"]')
     if captcha_frame:
-        if not wait_for_captcha_solved(page, captcha_solver=captcha_solver):
+        if not await wait_for_captcha_solved(page, captcha_solver=captcha_solver):
             return None
 
     # Flow: Captcha solved → "Get Manual" button → "Download PDF" button
@@ -634,14 +1067,14 @@ def download_manual(page: Page, manual: dict, download_dir: Path, brand: str, ca
     # Step 1: Wait for and click "Get Manual" button
     logger.info("Waiting for Get Manual button...")
     try:
-        get_manual_btn = page.wait_for_selector(
+        get_manual_btn = await page.wait_for_selector(
             'a:has-text("Get Manual"), button:has-text("Get Manual")',
             timeout=10000
         )
         if get_manual_btn:
             logger.info("Found Get Manual button, clicking...")
-            get_manual_btn.click()
-            random_delay(1, 2)
+            await get_manual_btn.click()
+            await random_delay(1, 2)
     except Exception as e:
         logger.debug(f"No Get Manual button found: {e}")
 
@@ -649,20 +1082,20 @@ def download_manual(page: Page, manual: dict, download_dir: Path, brand: str, ca
     logger.info("Waiting for Download PDF link...")
     pdf_url = None
     try:
-        pdf_link = page.wait_for_selector(
+        pdf_link = await page.wait_for_selector(
             'a[href*="manualslib.com/pdf"], a[href*=".pdf"][href*="take=binary"], a:has-text("Download PDF")',
             timeout=10000
         )
         if pdf_link:
-            pdf_url = pdf_link.get_attribute("href")
+            pdf_url = await pdf_link.get_attribute("href")
     except Exception as e:
         logger.debug(f"No Download PDF link found: {e}")
 
     # Fallback: look for any direct PDF link
     if not pdf_url:
-        pdf_link = page.query_selector('a[href*=".pdf"]')
+        pdf_link = await page.query_selector('a[href*=".pdf"]')
         if pdf_link:
-            pdf_url = pdf_link.get_attribute("href")
+            pdf_url = await pdf_link.get_attribute("href")
             if pdf_url:
                 logger.info(f"Found fallback PDF URL: {pdf_url}")
 
@@ -671,87 +1104,210 @@ def download_manual(page: Page, manual: dict, download_dir: Path, brand: str, ca
         return None
 
     logger.info(f"Found PDF URL: {pdf_url}")
+    if manual.get("id"):
+        database.queue_write(database.update_pdf_url, manual["id"], pdf_url, pdf_url_expiry(pdf_url))
+    return pdf_url
 
-    # Download to temp file
-    result = download_file_to_temp(pdf_url)
-    if not result:
-        return None
 
-    temp_path, original_filename = result
+async def download_manual(pool: PagePool, manual: dict, download_dir: Path, captcha_solver: TwoCaptchaSolver = None) -> tuple[str, str, str, int, str, str | None, str | None, str | None, int | None] | None:
+    """
+    Download a single manual using content-addressable storage.
 
-    # Compute original checksums
-    original_sha1, original_md5 = compute_checksums(temp_path)
-    original_file_size = temp_path.stat().st_size
-    original_file_path = None
+    Files are stored based on SHA1 hash in a trie structure: downloads/ab/cd/abcdef...pdf
+    The original filename is preserved in the database for display purposes.
 
-    if STRIP_WATERMARKS:
-        # Store original file BEFORE stripping
-        original_storage_path = get_sha1_storage_path(download_dir, original_sha1)
-        original_storage_path.parent.mkdir(parents=True, exist_ok=True)
+    Returns (file_path, sha1, md5, file_size, original_filename) if successful, None otherwise.
 
-        if not original_storage_path.exists():
-            # Copy original to storage (keep temp for stripping)
-            shutil.copy2(str(temp_path), str(original_storage_path))
-            logger.info(f"Stored original: {original_storage_path} (SHA1: {original_sha1[:8]}...)")
-        else:
-            logger.info(f"Original already exists at {original_storage_path}")
+    A browser page is only held while the PDF link is being resolved; the
+    file itself is fetched over plain HTTP after the page is back in the
+    pool. If an earlier attempt saved a signed PDF link that hasn't expired,
+    it is fetched directly, skipping the page, captcha and button clicks.
+    """
+    logger.info(f"Downloading: {manual['model']} - {manual['url']}")
 
-        original_file_path = str(original_storage_path)
+    if pdf_url_is_fresh(manual):
+        logger.info("Using cached PDF URL (still valid), skipping captcha")
+        result = await fetch_pdf(manual, manual["pdf_url"], download_dir)
+        if result:
+            return result
+        logger.info("Cached PDF URL failed, going through the download page")
 
-        # Strip watermark on temp file
-        modified = strip_manualslib_watermark(temp_path)
+    async with pool.page() as page:
+        pdf_url = await resolve_pdf_url(page, manual, captcha_solver)
+    if not pdf_url:
+        return None
 
-        if modified:
-            # Compute final checksums after stripping
-            sha1, md5 = compute_checksums(temp_path)
-            file_size = temp_path.stat().st_size
+    return await fetch_pdf(manual, pdf_url, download_dir)
 
-            # Move stripped file to its own storage path
-            final_path = get_sha1_storage_path(download_dir, sha1)
-            final_path.parent.mkdir(parents=True, exist_ok=True)
 
-            if final_path.exists():
-                logger.info(f"Stripped file already exists at {final_path}")
-                temp_path.unlink()
-            else:
-                shutil.move(str(temp_path), str(final_path))
-                logger.info(f"Stored stripped: {final_path} (SHA1: {sha1[:8]}...)")
+async def skip_archived(pending: list[dict]) -> list[dict]:
+    """Check pending manuals against archive.org and return the ones still to download.
 
-            logger.info(f"Original filename: {original_filename}")
-            return str(final_path), sha1, md5, file_size, original_filename, original_sha1, original_md5, original_file_path, original_file_size
-        else:
-            # Stripping didn't change file - remove temp and use original path
-            temp_path.unlink()
-            logger.info(f"Watermark stripping made no changes, using original")
-            logger.info(f"Original filename: {original_filename}")
-            return original_file_path, original_sha1, original_md5, original_file_size, original_filename, None, None, None, None
-    else:
-        # No stripping - just store as original
-        final_path = get_sha1_storage_path(download_dir, original_sha1)
-        final_path.parent.mkdir(parents=True, exist_ok=True)
+    Fills in missing manualslib_ids first, and records the results of the
+    check in the database.
+    """
+    # Extract manualslib_id where it isn't in the DB yet, saved in one update
+    extracted = {}
+    for manual_record in pending:
+        if not manual_record.get("manualslib_id"):
+            manualslib_id = extract_manualslib_id(manual_record["manual_url"])
+            if manualslib_id:
+                extracted[manual_record["id"]] = manualslib_id
+                manual_record["manualslib_id"] = manualslib_id
+    if extracted:
+        database.queue_write(database.update_manualslib_ids, extracted)
+
+    # Check archive.org for every pending manual up front, skipping ones
+    # recently confirmed as not archived (by a previous run or archive_checker)
+    to_check = [m for m in pending if m.get("manualslib_id") and not archive_check_is_fresh(m)]
+    logger.info(f"Checking archive.org for {len(to_check)} manuals ({len(pending) - len(to_check)} checked recently or without ID)...")
+    archived, failed = await check_archive_org_many([m["manualslib_id"] for m in to_check])
+    archive_urls = {
+        m["id"]: archived[m["manualslib_id"]]
+        for m in to_check if m["manualslib_id"] in archived
+    }
+    if failed:
+        logger.warning(f"Could not check {len(failed)} manuals against archive.org, will check again next time")
+    # Only confirmed misses are remembered; failed checks are retried next run
+    database.queue_write(database.update_archive_checked_many, [
+        m["id"] for m in to_check
+        if m["id"] not in archive_urls and m["manualslib_id"] not in failed
+    ])
+    if archive_urls:
+        logger.info(f"{len(archive_urls)} already archived on archive.org")
+        database.queue_write(database.mark_archived_bulk, archive_urls)
+        pending = [m for m in pending if m["id"] not in archive_urls]
+    return pending
+
+
+async def download_pending(pool: PagePool, pending: Iterable[dict], download_dir: Path, brand: str, captcha_solver: TwoCaptchaSolver = None, concurrency: int = 1):
+    """Download pending manuals for a brand, up to `concurrency` pages at a time.
+
+    `pending` may be a lazy iterator; it is consumed PENDING_BATCH_SIZE
+    manuals at a time, each batch checked against archive.org while the
+    previous one downloads.
+
+    The circuit breaker counts failures across all workers; tripping it (or
+    reaching the download limit) cancels the downloads still in flight.
+    """
+    # The page pool bounds browser use; as many downloads again may be
+    # fetching their PDF over HTTP after handing their page back
+    slots = asyncio.Semaphore(2 * max(1, concurrency))
+    consecutive_failures = 0
 
-        if final_path.exists():
-            logger.info(f"File already exists at {final_path} (duplicate content)")
-            temp_path.unlink()
-        else:
-            shutil.move(str(temp_path), str(final_path))
+    async def download_one(manual_record: dict):
+        nonlocal consecutive_failures
+        async with slots:
+            try:
+                # Check download limit before each download
+                check_download_limit()
+
+                result = await download_manual(
+                    pool,
+                    {
+                        "id": manual_record["id"],
+                        "model": manual_record["model"],
+                        "url": manual_record["manual_url"],
+                        "doc_type": manual_record["doc_type"],
+                        "pdf_url": manual_record.get("pdf_url"),
+                        "pdf_url_expires_at": manual_record.get("pdf_url_expires_at"),
+                    },
+                    download_dir,
+                    captcha_solver=captcha_solver
+                )
+                if result:
+                    file_path, sha1, md5, file_size, original_filename, original_sha1, original_md5, original_file_path, original_file_size = result
+                    database.queue_write(
+                        database.update_downloaded, manual_record["id"], file_path, sha1, md5, file_size, original_filename,
+                        original_sha1, original_md5, original_file_path, original_file_size
+                    )
+                    consecutive_failures = 0  # Reset on success
+                    increment_download_count()
+                else:
+                    consecutive_failures += 1
+                    logger.warning(f"Download failed ({consecutive_failures}/{MAX_CONSECUTIVE_FAILURES} consecutive failures)")
+                    if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                        raise DownloadCircuitBreakerError(
+                            f"Stopping after {MAX_CONSECUTIVE_FAILURES} consecutive download failures. "
+                            "This may indicate an IP ban or site issue."
+                        )
+                await random_delay()
+            except (DownloadCircuitBreakerError, DownloadLimitReached):
+                raise  # Re-raise to stop
+            except Exception as e:
+                logger.error(f"Error downloading {manual_record['model']}: {e}")
+                consecutive_failures += 1
+                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    raise DownloadCircuitBreakerError(
+                        f"Stopping after {MAX_CONSECUTIVE_FAILURES} consecutive download failures. "
+                        "This may indicate an IP ban or site issue."
+                    )
 
-        logger.info(f"Downloaded: {final_path} ({original_file_size} bytes, SHA1: {original_sha1[:8]}...)")
-        logger.info(f"Original filename: {original_filename}")
-        return str(final_path), original_sha1, original_md5, original_file_size, original_filename, None, None, None, None
+    pending = iter(pending)
+
+    async def next_batch() -> tuple[bool, list[dict]]:
+        """Take the next batch and drop archived manuals; (more left, batch)."""
+        batch = list(islice(pending, PENDING_BATCH_SIZE))
+        if not batch:
+            return False, []
+        return True, await skip_archived(batch)
+
+    upcoming = asyncio.create_task(next_batch())
+    try:
+        while True:
+            more, batch = await upcoming
+            if not more:
+                break
+            # Check the next batch against archive.org while this one
+            # downloads (mostly waiting on delays and captchas)
+            upcoming = asyncio.create_task(next_batch())
+            tasks = [asyncio.create_task(download_one(manual_record)) for manual_record in batch]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+    finally:
+        upcoming.cancel()
+
+
+def iter_claimed_manuals(brand: str) -> Iterator[dict]:
+    """Yield a brand's pending manuals, claiming PENDING_BATCH_SIZE at a time.
+
+    Manuals stay claimed by this worker until release_claims(), so ones
+    that fail aren't handed out again within the same run.
+    """
+    while batch := database.claim_batch(WORKER_ID, PENDING_BATCH_SIZE, CLAIM_LEASE_SECONDS, brand=brand):
+        yield from batch
 
 
-def scrape_brand(page: Page, brand: str, download_dir: Path, download: bool = True, category_urls: list[str] = None, categories: list[str] = None, captcha_solver: TwoCaptchaSolver = None):
+async def download_brand(pool: PagePool, brand: str, download_dir: Path, captcha_solver: TwoCaptchaSolver = None, concurrency: int = 1):
+    """Download a brand's pending manuals, up to `concurrency` at a time."""
+    # Download manuals that haven't been downloaded yet (excludes archived),
+    # claimed a batch at a time so other scraper processes skip them
+    logger.info(f"Found {database.count_undownloaded_manuals(brand)} manuals to download for {brand}")
+    try:
+        await download_pending(pool, iter_claimed_manuals(brand), download_dir, brand, captcha_solver=captcha_solver, concurrency=concurrency)
+    finally:
+        # Hand failed/unfinished manuals back for the next run or worker,
+        # once the queued results of the finished ones are in
+        database.flush_writes()
+        # Only this brand's: other brands may still be downloading
+        database.release_claims(WORKER_ID, brand=brand)
+
+
+async def scrape_brand(pool: PagePool, brand: str, download_dir: Path, download: bool = True, category_urls: list[str] = None, categories: list[str] = None, captcha_solver: TwoCaptchaSolver = None, concurrency: int = 1):
     """Scrape all CRT manuals for a brand.
 
     Args:
-        page: Playwright page object
+        pool: Page pool to borrow Playwright pages from
         brand: Brand slug
         download_dir: Directory to download files to
         download: Whether to download files after scraping
         category_urls: List of full category URLs to scrape (from discovered brands)
         categories: List of category slugs like ['tv', 'tv-dvd-combo'] to build URLs from
         captcha_solver: Optional 2captcha solver for automatic captcha solving
+        concurrency: Number of manuals to download in parallel
     """
     logger.info(f"Starting scrape for brand: {brand}")
 
@@ -769,80 +1325,288 @@ def scrape_brand(page: Page, brand: str, download_dir: Path, download: bool = Tr
         # Default to just "tv" category
         urls_to_scrape = [(f"{BASE_URL}/brand/{brand}/tv.html", "tv")]
 
-    # Scrape all category listings
+    # Scrape all category listings (links only, so skip images/fonts/CSS).
+    # Index-only runs block resources for the whole run instead, as brands
+    # are crawled concurrently there.
+    from browser_helper import set_resource_blocking_async
+
     total_manual_count = 0
-    for cat_url, cat_name in urls_to_scrape:
-        manual_count = scrape_category_listing(page, brand, cat_url, cat_name)
-        total_manual_count += manual_count
-        random_delay(1, 2)
+    if download:
+        await set_resource_blocking_async(pool.context, True)
+    try:
+        async with pool.page() as page:
+            for cat_url, cat_name in urls_to_scrape:
+                manual_count = await scrape_category_listing(page, brand, cat_url, cat_name)
+                total_manual_count += manual_count
+                await random_delay(1, 2)
+    finally:
+        if download:
+            # Download pages need full rendering for their captcha widgets
+            await set_resource_blocking_async(pool.context, False)
 
     if not download:
         logger.info(f"Scraping complete for {brand}. Found {total_manual_count} manuals. Skipping downloads.")
         return
 
-    # Download manuals that haven't been downloaded yet (excludes archived)
-    pending = database.get_undownloaded_manuals(brand)
-    logger.info(f"Found {len(pending)} manuals to download for {brand}")
+    await download_brand(pool, brand, download_dir, captcha_solver=captcha_solver, concurrency=concurrency)
 
-    consecutive_failures = 0
 
-    for manual_record in pending:
+def select_brands(args) -> tuple[list[str] | None, Iterator[dict] | None]:
+    """Pick the brands to work on.
+
+    Returns (brand slugs, None), or (None, discovered brand records) when
+    scraping discovered brands, whose saved category URLs are used. The
+    records are streamed from the database rather than loaded up front.
+    """
+    if args.brands:
+        return args.brands, None
+    if args.use_discovered:
+        logger.info(f"Using {database.count_unscraped_brands()} discovered brands")
+        if args.download_only:
+            # Downloads only need the slugs, walked more than once
+            return [b["slug"] for b in database.iter_unscraped_brands()], None
+        return None, database.iter_unscraped_brands()
+    return list(SETTINGS.brands), None
+
+
+async def download_cached_pdfs(pending: list[dict], download_dir: Path, concurrency: int = 1):
+    """Download the manuals whose cached PDF link is still valid, without the browser.
+
+    The link was saved by an earlier run's download flow; fetching it is
+    plain HTTP. Manuals whose download fails are left for the browser.
+    """
+    pending = [m for m in pending if pdf_url_is_fresh(m)]
+    if not pending:
+        return
+    logger.info(f"Downloading {len(pending)} manuals from cached PDF links")
+    slots = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch_one(manual_record: dict):
+        async with slots:
+            try:
+                check_download_limit()
+                result = await fetch_pdf(manual_record, manual_record["pdf_url"], download_dir)
+                if result:
+                    file_path, sha1, md5, file_size, original_filename, original_sha1, original_md5, original_file_path, original_file_size = result
+                    database.queue_write(
+                        database.update_downloaded, manual_record["id"], file_path, sha1, md5, file_size, original_filename,
+                        original_sha1, original_md5, original_file_path, original_file_size
+                    )
+                    increment_download_count()
+            except DownloadLimitReached:
+                raise  # Re-raise to stop
+            except Exception as e:
+                # Left for the browser download
+                logger.error(f"Error downloading {manual_record['model']} from cached link: {e}")
+
+    await asyncio.gather(*(fetch_one(m) for m in pending))
+
+
+async def needs_browser_for_downloads(brands: list[str], download_dir: Path, concurrency: int = 1) -> bool:
+    """Do the downloads that don't need a browser and report whether any are left.
+
+    Pending manuals are claimed a batch at a time (so other scraper
+    processes skip them), classified against archive.org, then those with a
+    still-valid cached PDF link are fetched directly.
+    """
+    for brand in brands:
         try:
-            # Check download limit before each download
-            check_download_limit()
+            while batch := database.claim_batch(WORKER_ID, PENDING_BATCH_SIZE, CLAIM_LEASE_SECONDS, brand=brand):
+                pending = await skip_archived(batch)
+                await download_cached_pdfs(pending, download_dir, concurrency)
+        finally:
+            # The results are queued; make them visible to the counts below,
+            # then hand the rest back for the browser download workers
+            database.flush_writes()
+            database.release_claims(WORKER_ID, brand=brand)
+    return any(database.count_undownloaded_manuals(brand) for brand in brands)
 
-            # Extract manualslib_id if not already in DB
-            manualslib_id = manual_record.get("manualslib_id")
-            if not manualslib_id:
-                manualslib_id = extract_manualslib_id(manual_record["manual_url"])
-                if manualslib_id:
-                    database.update_manualslib_id(manual_record["id"], manualslib_id)
 
-            # Check if already archived on archive.org
-            if manualslib_id:
-                logger.info(f"Checking archive.org for {manual_record['model']} (ID: {manualslib_id})...")
-                is_archived, archive_url = check_archive_org(manualslib_id)
-                if is_archived:
-                    logger.info(f"Already archived: {archive_url}")
-                    database.update_archived(manual_record["id"], archive_url)
-                    continue
+async def run_workers(jobs: Iterable, workers: int):
+    """Await the coroutines from `jobs`, `workers` at a time.
 
-            # Not archived, proceed with download
-            result = download_manual(
-                page,
-                {"model": manual_record["model"], "url": manual_record["manual_url"], "doc_type": manual_record["doc_type"]},
-                download_dir,
-                brand,
-                captcha_solver=captcha_solver
-            )
-            if result:
-                file_path, sha1, md5, file_size, original_filename, original_sha1, original_md5, original_file_path, original_file_size = result
-                database.update_downloaded(
-                    manual_record["id"], file_path, sha1, md5, file_size, original_filename,
-                    original_sha1, original_md5, original_file_path, original_file_size
+    Each worker takes the next job from the shared iterator only once it is
+    free, so a lazy iterator is never unpacked up front. If a job raises,
+    the other workers are cancelled.
+    """
+    jobs = iter(jobs)
+
+    async def worker():
+        for job in jobs:
+            await job
+
+    tasks = [asyncio.create_task(worker()) for _ in range(max(1, workers))]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def run_browser(args, captcha_solver: TwoCaptchaSolver = None):
+    """Launch the browser and run the requested discovery/scrape/download mode."""
+    from playwright.async_api import async_playwright
+
+    from browser_helper import (
+        PagePool,
+        apply_stealth_async,
+        launch_browser_with_extension_async,
+        set_resource_blocking_async,
+        setup_bandwidth_saving_async,
+        setup_route_ad_blocking_async,
+    )
+
+    download_dir = SETTINGS.download_dir
+    extension_path = SETTINGS.extension_path
+    # Parallel downloads only make sense when captchas are solved by 2captcha
+    download_concurrency = SETTINGS.download_concurrency or (3 if captcha_solver else 1)
+
+    if not args.discover_brands:
+        brands, discovered_brands_list = select_brands(args)
+        # Browser startup takes seconds; don't pay for it with nothing to do
+        try:
+            if args.download_only and not await needs_browser_for_downloads(brands, download_dir, download_concurrency):
+                logger.info("No pending manuals left to download, not starting the browser")
+                return
+        except DownloadLimitReached:
+            logger.info(f"Download limit reached ({DOWNLOAD_LIMIT}). Stopping.")
+            return
+
+    # Log proxy configuration (proxy is only used for browser, not file downloads)
+    if SETTINGS.use_proxy:
+        host = os.environ.get("PROXY_HOST")
+        port = os.environ.get("PROXY_PORT")
+        if host and port:
+            logger.info(f"Proxy configured for browser: {host}:{port}")
+            logger.info("Note: File downloads use direct connection (no proxy) to save bandwidth")
+
+    if extension_path:
+        logger.info(f"Using uBlock Origin extension: {extension_path}")
+    else:
+        logger.info("No uBlock Origin extension found - will use route-based ad blocking")
+
+    async with async_playwright() as p:
+        # Launch browser with extension support (requires persistent context)
+        context, extension_loaded = await launch_browser_with_extension_async(
+            p,
+            extension_path=extension_path,
+            headless=SETTINGS.headless,
+            browser=SETTINGS.browser,
+            use_proxy=SETTINGS.use_proxy,
+        )
+
+        if extension_loaded:
+            logger.info("uBlock Origin extension loaded for ad blocking")
+
+        # Fail a stuck navigation after 30s rather than Playwright's default
+        context.set_default_navigation_timeout(30000)
+
+        async def setup_page(page: Page):
+            # Apply stealth patches to avoid fingerprint detection (if enabled)
+            if SETTINGS.stealth:
+                await apply_stealth_async(page)
+
+            # If no extension loaded, use route-based ad blocking as fallback
+            if not extension_loaded:
+                await setup_route_ad_blocking_async(page)
+
+            # Block bandwidth-heavy static content to save proxy costs
+            await setup_bandwidth_saving_async(page)
+
+        # Persistent context may already have pages open, the pool reuses them
+        pool = PagePool(
+            context,
+            size=SETTINGS.concurrency if args.index_only else download_concurrency,
+            setup=setup_page,
+            max_uses=SETTINGS.page_max_uses,
+            max_age=SETTINGS.page_max_age,
+        )
+        await pool.start()
+
+        try:
+            # Brand discovery mode
+            if args.discover_brands:
+                # Brands are added to DB inside discover_brands() for real-time progress
+                await set_resource_blocking_async(context, True)
+                async with pool.page() as page:
+                    discovered_brands, all_tv_related_categories = await discover_brands(page)
+
+                brand_stats = database.get_brand_stats()
+                logger.info(f"Brand discovery complete. Total: {brand_stats['total']}, Pending: {brand_stats['pending']}")
+
+                # Log all TV-related categories for review
+                if all_tv_related_categories:
+                    logger.info("\n" + "=" * 60)
+                    logger.info("ALL CATEGORIES WITH 'TV' IN NAME (for review):")
+                    logger.info("=" * 60)
+                    for cat in sorted(all_tv_related_categories):
+                        logger.info(f"  - {cat}")
+                    logger.info("=" * 60)
+                    logger.info(f"Total: {len(all_tv_related_categories)} unique TV-related categories")
+                    logger.info("Note: Only exact 'TV' and 'TV * Combo' patterns were included in brand discovery.")
+
+                return
+
+            if args.download_only:
+                # Only download pending manuals, several brands at once; the
+                # page pool still bounds how many pages are in use
+                await run_workers(
+                    (download_brand(pool, brand, download_dir, captcha_solver=captcha_solver, concurrency=download_concurrency) for brand in brands),
+                    download_concurrency,
                 )
-                consecutive_failures = 0  # Reset on success
-                increment_download_count()
             else:
-                consecutive_failures += 1
-                logger.warning(f"Download failed ({consecutive_failures}/{MAX_CONSECUTIVE_FAILURES} consecutive failures)")
-                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                    raise DownloadCircuitBreakerError(
-                        f"Stopping after {MAX_CONSECUTIVE_FAILURES} consecutive download failures. "
-                        "This may indicate an IP ban or site issue."
+                # Get configured categories (defaults to just "tv")
+                configured_categories = list(SETTINGS.categories)
+
+                async def scrape_one(brand: str, brand_id: int = None, **kwargs):
+                    await scrape_brand(pool, brand, download_dir, download=not args.index_only, captcha_solver=captcha_solver, concurrency=download_concurrency, **kwargs)
+                    if brand_id is not None:
+                        database.queue_write(database.mark_brand_scraped, brand_id)
+                    await random_delay(3, 6)
+
+                if discovered_brands_list is not None:
+                    # Use discovered brands from database with their saved category URLs
+                    jobs = (
+                        scrape_one(
+                            brand_record["slug"],
+                            brand_record["id"],
+                            category_urls=[url.strip() for url in (brand_record.get("tv_category_urls") or "").split(",") if url.strip()],
+                        )
+                        for brand_record in discovered_brands_list
                     )
-            random_delay()
-        except (DownloadCircuitBreakerError, DownloadLimitReached):
-            raise  # Re-raise to stop
-        except Exception as e:
-            logger.error(f"Error downloading {manual_record['model']}: {e}")
-            consecutive_failures += 1
-            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                raise DownloadCircuitBreakerError(
-                    f"Stopping after {MAX_CONSECUTIVE_FAILURES} consecutive download failures. "
-                    "This may indicate an IP ban or site issue."
-                )
-            continue
+                else:
+                    # Use brands from config or CLI with configured categories
+                    jobs = (scrape_one(brand, categories=configured_categories) for brand in brands)
+
+                if args.index_only:
+                    # Brands are independent when only listing them, so
+                    # crawl several at once (one pool page each)
+                    await set_resource_blocking_async(context, True)
+                    await run_workers(jobs, SETTINGS.concurrency)
+                else:
+                    for job in jobs:
+                        await job
+        except DownloadLimitReached:
+            logger.info(f"Download limit reached ({DOWNLOAD_LIMIT}). Stopping.")
+        finally:
+            await context.close()
+
+
+def get_captcha_solver(config: dict) -> TwoCaptchaSolver | None:
+    """Set up the 2captcha solver if an API key is configured, else None."""
+    # Check environment variable first, then fall back to config.yaml
+    twocaptcha_key = os.environ.get("TWOCAPTCHA_API_KEY") or config.get("twocaptcha_api_key")
+    if not twocaptcha_key:
+        logger.info("2captcha not configured - will use manual captcha solving")
+        return None
+
+    captcha_solver = TwoCaptchaSolver(twocaptcha_key)
+    balance = captcha_solver.get_cached_balance()
+    if balance is not None:
+        logger.info(f"2captcha enabled (balance: ${balance:.2f})")
+    else:
+        logger.warning("2captcha API key configured but could not verify balance")
+    return captcha_solver
 
 
 def main():
@@ -861,34 +1625,17 @@ def main():
     args = parser.parse_args()
 
     config = load_config()
-    download_dir = Path(config.get("download_dir", "./downloads")).resolve()
-    download_dir.mkdir(parents=True, exist_ok=True)
 
     # Set global values from config/args
-    global DELAY_MIN, DELAY_MAX, STRIP_WATERMARKS, DOWNLOAD_LIMIT
-    DELAY_MIN = config.get("delay_min", 2.0)
-    DELAY_MAX = config.get("delay_max", 5.0)
-    STRIP_WATERMARKS = config.get("strip_watermarks", True)
+    global SETTINGS, DOWNLOAD_LIMIT
+    SETTINGS = Settings.from_config(config)
+    ensure_dir(SETTINGS.download_dir)
     DOWNLOAD_LIMIT = args.limit
-    logger.info(f"Request delays: {DELAY_MIN}-{DELAY_MAX} seconds")
-    logger.info(f"Strip watermarks: {STRIP_WATERMARKS}")
+    logger.info(f"Request delays: {SETTINGS.delay_min}-{SETTINGS.delay_max} seconds")
+    logger.info(f"Strip watermarks: {SETTINGS.strip_watermarks}")
     if DOWNLOAD_LIMIT:
         logger.info(f"Download limit: {DOWNLOAD_LIMIT}")
 
-    # Initialize 2captcha solver if API key is configured
-    # Check environment variable first, then fall back to config.yaml
-    captcha_solver = None
-    twocaptcha_key = os.environ.get("TWOCAPTCHA_API_KEY") or config.get("twocaptcha_api_key")
-    if twocaptcha_key:
-        captcha_solver = TwoCaptchaSolver(twocaptcha_key)
-        balance = captcha_solver.get_balance()
-        if balance is not None:
-            logger.info(f"2captcha enabled (balance: ${balance:.2f})")
-        else:
-            logger.warning("2captcha API key configured but could not verify balance")
-    else:
-        logger.info("2captcha not configured - will use manual captcha solving")
-
     database.init_db()
 
     if args.clear_all:
@@ -921,180 +1668,17 @@ def main():
             logger.info("No manuals to upload")
         return
 
-    # Get browser and extension settings (with namespace override support)
-    project_dir = Path(__file__).parent
-    browser_type = get_config(config, "browser", "chromium")
-    headless = get_config(config, "headless", False)
-    use_stealth = get_config(config, "stealth", False)
-    use_proxy = get_config(config, "use_proxy", False)
-    extension_path = get_extension_path(config, project_dir)
-
-    # Log proxy configuration (proxy is only used for browser, not file downloads)
-    if use_proxy:
-        host = os.environ.get("PROXY_HOST")
-        port = os.environ.get("PROXY_PORT")
-        if host and port:
-            logger.info(f"Proxy configured for browser: {host}:{port}")
-            logger.info("Note: File downloads use direct connection (no proxy) to save bandwidth")
-
-    if extension_path:
-        logger.info(f"Using uBlock Origin extension: {extension_path}")
-    else:
-        logger.info("No uBlock Origin extension found - will use route-based ad blocking")
-
-    with sync_playwright() as p:
-        # Launch browser with extension support (requires persistent context)
-        context, extension_loaded = launch_browser_with_extension(
-            p,
-            extension_path=extension_path,
-            headless=headless,
-            browser=browser_type,
-            use_proxy=use_proxy,
-        )
-
-        # Persistent context may already have pages open, use the first one or create new
-        if context.pages:
-            page = context.pages[0]
-        else:
-            page = context.new_page()
-
-        # Apply stealth patches to avoid fingerprint detection (if enabled)
-        if use_stealth:
-            apply_stealth(page)
-
-        # If no extension loaded, use route-based ad blocking as fallback
-        if not extension_loaded:
-            setup_route_ad_blocking(page)
-        else:
-            logger.info("uBlock Origin extension loaded for ad blocking")
-
-        # Block bandwidth-heavy static content to save proxy costs
-        setup_bandwidth_saving(page)
-
-        try:
-            # Brand discovery mode
-            if args.discover_brands:
-                # Brands are added to DB inside discover_brands() for real-time progress
-                discovered_brands, all_tv_related_categories = discover_brands(page)
-
-                brand_stats = database.get_brand_stats()
-                logger.info(f"Brand discovery complete. Total: {brand_stats['total']}, Pending: {brand_stats['pending']}")
-
-                # Log all TV-related categories for review
-                if all_tv_related_categories:
-                    logger.info("\n" + "=" * 60)
-                    logger.info("ALL CATEGORIES WITH 'TV' IN NAME (for review):")
-                    logger.info("=" * 60)
-                    for cat in sorted(all_tv_related_categories):
-                        logger.info(f"  - {cat}")
-                    logger.info("=" * 60)
-                    logger.info(f"Total: {len(all_tv_related_categories)} unique TV-related categories")
-                    logger.info("Note: Only exact 'TV' and 'TV * Combo' patterns were included in brand discovery.")
-
-                context.close()
-                return
-
-            # Determine which brands to scrape
-            if args.brands:
-                brands = args.brands
-                use_discovered_urls = False
-            elif args.use_discovered:
-                # Get discovered brands (will use full category URL support for scraping)
-                discovered_brands_list = database.get_unscraped_brands()
-                brands = [b["slug"] for b in discovered_brands_list]
-                use_discovered_urls = True
-                logger.info(f"Using {len(brands)} discovered brands")
-            else:
-                brands = get_config(config, "brands", [])
-                use_discovered_urls = False
+    # Only runs that download manuals meet captchas
+    captcha_solver = None
+    if not (args.discover_brands or args.index_only):
+        captcha_solver = get_captcha_solver(config)
 
-            if args.download_only:
-                # Only download pending manuals
-                consecutive_failures = 0
-                for brand in brands:
-                    pending = database.get_undownloaded_manuals(brand)
-                    logger.info(f"Downloading {len(pending)} pending manuals for {brand}")
-                    for manual_record in pending:
-                        try:
-                            # Check download limit before each download
-                            check_download_limit()
-
-                            # Extract manualslib_id if not already in DB
-                            manualslib_id = manual_record.get("manualslib_id")
-                            if not manualslib_id:
-                                manualslib_id = extract_manualslib_id(manual_record["manual_url"])
-                                if manualslib_id:
-                                    database.update_manualslib_id(manual_record["id"], manualslib_id)
-
-                            # Check if already archived on archive.org
-                            if manualslib_id:
-                                logger.info(f"Checking archive.org for {manual_record['model']} (ID: {manualslib_id})...")
-                                is_archived, archive_url = check_archive_org(manualslib_id)
-                                if is_archived:
-                                    logger.info(f"Already archived: {archive_url}")
-                                    database.update_archived(manual_record["id"], archive_url)
-                                    continue
-
-                            # Not archived, proceed with download
-                            result = download_manual(
-                                page,
-                                {"model": manual_record["model"], "url": manual_record["manual_url"], "doc_type": manual_record["doc_type"]},
-                                download_dir,
-                                brand,
-                                captcha_solver=captcha_solver
-                            )
-                            if result:
-                                file_path, sha1, md5, file_size, original_filename, original_sha1, original_md5, original_file_path, original_file_size = result
-                                database.update_downloaded(
-                                    manual_record["id"], file_path, sha1, md5, file_size, original_filename,
-                                    original_sha1, original_md5, original_file_path, original_file_size
-                                )
-                                consecutive_failures = 0  # Reset on success
-                                increment_download_count()
-                            else:
-                                consecutive_failures += 1
-                                logger.warning(f"Download failed ({consecutive_failures}/{MAX_CONSECUTIVE_FAILURES} consecutive failures)")
-                                if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                                    raise DownloadCircuitBreakerError(
-                                        f"Stopping after {MAX_CONSECUTIVE_FAILURES} consecutive download failures. "
-                                        "This may indicate an IP ban or site issue."
-                                    )
-                            random_delay()
-                        except (DownloadCircuitBreakerError, DownloadLimitReached):
-                            raise  # Re-raise to stop
-                        except Exception as e:
-                            logger.error(f"Error downloading {manual_record['model']}: {e}")
-                            consecutive_failures += 1
-                            if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                                raise DownloadCircuitBreakerError(
-                                    f"Stopping after {MAX_CONSECUTIVE_FAILURES} consecutive download failures. "
-                                    "This may indicate an IP ban or site issue."
-                                )
-            else:
-                # Get configured categories (defaults to just "tv")
-                configured_categories = get_config(config, "categories", ["tv"])
+    from browser_helper import get_extension_path
 
-                if use_discovered_urls:
-                    # Use discovered brands from database with their saved category URLs
-                    for brand_record in discovered_brands_list:
-                        brand = brand_record["slug"]
-                        # Parse saved category URLs
-                        cat_urls_str = brand_record.get("tv_category_urls", "")
-                        category_urls = [url.strip() for url in cat_urls_str.split(",") if url.strip()]
-
-                        scrape_brand(page, brand, download_dir, download=not args.index_only, category_urls=category_urls, captcha_solver=captcha_solver)
-                        database.mark_brand_scraped(brand_record["id"])
-                        random_delay(3, 6)
-                else:
-                    # Use brands from config or CLI with configured categories
-                    for brand in brands:
-                        scrape_brand(page, brand, download_dir, download=not args.index_only, categories=configured_categories, captcha_solver=captcha_solver)
-                        random_delay(3, 6)
-        except DownloadLimitReached:
-            logger.info(f"Download limit reached ({DOWNLOAD_LIMIT}). Stopping.")
-        finally:
-            context.close()
+    SETTINGS = replace(SETTINGS, extension_path=get_extension_path(config, Path(__file__).parent))
+    asyncio.run(run_browser(args, captcha_solver))
 
+    database.flush_writes()
     stats = database.get_stats()
     logger.info(f"Scraping complete. Total: {stats['total']}, Downloaded: {stats['downloaded']}, Archived: {stats['archived']}, Pending: {stats['pending']}")
 
@@ -2,24 +2,35 @@
 """Scraper for manualzz.com CRT manuals."""
 
 import argparse
+import asyncio
+import email.message
+import functools
 import hashlib
 import logging
+import mmap
+import os
 import random
 import re
-import shutil
 import tempfile
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
 from pathlib import Path
 
+import requests
 import yaml
-from playwright.sync_api import sync_playwright, Page
+from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError
+from requests.adapters import HTTPAdapter
 
 import database
-from browser_helper import launch_browser_with_extension, get_extension_path, setup_route_ad_blocking, apply_stealth
-from turnstile_solver import is_solver_available, solve_cloudflare_with_api, SOLVER_API_URL
+from browser_helper import (
+    PagePool,
+    apply_stealth_async,
+    get_extension_path,
+    launch_browser_with_extension_async,
+    set_resource_blocking_async,
+    setup_route_ad_blocking_async,
+)
+from turnstile_solver import is_solver_available, solve_cloudflare_with_api_async, SOLVER_API_URL
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +40,24 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://manualzz.com"
 CAPTCHA_TIMEOUT = 300  # 5 minutes to solve captcha
+NAVIGATION_TIMEOUT = 15  # seconds before a slow page load is given up on
+
+# URL and filename patterns, compiled once since they run for every link on a page
+_DOC_ID_RE = re.compile(r'/doc/(\d+)')
+_DL_ID_RE = re.compile(r'/download/(\d+)')
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Captchas are solved by hand in the browser window, so only one page may
+# wait on one at a time
+_captcha_lock = asyncio.Lock()
+
+# Keep-alive session for direct PDF downloads; the files mostly come from the
+# same few CDN hosts, so only the first request pays for the TCP+TLS handshake
+http_session = requests.Session()
+http_session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3)
+http_session.mount("https://", _adapter)
+http_session.mount("http://", _adapter)
 
 
 def load_config() -> dict:
@@ -49,21 +78,31 @@ def get_config(config: dict, key: str, default=None, namespace: str = "manualzz"
     return config.get(key, default)
 
 
+# New catalog entries written per transaction
+INSERT_BATCH_SIZE = 200
+
 # Global delay settings (updated from config in main())
 DELAY_MIN = 2.0
 DELAY_MAX = 5.0
 
 
-def random_delay(min_sec: float = None, max_sec: float = None):
+async def random_delay(min_sec: float = None, max_sec: float = None):
     """Sleep for a random delay. Uses global DELAY_MIN/MAX if not specified."""
     min_sec = min_sec if min_sec is not None else DELAY_MIN
     max_sec = max_sec if max_sec is not None else DELAY_MAX
     delay = random.uniform(min_sec, max_sec)
-    time.sleep(delay)
+    await asyncio.sleep(delay)
 
 
 def sanitize_filename(name: str) -> str:
-    return re.sub(r'[<>:"/\\|?*]', '_', name)
+    return _SANITIZE_RE.sub('_', name)
+
+
+@functools.cache
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per run."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
 
 def get_sha1_storage_path(download_dir: Path, sha1: str, extension: str = ".pdf") -> Path:
@@ -83,26 +122,47 @@ def get_sha1_storage_path(download_dir: Path, sha1: str, extension: str = ".pdf"
     return download_dir / dir1 / dir2 / filename
 
 
+HASH_CHUNK_SIZE = 1 << 20
+
+
 def compute_checksums(file_path: Path) -> tuple[str, str]:
-    """Compute SHA1 and MD5 checksums for a file. Returns (sha1, md5)."""
-    sha1 = hashlib.sha1()
-    md5 = hashlib.md5()
+    """Compute SHA1 and MD5 checksums for a file. Returns (sha1, md5).
 
+    The file is mapped and each digest is fed the whole mapping in one
+    C-level call, which also releases the GIL for the duration.
+    """
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            sha1.update(chunk)
-            md5.update(chunk)
-
-    return sha1.hexdigest(), md5.hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # Empty files can't be mapped
+            return hashlib.sha1().hexdigest(), hashlib.md5().hexdigest()
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            # Both passes read front to back, so let the kernel read ahead
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha1(mm).hexdigest(), hashlib.md5(mm).hexdigest()
+
+
+def _download_stream_hashed(read_iter, tmp) -> tuple[str, str, int]:
+    """Write chunks to tmp, hashing them on the way. Returns (sha1, md5, size)."""
+    sha1 = hashlib.sha1()
+    md5 = hashlib.md5()
+    size = 0
+    for chunk in read_iter:
+        sha1.update(chunk)
+        md5.update(chunk)
+        size += len(chunk)
+        tmp.write(chunk)
+    return sha1.hexdigest(), md5.hexdigest(), size
 
 
 def extract_manualzz_id(url: str) -> str | None:
     """Extract the numeric ID from a manualzz URL like /doc/12345/..."""
-    match = re.search(r'/doc/(\d+)', url)
+    match = _DOC_ID_RE.search(url)
     if match:
         return match.group(1)
     # Also try download URL format
-    match = re.search(r'/download/(\d+)', url)
+    match = _DL_ID_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -115,172 +175,178 @@ def extract_category_from_url(url: str) -> str:
     return "Unknown"
 
 
-def scrape_catalog_page(page: Page, catalog_url: str) -> int:
+# Catalog page as {links: [{href, title}], next}, read in one evaluate() call
+# instead of several CDP round-trips per link. Structure: .media.media-similar
+# contains a.media-link and .media-body with h4; pages without those containers
+# fall back to every a[href*="/doc/"] link, titled from the link or its parent.
+# `next` is the href of the following page (a "next" link, else the number
+# after the current one in .pagination), or null on the last.
+_CATALOG_PAGE_JS = """
+    () => {
+        const containers = document.querySelectorAll('.media.media-similar, .media-similar');
+        const links = containers.length
+            ? Array.from(containers, container => {
+                const link = container.querySelector('a.media-link, a[href*="/doc/"]');
+                if (!link) return null;
+                const heading = container.querySelector('h4, .media-heading h4, .media-body h4');
+                return {
+                    href: link.getAttribute('href'),
+                    title: (heading ? heading.innerText.trim() : '') || link.getAttribute('title') || 'Unknown',
+                };
+            }).filter(Boolean)
+            : Array.from(document.querySelectorAll('a[href*="/doc/"]'), link => {
+                let title = link.getAttribute('title') || link.innerText.trim();
+                if (!title || title.length < 3) {
+                    const heading = link.parentElement?.querySelector('h3, h4, .title, span');
+                    if (heading) title = heading.innerText.trim();
+                }
+                return {href: link.getAttribute('href'), title: title || 'Unknown'};
+            });
+
+        const pageLinks = Array.from(document.querySelectorAll('.pagination a'));
+        let next = document.querySelector('a.next, a[rel="next"]')
+            || pageLinks.find(a => /next|>/i.test(a.innerText));
+        if (!next) {
+            const current = document.querySelector('.pagination .active, .pagination .current');
+            const number = current && parseInt(current.innerText.trim(), 10);
+            if (number) next = pageLinks.find(a => a.innerText.trim() === String(number + 1));
+        }
+
+        return {links, next: next?.getAttribute('href') || null};
+    }
+"""
+
+
+async def goto(page: Page, url: str):
+    """
+    Navigate to url, carrying on with whatever has loaded if it is slow.
+
+    Every caller checks the DOM straight after (Cloudflare, captcha frames,
+    content selectors), so a page that missed NAVIGATION_TIMEOUT is still
+    worth inspecting rather than failing the whole manual or catalog.
+    """
+    try:
+        await page.goto(url, wait_until="domcontentloaded")
+    except PlaywrightTimeoutError:
+        logger.warning(f"Page load timed out, continuing: {url}")
+
+
+async def scrape_catalog_page(page: Page, catalog_url: str, known_urls: set[str] = None) -> int:
     """Scrape all manual listings from a manualzz catalog page (with pagination).
 
-    Adds manuals to database immediately as they're found for real-time progress.
+    New manuals are written to the database INSERT_BATCH_SIZE at a time (and
+    whatever is left once the catalog ends), one transaction per batch. URLs
+    in `known_urls` are already indexed and are not sent to the database
+    again; new ones are added to the set.
     Returns the count of manuals found.
     """
+    if known_urls is None:
+        known_urls = database.get_manual_urls(source="manualzz")
     seen_urls = set()
+    # Raw hrefs as the page gives them; thumbnails and titles often repeat a link
+    seen_hrefs = set()
     category = extract_category_from_url(catalog_url)
     page_num = 1
     manual_count = 0
+    pending_manuals = []
+
+    def flush():
+        if pending_manuals:
+            added = database.add_manuals_bulk(pending_manuals)
+            logger.info(f"Added {added} new manuals to database")
+            pending_manuals.clear()
 
     current_url = catalog_url
 
-    while current_url:
-        logger.info(f"Scraping catalog page {page_num}: {current_url}")
-        page.goto(current_url, wait_until="domcontentloaded")
-        random_delay(1, 2)
+    # Write what was found even if the walk fails part-way, since those URLs
+    # are already in known_urls and won't be picked up again this run
+    try:
+        while current_url:
+            logger.info(f"Scraping catalog page {page_num}: {current_url}")
+            await goto(page, current_url)
+
+            # Check for Cloudflare challenge after navigation
+            if await check_cloudflare_challenge(page):
+                async with _captcha_lock:
+                    solved = await wait_for_cloudflare_solved(page)
+                if not solved:
+                    logger.error("Could not pass Cloudflare challenge, stopping")
+                    return manual_count
+                # Re-navigate after solving challenge
+                await goto(page, current_url)
+
+            # Wait for the listings themselves to be rendered by JS; generic
+            # containers are already in the HTML and would match too early
+            try:
+                await page.wait_for_selector(
+                    '.media-similar, a[href*="/doc/"]',
+                    timeout=15000
+                )
+                logger.info("Page content rendered")
+            except Exception:
+                logger.warning("Timeout waiting for page content selectors, will try anyway...")
+                # Give extra time for slow JS
+                await asyncio.sleep(3)
+
+            # Find all manual/document listings
+            catalog_page = await page.evaluate(_CATALOG_PAGE_JS)
+            links = catalog_page["links"]
+            logger.info(f"Found {len(links)} manual links")
+            page_found = 0
+
+            for link in links:
+                href = link["href"]
+                if not href or href in seen_hrefs:
+                    continue
+                seen_hrefs.add(href)
 
-        # Check for Cloudflare challenge after navigation
-        if check_cloudflare_challenge(page):
-            if not wait_for_cloudflare_solved(page):
-                logger.error("Could not pass Cloudflare challenge, stopping")
-                return manual_count
-            # Re-navigate after solving challenge
-            page.goto(current_url, wait_until="domcontentloaded")
-            random_delay(1, 2)
+                manual_url = href if href.startswith("http") else BASE_URL + href
 
-        # Wait for page content to be rendered by JS
-        try:
-            page.wait_for_selector(
-                '.media, .media-similar, a[href*="/doc/"], .container, .catalog-list',
-                timeout=45000
-            )
-            logger.info("Page content rendered")
-        except Exception:
-            logger.warning("Timeout waiting for page content selectors, will try anyway...")
-            # Give extra time for slow JS
-            time.sleep(3)
-
-        # Find all manual/document listings
-        # Structure: .media.media-similar contains a.media-link and .media-body with h4
-        media_containers = page.query_selector_all('.media.media-similar, .media-similar')
-
-        logger.info(f"Found {len(media_containers)} media containers")
-
-        # Fallback: also try direct link selection if no containers found
-        if not media_containers:
-            doc_links = page.query_selector_all('a[href*="/doc/"]')
-            logger.info(f"Fallback: found {len(doc_links)} direct doc links")
-        else:
-            doc_links = []
-
-        # Helper function to add a manual to database
-        def add_manual_to_db(manual_url: str, title: str):
-            nonlocal manual_count
-
-            # Extract manualzz ID
-            manualzz_id = extract_manualzz_id(manual_url)
-
-            # Try to extract brand from title (first word often is brand)
-            brand = "Unknown"
-            title_parts = title.split()
-            if title_parts:
-                brand = title_parts[0]
-
-            # Add to database immediately for real-time progress
-            manual_id = database.add_manual(
-                brand=brand,
-                model=title,  # Use title as model for manualzz
-                manual_url=manual_url,
-                source="manualzz",
-                source_id=manualzz_id,
-                category=category,
-            )
-            if manual_id:
-                logger.info(f"Added: {title[:50]}...")
-            manual_count += 1
-
-        # Process media containers first (preferred method)
-        for container in media_containers:
-            link = container.query_selector('a.media-link, a[href*="/doc/"]')
-            if not link:
-                continue
-
-            href = link.get_attribute("href")
-            if not href:
-                continue
-
-            manual_url = href if href.startswith("http") else BASE_URL + href
-
-            # Skip if already seen
-            if manual_url in seen_urls:
-                continue
-            seen_urls.add(manual_url)
-
-            # Get title from h4 in media-body
-            title_elem = container.query_selector('h4, .media-heading h4, .media-body h4')
-            title = title_elem.inner_text().strip() if title_elem else ""
-
-            if not title:
-                title = link.get_attribute("title") or "Unknown"
-
-            add_manual_to_db(manual_url, title)
-
-        # Process fallback direct links
-        for link in doc_links:
-            href = link.get_attribute("href")
-            if not href:
-                continue
-
-            manual_url = href if href.startswith("http") else BASE_URL + href
-
-            # Skip if already seen
-            if manual_url in seen_urls:
-                continue
-            seen_urls.add(manual_url)
-
-            # Try to get title from the link or nearby elements
-            title = link.get_attribute("title") or link.inner_text().strip()
-
-            # Clean up title
-            if not title or len(title) < 3:
-                # Try to find title in parent container
-                parent = link.query_selector('xpath=..')
-                if parent:
-                    title_elem = parent.query_selector('h3, h4, .title, span')
-                    if title_elem:
-                        title = title_elem.inner_text().strip()
-
-            if not title:
-                title = "Unknown"
-
-            add_manual_to_db(manual_url, title)
-
-        # Check for next page in pagination
-        # Look for pagination links at bottom
-        next_link = page.query_selector('a.next, a[rel="next"], .pagination a:has-text("Next"), .pagination a:has-text(">")')
-        if next_link:
-            next_href = next_link.get_attribute("href")
+                # Skip if already seen
+                if manual_url in seen_urls:
+                    continue
+                seen_urls.add(manual_url)
+                page_found += 1
+
+                # Already indexed on an earlier run or another catalog
+                if manual_url in known_urls:
+                    continue
+                known_urls.add(manual_url)
+
+                title = link["title"]
+
+                # Extract manualzz ID
+                manualzz_id = extract_manualzz_id(manual_url)
+
+                # Try to extract brand from title (first word often is brand)
+                brand = "Unknown"
+                title_parts = title.split()
+                if title_parts:
+                    brand = title_parts[0]
+
+                pending_manuals.append({
+                    "brand": brand,
+                    "model": title,  # Use title as model for manualzz
+                    "manual_url": manual_url,
+                    "source": "manualzz",
+                    "source_id": manualzz_id,
+                    "category": category,
+                })
+
+            manual_count += page_found
+            if len(pending_manuals) >= INSERT_BATCH_SIZE:
+                flush()
+
+            # Next page, read along with the links
+            next_href = catalog_page["next"]
             if next_href and next_href not in seen_urls:
                 current_url = next_href if next_href.startswith("http") else BASE_URL + next_href
                 page_num += 1
-                random_delay()
-            else:
-                current_url = None
-        else:
-            # Try numbered pagination - look for next page number
-            current_page_elem = page.query_selector('.pagination .active, .pagination .current')
-            if current_page_elem:
-                try:
-                    current_page_num = int(current_page_elem.inner_text().strip())
-                    next_page_link = page.query_selector(f'.pagination a:has-text("{current_page_num + 1}")')
-                    if next_page_link:
-                        next_href = next_page_link.get_attribute("href")
-                        if next_href:
-                            current_url = next_href if next_href.startswith("http") else BASE_URL + next_href
-                            page_num += 1
-                            random_delay()
-                        else:
-                            current_url = None
-                    else:
-                        current_url = None
-                except (ValueError, TypeError):
-                    current_url = None
+                await random_delay()
             else:
                 current_url = None
+    finally:
+        flush()
 
     logger.info(f"Found {manual_count} manuals in catalog")
 
@@ -291,67 +357,68 @@ def scrape_catalog_page(page: Page, catalog_url: str) -> int:
         print("Browser will stay open for you to inspect the HTML.")
         print("Press Enter to continue to the next catalog...")
         print("=" * 60)
-        input()
+        # Other catalogs keep going while this one waits
+        await asyncio.to_thread(input)
 
     return manual_count
 
 
-def check_cloudflare_challenge(page: Page) -> bool:
+async def check_cloudflare_challenge(page: Page) -> bool:
     """Check if Cloudflare challenge/hCaptcha is present on the page."""
     # Check for hCaptcha iframe
-    hcaptcha_frame = page.query_selector('iframe[src*="hcaptcha.com"], iframe[src*="hcaptcha"]')
+    hcaptcha_frame = await page.query_selector('iframe[src*="hcaptcha.com"], iframe[src*="hcaptcha"]')
     if hcaptcha_frame:
         return True
 
     # Check for Cloudflare challenge page indicators
-    cf_challenge = page.query_selector('#cf-challenge-running, .cf-browser-verification, #challenge-running')
+    cf_challenge = await page.query_selector('#cf-challenge-running, .cf-browser-verification, #challenge-running')
     if cf_challenge:
         return True
 
     # Check page title for Cloudflare
     try:
-        title = page.title()
+        title = await page.title()
         if 'just a moment' in title.lower() or 'cloudflare' in title.lower():
             return True
     except Exception:
         pass
 
     # Check for challenge form
-    challenge_form = page.query_selector('form#challenge-form, form[action*="challenge"]')
+    challenge_form = await page.query_selector('form#challenge-form, form[action*="challenge"]')
     if challenge_form:
         return True
 
     return False
 
 
-def wait_for_cloudflare_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT, use_solver: bool = True) -> bool:
+async def wait_for_cloudflare_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT, use_solver: bool = True) -> bool:
     """Wait for Cloudflare challenge/hCaptcha to be solved. Returns True if solved, False if timeout."""
     logger.info("Cloudflare challenge detected...")
 
     # Try automatic solver first if available
-    if use_solver and is_solver_available():
+    if use_solver and await asyncio.to_thread(is_solver_available):
         logger.info("Turnstile solver API available, attempting automatic solve...")
         print("\n" + "=" * 60)
         print("CLOUDFLARE DETECTED - Attempting automatic solve via Turnstile API...")
         print("=" * 60 + "\n")
 
-        if solve_cloudflare_with_api(page, timeout=60):
+        if await solve_cloudflare_with_api_async(page, timeout=60):
             # Wait a moment and check if challenge is gone
-            time.sleep(3)
-            if not check_cloudflare_challenge(page):
+            await asyncio.sleep(3)
+            if not await check_cloudflare_challenge(page):
                 logger.info("Cloudflare challenge solved automatically!")
                 # Wait for page content
                 try:
-                    page.wait_for_selector(
+                    await page.wait_for_selector(
                         '.media, .container, nav, header, .content, .catalog, '
                         'a[href*="/doc/"], .media-similar',
                         timeout=45000
                     )
                     logger.info("Page content loaded")
-                    time.sleep(3)
+                    await asyncio.sleep(3)
                     return True
                 except Exception:
-                    time.sleep(3)
+                    await asyncio.sleep(3)
                     return True
         else:
             logger.warning("Automatic solve failed, falling back to manual...")
@@ -368,14 +435,14 @@ def wait_for_cloudflare_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT, use_s
 
     while time.time() - start_time < timeout:
         # Check if we're still on a challenge page
-        if not check_cloudflare_challenge(page):
+        if not await check_cloudflare_challenge(page):
             logger.info("Cloudflare challenge appears to be solved, waiting for page content...")
 
             # Wait for actual page content to load (not just challenge gone)
             # Look for elements that indicate the real Manualzz page has rendered
             try:
                 # Wait for any of these indicators that the real page loaded
-                page.wait_for_selector(
+                await page.wait_for_selector(
                     'body:not(:has(title:has-text("Just a moment"))), '
                     '.media, .container, nav, header, .content, .catalog, '
                     'a[href*="/doc/"], .media-similar',
@@ -383,366 +450,467 @@ def wait_for_cloudflare_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT, use_s
                 )
                 logger.info("Page content loaded")
                 # Extra wait for JS rendering
-                time.sleep(3)
+                await asyncio.sleep(3)
                 return True
             except Exception as e:
                 logger.warning(f"Timeout waiting for page content: {e}")
                 # Still return True since challenge is solved, page might just be slow
-                time.sleep(3)
+                await asyncio.sleep(3)
                 return True
 
-        time.sleep(2)
+        await asyncio.sleep(2)
 
     logger.warning("Cloudflare challenge timeout")
     return False
 
 
-def wait_for_hcaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> bool:
+# Solved once the response token is filled in or the challenge iframe is gone
+_HCAPTCHA_SOLVED_JS = """
+    () => {
+        const response = document.querySelector('[name="h-captcha-response"], [name="g-recaptcha-response"]');
+        return (response && response.value.length > 0)
+            || !document.querySelector('iframe[src*="hcaptcha.com"]');
+    }
+"""
+
+_CAPTCHA_SOLVED_JS = """
+    () => {
+        const response = document.querySelector('[name="g-recaptcha-response"]');
+        return (response && response.value.length > 0)
+            || !document.querySelector('iframe[src*="recaptcha"]');
+    }
+"""
+
+
+async def wait_for_solved(page: Page, solved_js: str, timeout: int) -> bool:
+    """Wait in the page until solved_js returns true. Returns False on timeout."""
+    try:
+        await page.wait_for_function(solved_js, polling=100, timeout=timeout * 1000)
+    except PlaywrightTimeoutError:
+        return False
+    except Exception:
+        # The page navigated mid-wait, which only happens once the form is submitted
+        pass
+    return True
+
+
+async def wait_for_hcaptcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> bool:
     """Wait for human to solve hCaptcha. Returns True if solved, False if timeout."""
     logger.info("Waiting for hCaptcha to be solved...")
     print("\n" + "=" * 60)
     print("HCAPTCHA DETECTED - Please solve it in the browser window")
     print("=" * 60 + "\n")
 
-    start_time = time.time()
-
-    while time.time() - start_time < timeout:
-        # Check if hCaptcha iframe is still present
-        hcaptcha_frame = page.query_selector('iframe[src*="hcaptcha.com"]')
-        if not hcaptcha_frame:
-            logger.info("hCaptcha appears to be solved (iframe gone)")
-            return True
-
-        # Check if hCaptcha has a response token
-        try:
-            hcaptcha_response = page.evaluate("""
-                () => {
-                    const response = document.querySelector('[name="h-captcha-response"], [name="g-recaptcha-response"]');
-                    return response && response.value.length > 0;
-                }
-            """)
-            if hcaptcha_response:
-                logger.info("hCaptcha solved (response token present)")
-                return True
-        except Exception:
-            pass
-
-        time.sleep(2)
+    if await wait_for_solved(page, _HCAPTCHA_SOLVED_JS, timeout):
+        logger.info("hCaptcha solved")
+        return True
 
     logger.warning("hCaptcha timeout - skipping this manual")
     return False
 
 
-def wait_for_captcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> bool:
+async def wait_for_captcha_solved(page: Page, timeout: int = CAPTCHA_TIMEOUT) -> bool:
     """Wait for human to solve captcha. Returns True if solved, False if timeout."""
     logger.info("Waiting for captcha to be solved...")
     print("\n" + "=" * 60)
     print("CAPTCHA DETECTED - Please solve it in the browser window")
     print("=" * 60 + "\n")
 
-    start_time = time.time()
+    if await wait_for_solved(page, _CAPTCHA_SOLVED_JS, timeout):
+        logger.info("Captcha solved")
+        return True
 
-    while time.time() - start_time < timeout:
-        # Check if captcha iframe is still present and visible
-        captcha_frame = page.query_selector('iframe[src*="recaptcha"]')
-        if not captcha_frame:
-            logger.info("Captcha appears to be solved (iframe gone)")
-            return True
+    logger.warning("Captcha timeout - skipping this manual")
+    return False
 
-        # Check if captcha is in solved state
-        try:
-            captcha_response = page.evaluate("""
-                () => {
-                    const response = document.querySelector('[name="g-recaptcha-response"]');
-                    return response && response.value.length > 0;
-                }
-            """)
-            if captcha_response:
-                logger.info("Captcha solved (response token present)")
-                return True
-        except Exception:
-            pass
 
-        time.sleep(2)
+def fetch_pdf_fingerprint(url: str) -> tuple[int, str, str] | None:
+    """
+    HEAD a PDF URL and return its (content_length, etag, host), or None if
+    the server doesn't send both headers with a strong ETag (or the request
+    fails). The host is the one that answered, after redirects.
+
+    The same manual is often listed under several titles and catalogs, so
+    this lets a duplicate be recognised before its body is transferred.
+    """
+    try:
+        response = http_session.head(url, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+    except Exception as e:
+        logger.debug(f"HEAD request failed for {url}: {e}")
+        return None
+
+    content_length = response.headers.get("Content-Length")
+    etag = response.headers.get("ETag")
+    # A compressed length says nothing about the PDF itself
+    if not content_length or not etag or response.headers.get("Content-Encoding"):
+        return None
+    # Weak ETags only promise equivalent content, not the same bytes
+    if etag.startswith("W/"):
+        return None
+    host = urllib.parse.urlparse(response.url).netloc
+    try:
+        return int(content_length), etag, host
+    except ValueError:
+        return None
 
-    logger.warning("Captcha timeout - skipping this manual")
-    return False
 
+def download_pdf(pdf_url: str, download_dir: Path, default_filename: str) -> tuple[str, str, str, int, str]:
+    """
+    Fetch a PDF over http_session into SHA1-based storage.
 
-def download_manual(page: Page, manual: dict, download_dir: Path) -> tuple[str, str, str, int, str] | None:
+    Blocking; download_manual() runs it in a worker thread. Raises on failure,
+    after removing any partial temp file.
+    Returns (file_path, sha1, md5, file_size, original_filename).
+    """
+    temp_path = None
+    try:
+        with http_session.get(pdf_url, timeout=120, stream=True) as response:
+            response.raise_for_status()
+
+            # Get original filename from Content-Disposition or URL, e.g.
+            # attachment; filename="file.pdf" or filename*=UTF-8''file.pdf
+            content_disp = response.headers.get('Content-Disposition')
+            original_filename = None
+
+            if content_disp:
+                message = email.message.Message()
+                message['Content-Disposition'] = content_disp
+                filename = message.get_filename()
+                if filename:
+                    original_filename = urllib.parse.unquote(filename.strip())
+
+            if not original_filename:
+                url_path = urllib.parse.urlparse(pdf_url).path
+                original_filename = urllib.parse.unquote(url_path.split('/')[-1])
+
+            if not original_filename or len(original_filename) < 3:
+                original_filename = default_filename
+
+            if not original_filename.lower().endswith('.pdf'):
+                original_filename += '.pdf'
+
+            # Download to temp file, hashing as it streams in
+            with tempfile.NamedTemporaryFile(dir=ensure_dir(download_dir / ".tmp"), suffix='.pdf', delete=False) as tmp:
+                temp_path = Path(tmp.name)
+                sha1, md5, file_size = _download_stream_hashed(response.iter_content(chunk_size=HASH_CHUNK_SIZE), tmp)
+
+        # Move to SHA1-based storage path
+        final_path = get_sha1_storage_path(download_dir, sha1)
+        ensure_dir(final_path.parent)
+
+        if final_path.exists():
+            logger.info(f"File already exists at {final_path} (duplicate content)")
+            temp_path.unlink()
+        else:
+            os.replace(temp_path, final_path)
+    except Exception:
+        if temp_path:
+            temp_path.unlink(missing_ok=True)
+        raise
+
+    return str(final_path), sha1, md5, file_size, original_filename
+
+
+async def download_manual(page: Page, manual: dict, download_dir: Path) -> tuple[str, str, str, int, str] | None:
     """
     Download a single manual from manualzz using content-addressable storage.
 
     Files are stored based on SHA1 hash in a trie structure: downloads/ab/cd/abcdef...pdf
     The original filename is preserved in the database for display purposes.
+    `manual` is a manuals row as returned by database.get_undownloaded_manuals().
 
     Returns (file_path, sha1, md5, file_size, original_filename) if successful, None otherwise.
     """
-    logger.info(f"Downloading: {manual['title']} - {manual['manual_url']}")
+    logger.info(f"Downloading: {manual['model']} - {manual['manual_url']}")
 
-    page.goto(manual["manual_url"], wait_until="domcontentloaded")
-    random_delay(1, 2)
+    await goto(page, manual["manual_url"])
 
     # Check for Cloudflare challenge after navigation
-    if check_cloudflare_challenge(page):
-        if not wait_for_cloudflare_solved(page):
+    if await check_cloudflare_challenge(page):
+        async with _captcha_lock:
+            solved = await wait_for_cloudflare_solved(page)
+        if not solved:
             logger.warning("Could not pass Cloudflare challenge, skipping")
             return None
         # Re-navigate after solving challenge
-        page.goto(manual["manual_url"], wait_until="domcontentloaded")
-        random_delay(1, 2)
+        await goto(page, manual["manual_url"])
 
     # Wait for download button to appear (JS rendering)
     download_btn_selector = "[title='Download PDF'], a.bi-download, button.bi-download, [class*='bi-download'], a:has-text('Download')"
     try:
-        page.wait_for_selector(download_btn_selector, timeout=30000)
+        await page.wait_for_selector(download_btn_selector, timeout=30000)
         logger.info("Download button appeared")
     except Exception:
         logger.warning("Timeout waiting for download button")
 
     # Look for download button
-    download_btn = page.query_selector(download_btn_selector)
+    download_btn = await page.query_selector(download_btn_selector)
 
     if not download_btn:
-        logger.warning(f"No download button found for {manual['title']}")
+        logger.warning(f"No download button found for {manual['model']}")
         return None
 
     # Click the download button
-    download_btn.click()
-    random_delay(1, 2)
+    await download_btn.click()
+    await random_delay(1, 2)
 
     # Check if a "reminder" popup appeared
-    reminder_link = page.query_selector('a[href*="/download/"]:has-text("still want to look it up")')
+    reminder_link = await page.query_selector('a[href*="/download/"]:has-text("still want to look it up")')
     if reminder_link:
         logger.info("Reminder popup detected, clicking through...")
-        reminder_link.click()
-        random_delay(1, 2)
+        await reminder_link.click()
+        await random_delay(1, 2)
     else:
         # Maybe we need to navigate directly to download page
-        manualzz_id = manual.get("manualzz_id") or extract_manualzz_id(manual["manual_url"])
+        manualzz_id = manual.get("source_id") or extract_manualzz_id(manual["manual_url"])
         if manualzz_id:
             download_page_url = f"{BASE_URL}/download/{manualzz_id}"
             logger.info(f"Navigating to download page: {download_page_url}")
-            page.goto(download_page_url, wait_until="domcontentloaded")
-            random_delay(1, 2)
+            await goto(page, download_page_url)
+            await random_delay(1, 2)
 
             # Check for Cloudflare challenge on download page
-            if check_cloudflare_challenge(page):
-                if not wait_for_cloudflare_solved(page):
+            if await check_cloudflare_challenge(page):
+                async with _captcha_lock:
+                    solved = await wait_for_cloudflare_solved(page)
+                if not solved:
                     logger.warning("Could not pass Cloudflare challenge on download page")
                     return None
-                page.goto(download_page_url, wait_until="domcontentloaded")
-                random_delay(1, 2)
+                await goto(page, download_page_url)
+                await random_delay(1, 2)
 
     # Now we should be on the download page with captcha
     # Check for reCAPTCHA
-    captcha_frame = page.query_selector('iframe[src*="recaptcha"]')
+    captcha_frame = await page.query_selector('iframe[src*="recaptcha"]')
     if captcha_frame:
-        if not wait_for_captcha_solved(page):
+        async with _captcha_lock:
+            solved = await wait_for_captcha_solved(page)
+        if not solved:
             return None
-        random_delay(1, 2)
+        await random_delay(1, 2)
 
     # Check for hCaptcha (separate from Cloudflare challenge)
-    hcaptcha_frame = page.query_selector('iframe[src*="hcaptcha.com"]')
+    hcaptcha_frame = await page.query_selector('iframe[src*="hcaptcha.com"]')
     if hcaptcha_frame:
-        if not wait_for_hcaptcha_solved(page):
+        async with _captcha_lock:
+            solved = await wait_for_hcaptcha_solved(page)
+        if not solved:
             return None
-        random_delay(1, 2)
+        await random_delay(1, 2)
 
     # Default original filename based on title
-    default_filename = sanitize_filename(manual.get("title", "manual"))[:100] + ".pdf"
+    default_filename = sanitize_filename(manual.get("model") or "manual")[:100] + ".pdf"
 
     # After captcha, look for the download link
     # The download link uses javascript:download_source()
     # We need to intercept the actual download or find the direct URL
 
     # Try to find the actual download link in .formats
-    format_link = page.query_selector('.formats a.format, .formats a[onclick*="download_source"]')
+    format_link = await page.query_selector('.formats a.format, .formats a[onclick*="download_source"]')
 
     if format_link:
         # We need to click and capture the download
         logger.info("Found download format link, initiating download...")
 
-        # Set up download handling
-        with page.expect_download(timeout=60000) as download_info:
-            try:
-                format_link.click()
-                download = download_info.value
-
-                # Get original filename from download
-                original_filename = download.suggested_filename or default_filename
-                if not original_filename.lower().endswith('.pdf'):
-                    original_filename += '.pdf'
-
-                # Save to temp file first
-                with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                    temp_path = Path(tmp.name)
-                download.save_as(temp_path)
-
-                # Compute checksums
-                sha1, md5 = compute_checksums(temp_path)
-                file_size = temp_path.stat().st_size
-
-                # Move to SHA1-based storage path
-                final_path = get_sha1_storage_path(download_dir, sha1)
-                final_path.parent.mkdir(parents=True, exist_ok=True)
-
-                if final_path.exists():
-                    logger.info(f"File already exists at {final_path} (duplicate content)")
-                    temp_path.unlink()
-                else:
-                    shutil.move(str(temp_path), str(final_path))
+        temp_path = None
+        try:
+            async with page.expect_download(timeout=60000) as download_info:
+                await format_link.click()
+            download = await download_info.value
+
+            # Get original filename from download
+            original_filename = download.suggested_filename or default_filename
+            if not original_filename.lower().endswith('.pdf'):
+                original_filename += '.pdf'
+
+            # Save to temp file first, next to storage so the move below is a rename
+            with tempfile.NamedTemporaryFile(dir=ensure_dir(download_dir / ".tmp"), suffix='.pdf', delete=False) as tmp:
+                temp_path = Path(tmp.name)
+            await download.save_as(temp_path)
+
+            # Compute checksums (off the event loop so other pages keep going)
+            sha1, md5 = await asyncio.to_thread(compute_checksums, temp_path)
+            file_size = temp_path.stat().st_size
+
+            # Move to SHA1-based storage path
+            final_path = get_sha1_storage_path(download_dir, sha1)
+            ensure_dir(final_path.parent)
+
+            if final_path.exists():
+                logger.info(f"File already exists at {final_path} (duplicate content)")
+                temp_path.unlink()
+            else:
+                os.replace(temp_path, final_path)
 
-                logger.info(f"Downloaded: {final_path} ({file_size} bytes, SHA1: {sha1[:8]}...)")
-                logger.info(f"Original filename: {original_filename}")
-                return str(final_path), sha1, md5, file_size, original_filename
+            logger.info(f"Downloaded: {final_path} ({file_size} bytes, SHA1: {sha1[:8]}...)")
+            logger.info(f"Original filename: {original_filename}")
+            return str(final_path), sha1, md5, file_size, original_filename
 
-            except Exception as e:
-                logger.error(f"Download failed: {e}")
-                return None
+        except Exception as e:
+            logger.error(f"Download failed: {e}")
+            if temp_path:
+                temp_path.unlink(missing_ok=True)
+            return None
 
     # Fallback: try any PDF link
-    pdf_link = page.query_selector('a[href*=".pdf"]')
+    pdf_link = await page.query_selector('a[href*=".pdf"]')
     if pdf_link:
-        pdf_url = pdf_link.get_attribute("href")
+        pdf_url = await pdf_link.get_attribute("href")
         if pdf_url:
             # Handle protocol-relative URLs (starting with //)
             if pdf_url.startswith("//"):
                 pdf_url = "https:" + pdf_url
             logger.info(f"Found PDF link: {pdf_url}")
-            try:
-                req = urllib.request.Request(pdf_url)
-                req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
-                with urllib.request.urlopen(req, timeout=120) as response:
-                    # Get original filename from Content-Disposition or URL
-                    content_disp = response.headers.get('Content-Disposition', '')
-                    original_filename = None
-
-                    if 'filename=' in content_disp:
-                        match = re.search(r'filename[*]?=["\']?([^"\';\n]+)["\']?', content_disp)
-                        if match:
-                            original_filename = match.group(1).strip()
-                            if original_filename.startswith("UTF-8''"):
-                                original_filename = urllib.parse.unquote(original_filename[7:])
-                            else:
-                                original_filename = urllib.parse.unquote(original_filename)
-
-                    if not original_filename:
-                        url_path = urllib.parse.urlparse(pdf_url).path
-                        original_filename = urllib.parse.unquote(url_path.split('/')[-1])
-
-                    if not original_filename or len(original_filename) < 3:
-                        original_filename = default_filename
-
-                    if not original_filename.lower().endswith('.pdf'):
-                        original_filename += '.pdf'
-
-                    # Download to temp file
-                    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp:
-                        tmp.write(response.read())
-                        temp_path = Path(tmp.name)
-
-                # Compute checksums
-                sha1, md5 = compute_checksums(temp_path)
-                file_size = temp_path.stat().st_size
-
-                # Move to SHA1-based storage path
-                final_path = get_sha1_storage_path(download_dir, sha1)
-                final_path.parent.mkdir(parents=True, exist_ok=True)
-
-                if final_path.exists():
-                    logger.info(f"File already exists at {final_path} (duplicate content)")
-                    temp_path.unlink()
-                else:
-                    shutil.move(str(temp_path), str(final_path))
 
-                logger.info(f"Downloaded: {final_path} ({file_size} bytes, SHA1: {sha1[:8]}...)")
-                logger.info(f"Original filename: {original_filename}")
-                return str(final_path), sha1, md5, file_size, original_filename
+            # Reuse the stored file if this PDF was already downloaded for
+            # another manualzz manual (other sources store processed files)
+            fingerprint = await asyncio.to_thread(fetch_pdf_fingerprint, pdf_url)
+            if fingerprint:
+                existing = database.find_by_fingerprint(*fingerprint, source="manualzz")
+                if existing and existing["file_path"] and Path(existing["file_path"]).exists():
+                    logger.info(f"Same PDF as already downloaded manual {existing['id']} ({existing['model']}), reusing {existing['file_path']}")
+                    if manual.get("id"):
+                        database.update_fingerprint(manual["id"], *fingerprint)
+                    return existing["file_path"], existing["file_sha1"], existing["file_md5"], existing["file_size"], existing["original_filename"]
 
+            try:
+                # requests blocks, so stream the body in a worker thread
+                result = await asyncio.to_thread(download_pdf, pdf_url, download_dir, default_filename)
             except Exception as e:
                 logger.error(f"Direct download failed: {e}")
+            else:
+                if fingerprint and manual.get("id"):
+                    database.update_fingerprint(manual["id"], *fingerprint)
+
+                final_path, sha1, md5, file_size, original_filename = result
+                logger.info(f"Downloaded: {final_path} ({file_size} bytes, SHA1: {sha1[:8]}...)")
+                logger.info(f"Original filename: {original_filename}")
+                return result
 
-    logger.warning(f"Could not download {manual['title']}")
+    logger.warning(f"Could not download {manual['model']}")
     return None
 
 
-def scrape_manualzz(catalog_urls: list[str], download_dir: Path, download: bool = True, extension_path: Path = None, browser: str = "chromium", headless: bool = False, use_stealth: bool = False, use_proxy: bool = False):
-    """Main scraping function for manualzz."""
-    database.init_db()
+async def download_pending(pool: PagePool, pending: list[dict], download_dir: Path, concurrency: int = 1):
+    """Download pending manuals, up to `concurrency` at a time, each on a page from the pool."""
+    slots = asyncio.Semaphore(max(1, concurrency))
 
-    with sync_playwright() as p:
-        # Launch browser with extension support (requires persistent context)
-        context, extension_loaded = launch_browser_with_extension(
-            p,
-            extension_path=extension_path,
-            headless=headless,
-            browser=browser,
-            use_proxy=use_proxy,
-        )
+    async def download_one(manual_record: dict):
+        try:
+            async with slots, pool.page() as page:
+                result = await download_manual(page, manual_record, download_dir)
+                if result:
+                    file_path, sha1, md5, file_size, original_filename = result
+                    database.update_downloaded(manual_record["id"], file_path, sha1, md5, file_size, original_filename)
+                await random_delay()
+        except Exception as e:
+            logger.error(f"Error downloading {manual_record['model']}: {e}")
 
-        # Persistent context may already have pages open, use the first one or create new
-        if context.pages:
-            page = context.pages[0]
-        else:
-            page = context.new_page()
+    if concurrency > 1:
+        logger.info(f"Downloading with {concurrency} pages")
+    await asyncio.gather(*(download_one(manual_record) for manual_record in pending))
 
-        # Apply stealth patches to avoid fingerprint detection (if enabled)
-        if use_stealth:
-            apply_stealth(page)
 
-        # If no extension loaded, use route-based ad blocking as fallback
-        if not extension_loaded:
-            setup_route_ad_blocking(page)
-        else:
-            logger.info("uBlock Origin extension loaded for ad blocking")
+async def scrape_manualzz(pool: PagePool, catalog_urls: list[str], download_dir: Path, download: bool = True, download_concurrency: int = 1):
+    """Main scraping function for manualzz.
 
+    Catalogs are walked concurrently, one per page in the pool; downloads
+    run up to `download_concurrency` at a time.
+    """
+    # Catalog pages are only read for links; images dominate their weight
+    await set_resource_blocking_async(pool.context, True)
+
+    # Loaded once, so catalogs only write manuals not indexed yet
+    known_urls = database.get_manual_urls(source="manualzz")
+
+    # A failing catalog is logged and skipped so the others (and the
+    # downloads after them) still run
+    async def scrape_catalog(catalog_url: str) -> int:
         try:
-            total_count = 0
-            for catalog_url in catalog_urls:
+            async with pool.page() as page:
                 logger.info(f"Scraping catalog: {catalog_url}")
 
                 # Scrape all manual listings (adds to DB immediately for real-time progress)
-                manual_count = scrape_catalog_page(page, catalog_url)
-                total_count += manual_count
+                manual_count = await scrape_catalog_page(page, catalog_url, known_urls)
 
-                random_delay(2, 4)
+                await random_delay(2, 4)
+                return manual_count
+        except Exception as e:
+            logger.error(f"Error scraping catalog {catalog_url}: {e}")
+            return 0
 
-            if not download:
-                logger.info(f"Scraping complete. Found {total_count} manuals. Skipping downloads.")
-                context.close()
-                return
+    total_count = sum(await asyncio.gather(*(scrape_catalog(catalog_url) for catalog_url in catalog_urls)))
 
-            # Download pending manuals
-            pending = database.get_undownloaded_manuals(source="manualzz")
-            logger.info(f"Found {len(pending)} manuals to download")
+    # Download pages need to render their captcha widgets
+    await set_resource_blocking_async(pool.context, False)
 
-            for manual_record in pending:
-                try:
-                    result = download_manual(
-                        page,
-                        {
-                            "title": manual_record["model"],
-                            "brand": manual_record["brand"],
-                            "manual_url": manual_record["manual_url"],
-                            "manualzz_id": manual_record.get("source_id"),
-                        },
-                        download_dir
-                    )
-                    if result:
-                        file_path, sha1, md5, file_size, original_filename = result
-                        database.update_downloaded(manual_record["id"], file_path, sha1, md5, file_size, original_filename)
-                    random_delay()
-                except Exception as e:
-                    logger.error(f"Error downloading {manual_record['model']}: {e}")
-                    continue
+    if not download:
+        logger.info(f"Scraping complete. Found {total_count} manuals. Skipping downloads.")
+        return
 
-        finally:
-            context.close()
+    # Download pending manuals
+    pending = database.get_undownloaded_manuals(source="manualzz")
+    logger.info(f"Found {len(pending)} manuals to download")
 
-    stats = database.get_stats(source="manualzz")
-    logger.info(f"Manualzz scraping complete. Total: {stats['total']}, Downloaded: {stats['downloaded']}, Pending: {stats['pending']}")
+    await download_pending(pool, pending, download_dir, download_concurrency)
+
+
+async def run_browser(args, config: dict, download_dir: Path, catalog_urls: list[str], extension_path: Path = None):
+    """Launch the browser and run the requested scrape/download mode."""
+    # Get browser settings from config (with namespace override support)
+    browser_type = get_config(config, "browser", "chromium")
+    headless = get_config(config, "headless", False)
+    use_stealth = get_config(config, "stealth", False)
+    use_proxy = get_config(config, "use_proxy", False)
+    concurrency = get_config(config, "concurrency", 3)
+    download_concurrency = get_config(config, "download_concurrency", 1)
+
+    async with async_playwright() as p:
+        # Launch browser with extension support (requires persistent context)
+        context, extension_loaded = await launch_browser_with_extension_async(
+            p,
+            extension_path=extension_path,
+            headless=headless,
+            browser=browser_type,
+            use_proxy=use_proxy,
+        )
+
+        # Applies to every page, including ones the pool opens later
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT * 1000)
+
+        if extension_loaded:
+            logger.info("uBlock Origin extension loaded for ad blocking")
+
+        async def setup_page(page: Page):
+            # Apply stealth patches to avoid fingerprint detection (if enabled)
+            if use_stealth:
+                await apply_stealth_async(page)
+            # If no extension loaded, use route-based ad blocking as fallback
+            if not extension_loaded:
+                await setup_route_ad_blocking_async(page)
+
+        pool_size = download_concurrency if args.download_only else max(concurrency, download_concurrency)
+        pool = PagePool(
+            context,
+            size=pool_size,
+            setup=setup_page,
+            max_uses=get_config(config, "page_max_uses", 50),
+            max_age=get_config(config, "page_max_age", 1800),
+        )
+        await pool.start()
+
+        try:
+            if args.download_only:
+                # Only download pending manuals
+                pending = database.get_undownloaded_manuals(source="manualzz")
+                logger.info(f"Found {len(pending)} pending manualzz downloads")
+
+                await download_pending(pool, pending, download_dir, download_concurrency)
+            else:
+                await scrape_manualzz(pool, catalog_urls, download_dir, download=not args.index_only, download_concurrency=download_concurrency)
+        finally:
+            await context.close()
 
 
 def main():
@@ -785,64 +953,13 @@ def main():
         logger.info("No uBlock Origin extension found - will use route-based ad blocking")
         logger.info("To use uBlock Origin, set 'ublock_origin_path' in config.yaml or place extension in ./extensions/ublock_origin/")
 
-    # Get browser settings from config (with namespace override support)
-    browser_type = get_config(config, "browser", "chromium")
-    headless = get_config(config, "headless", False)
-    use_stealth = get_config(config, "stealth", False)
-    use_proxy = get_config(config, "use_proxy", False)
-
-    if args.download_only:
-        # Only download pending manuals
-        with sync_playwright() as p:
-            # Launch browser with extension support
-            context, extension_loaded = launch_browser_with_extension(
-                p,
-                extension_path=extension_path,
-                headless=headless,
-                browser=browser_type,
-                use_proxy=use_proxy,
-            )
-
-            # Persistent context may already have pages open
-            if context.pages:
-                page = context.pages[0]
-            else:
-                page = context.new_page()
-
-            # Apply stealth patches to avoid fingerprint detection (if enabled)
-            if use_stealth:
-                apply_stealth(page)
-
-            # If no extension loaded, use route-based ad blocking as fallback
-            if not extension_loaded:
-                setup_route_ad_blocking(page)
-
-            try:
-                pending = database.get_undownloaded_manuals(source="manualzz")
-                logger.info(f"Found {len(pending)} pending manualzz downloads")
+    try:
+        asyncio.run(run_browser(args, config, download_dir, catalog_urls, extension_path))
+    finally:
+        http_session.close()
 
-                for manual_record in pending:
-                    try:
-                        result = download_manual(
-                            page,
-                            {
-                                "title": manual_record["model"],
-                                "brand": manual_record["brand"],
-                                "manual_url": manual_record["manual_url"],
-                                "manualzz_id": manual_record.get("source_id"),
-                            },
-                            download_dir
-                        )
-                        if result:
-                            file_path, sha1, md5, file_size, original_filename = result
-                            database.update_downloaded(manual_record["id"], file_path, sha1, md5, file_size, original_filename)
-                        random_delay()
-                    except Exception as e:
-                        logger.error(f"Error downloading {manual_record['model']}: {e}")
-            finally:
-                context.close()
-    else:
-        scrape_manualzz(catalog_urls, download_dir, download=not args.index_only, extension_path=extension_path, browser=browser_type, headless=headless, use_stealth=use_stealth, use_proxy=use_proxy)
+    stats = database.get_stats(source="manualzz")
+    logger.info(f"Manualzz scraping complete. Total: {stats['total']}, Downloaded: {stats['downloaded']}, Pending: {stats['pending']}")
 
 
 if __name__ == "__main__":
@@ -8,6 +8,10 @@ import pikepdf
 
 logger = logging.getLogger(__name__)
 
+# The q...Q block containing the manualslib watermark text, compiled once
+# since it runs over every page's content stream
+_WATERMARK_RE = re.compile(rb'q\s*\n0 0 \d+ \d+ re.*?manuals search engine.*?Q\s*\n?', re.DOTALL)
+
 
 def strip_manualslib_watermark(pdf_path: Path | str) -> bool:
     """
@@ -56,16 +60,16 @@ def strip_manualslib_watermark(pdf_path: Path | str) -> bool:
                 else:
                     data = contents.read_bytes()
 
-                text = data.decode('latin-1')
+                # Most pages carry no watermark; a substring scan is far
+                # cheaper than the backtracking regex
+                if b'manuals search engine' not in data:
+                    continue
 
-                # Pattern to match the watermark block
-                # Matches the q...Q block containing manualslib watermark text
-                pattern = r'q\s*\n0 0 \d+ \d+ re.*?manuals search engine.*?Q\s*\n?'
-                cleaned = re.sub(pattern, '', text, flags=re.DOTALL)
+                cleaned = _WATERMARK_RE.sub(b'', data)
 
-                if cleaned != text:
+                if cleaned != data:
                     modified = True
-                    page['/Contents'] = pdf.make_stream(cleaned.encode('latin-1'))
+                    page['/Contents'] = pdf.make_stream(cleaned)
 
         if modified:
             pdf.save(pdf_path)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Integration with Turnstile-Solver-NEW API for bypassing Cloudflare challenges."""
 
+import asyncio
 import logging
 import time
 import urllib.request
@@ -39,20 +40,133 @@ def get_sitekey_from_config(domain: str) -> str | None:
     return sitekeys.get(domain)
 
 
+# Selectors for the Turnstile widget or its iframe
+_TURNSTILE_WIDGET_SELECTOR = (
+    'iframe[src*="challenges.cloudflare.com"], '
+    'iframe[src*="turnstile"], '
+    '.cf-turnstile, '
+    '#turnstile-wrapper, '
+    '[data-sitekey]'
+)
+
+# Finds the sitekey in the widget, iframe URLs, inline scripts or challenge options
+_SITEKEY_JS = """
+    () => {
+        // Method 1: Check for cf-turnstile element with data-sitekey
+        const turnstile = document.querySelector('.cf-turnstile[data-sitekey], [data-sitekey]');
+        if (turnstile) {
+            const key = turnstile.getAttribute('data-sitekey');
+            if (key && key.length > 10) return key;
+        }
+
+        // Method 2: Check for turnstile in iframe src
+        const iframes = document.querySelectorAll('iframe');
+        for (const iframe of iframes) {
+            const src = iframe.getAttribute('src') || '';
+            if (src.includes('challenges.cloudflare.com') || src.includes('turnstile')) {
+                // Try to extract sitekey from URL params
+                const match = src.match(/[?&]k=([^&]+)/);
+                if (match) return match[1];
+
+                // Try sitekey param
+                const match2 = src.match(/sitekey=([^&]+)/);
+                if (match2) return match2[1];
+            }
+        }
+
+        // Method 3: Check script tags for sitekey patterns
+        const scripts = document.querySelectorAll('script');
+        for (const script of scripts) {
+            const text = script.textContent || script.innerText || '';
+
+            // Look for sitekey in various formats
+            const patterns = [
+                /sitekey['":\s]+['"]([0-9a-zA-Z_-]{20,})['"]/,
+                /data-sitekey['":\s]+['"]([0-9a-zA-Z_-]{20,})['"]/,
+                /"sitekey"\s*:\s*"([^"]+)"/,
+                /turnstile[^}]*sitekey['":\s]+['"]([^'"]+)['"]/i,
+            ];
+
+            for (const pattern of patterns) {
+                const match = text.match(pattern);
+                if (match && match[1].length > 10) return match[1];
+            }
+        }
+
+        // Method 4: Check for Cloudflare challenge options
+        if (window._cf_chl_opt) {
+            // Sometimes the sitekey is in cK or similar
+            if (window._cf_chl_opt.cK) return window._cf_chl_opt.cK;
+            if (window._cf_chl_opt.sitekey) return window._cf_chl_opt.sitekey;
+        }
+
+        // Method 5: Check for turnstile render calls in page
+        if (window.turnstile && window.turnstile._lastWidgetId) {
+            // Try to get sitekey from widget
+            const widget = document.querySelector('[data-turnstile-widget-id]');
+            if (widget) {
+                const key = widget.getAttribute('data-sitekey');
+                if (key) return key;
+            }
+        }
+
+        return null;
+    }
+"""
+
+# What the page shows when no sitekey could be found, for the warning log
+_DEBUG_INFO_JS = """
+    () => {
+        const iframes = Array.from(document.querySelectorAll('iframe')).map(f => f.src);
+        const cfOpt = window._cf_chl_opt ? Object.keys(window._cf_chl_opt) : [];
+        return {
+            iframes: iframes,
+            cfOptKeys: cfOpt,
+            hasTurnstile: !!document.querySelector('.cf-turnstile'),
+            title: document.title
+        };
+    }
+"""
+
+# Sets the token on every Turnstile response field; true if the page has one
+_INJECT_TOKEN_JS = """
+    (token) => {
+        // Set the token in cf-turnstile-response input
+        const inputs = document.querySelectorAll(
+            'input[name="cf-turnstile-response"], ' +
+            'input[name="g-recaptcha-response"], ' +
+            'textarea[name="cf-turnstile-response"]'
+        );
+
+        let found = false;
+        for (const input of inputs) {
+            input.value = token;
+            found = true;
+        }
+
+        // Also try to set window.turnstile callback
+        if (window.turnstile && window.turnstile.getResponse) {
+            // Turnstile widget exists
+            found = true;
+        }
+
+        // Trigger any callback that might be waiting
+        if (window._cf_chl_opt && window._cf_chl_opt.cOgUHash) {
+            found = true;
+        }
+
+        return found;
+    }
+"""
+
+
 def extract_turnstile_sitekey(page, wait_timeout: int = 15) -> str | None:
     """Extract Cloudflare Turnstile sitekey from the page."""
 
     # First, wait for the Turnstile widget/iframe to appear
     logger.info("Waiting for Turnstile widget to load...")
     try:
-        page.wait_for_selector(
-            'iframe[src*="challenges.cloudflare.com"], '
-            'iframe[src*="turnstile"], '
-            '.cf-turnstile, '
-            '#turnstile-wrapper, '
-            '[data-sitekey]',
-            timeout=wait_timeout * 1000
-        )
+        page.wait_for_selector(_TURNSTILE_WIDGET_SELECTOR, timeout=wait_timeout * 1000)
         # Extra wait for JS to populate attributes
         time.sleep(2)
     except Exception as e:
@@ -60,86 +174,13 @@ def extract_turnstile_sitekey(page, wait_timeout: int = 15) -> str | None:
 
     try:
         # Try to find sitekey from various sources
-        sitekey = page.evaluate("""
-            () => {
-                // Method 1: Check for cf-turnstile element with data-sitekey
-                const turnstile = document.querySelector('.cf-turnstile[data-sitekey], [data-sitekey]');
-                if (turnstile) {
-                    const key = turnstile.getAttribute('data-sitekey');
-                    if (key && key.length > 10) return key;
-                }
-
-                // Method 2: Check for turnstile in iframe src
-                const iframes = document.querySelectorAll('iframe');
-                for (const iframe of iframes) {
-                    const src = iframe.getAttribute('src') || '';
-                    if (src.includes('challenges.cloudflare.com') || src.includes('turnstile')) {
-                        // Try to extract sitekey from URL params
-                        const match = src.match(/[?&]k=([^&]+)/);
-                        if (match) return match[1];
-
-                        // Try sitekey param
-                        const match2 = src.match(/sitekey=([^&]+)/);
-                        if (match2) return match2[1];
-                    }
-                }
-
-                // Method 3: Check script tags for sitekey patterns
-                const scripts = document.querySelectorAll('script');
-                for (const script of scripts) {
-                    const text = script.textContent || script.innerText || '';
-
-                    // Look for sitekey in various formats
-                    const patterns = [
-                        /sitekey['":\s]+['"]([0-9a-zA-Z_-]{20,})['"]/,
-                        /data-sitekey['":\s]+['"]([0-9a-zA-Z_-]{20,})['"]/,
-                        /"sitekey"\s*:\s*"([^"]+)"/,
-                        /turnstile[^}]*sitekey['":\s]+['"]([^'"]+)['"]/i,
-                    ];
-
-                    for (const pattern of patterns) {
-                        const match = text.match(pattern);
-                        if (match && match[1].length > 10) return match[1];
-                    }
-                }
-
-                // Method 4: Check for Cloudflare challenge options
-                if (window._cf_chl_opt) {
-                    // Sometimes the sitekey is in cK or similar
-                    if (window._cf_chl_opt.cK) return window._cf_chl_opt.cK;
-                    if (window._cf_chl_opt.sitekey) return window._cf_chl_opt.sitekey;
-                }
-
-                // Method 5: Check for turnstile render calls in page
-                if (window.turnstile && window.turnstile._lastWidgetId) {
-                    // Try to get sitekey from widget
-                    const widget = document.querySelector('[data-turnstile-widget-id]');
-                    if (widget) {
-                        const key = widget.getAttribute('data-sitekey');
-                        if (key) return key;
-                    }
-                }
-
-                return null;
-            }
-        """)
+        sitekey = page.evaluate(_SITEKEY_JS)
 
         if sitekey:
             logger.info(f"Found sitekey: {sitekey[:30]}...")
         else:
             # Debug: log what we can see on the page
-            debug_info = page.evaluate("""
-                () => {
-                    const iframes = Array.from(document.querySelectorAll('iframe')).map(f => f.src);
-                    const cfOpt = window._cf_chl_opt ? Object.keys(window._cf_chl_opt) : [];
-                    return {
-                        iframes: iframes,
-                        cfOptKeys: cfOpt,
-                        hasTurnstile: !!document.querySelector('.cf-turnstile'),
-                        title: document.title
-                    };
-                }
-            """)
+            debug_info = page.evaluate(_DEBUG_INFO_JS)
             logger.warning(f"Could not find sitekey. Debug info: {debug_info}")
 
         return sitekey
@@ -236,35 +277,7 @@ def inject_turnstile_token(page, token: str) -> bool:
         True if injection successful, False otherwise
     """
     try:
-        result = page.evaluate(f"""
-            (token) => {{
-                // Set the token in cf-turnstile-response input
-                const inputs = document.querySelectorAll(
-                    'input[name="cf-turnstile-response"], ' +
-                    'input[name="g-recaptcha-response"], ' +
-                    'textarea[name="cf-turnstile-response"]'
-                );
-
-                let found = false;
-                for (const input of inputs) {{
-                    input.value = token;
-                    found = true;
-                }}
-
-                // Also try to set window.turnstile callback
-                if (window.turnstile && window.turnstile.getResponse) {{
-                    // Turnstile widget exists
-                    found = true;
-                }}
-
-                // Trigger any callback that might be waiting
-                if (window._cf_chl_opt && window._cf_chl_opt.cOgUHash) {{
-                    found = true;
-                }}
-
-                return found;
-            }}
-        """, token)
+        result = page.evaluate(_INJECT_TOKEN_JS, token)
 
         if result:
             logger.info("Turnstile token injected successfully")
@@ -349,3 +362,96 @@ def solve_cloudflare_with_api(page, api_url: str = SOLVER_API_URL, timeout: int
         pass
 
     return True
+
+
+async def extract_turnstile_sitekey_async(page, wait_timeout: int = 15) -> str | None:
+    """Async version of extract_turnstile_sitekey."""
+    logger.info("Waiting for Turnstile widget to load...")
+    try:
+        await page.wait_for_selector(_TURNSTILE_WIDGET_SELECTOR, timeout=wait_timeout * 1000)
+        # Extra wait for JS to populate attributes
+        await asyncio.sleep(2)
+    except Exception as e:
+        logger.warning(f"Timeout waiting for Turnstile widget: {e}")
+
+    try:
+        sitekey = await page.evaluate(_SITEKEY_JS)
+
+        if sitekey:
+            logger.info(f"Found sitekey: {sitekey[:30]}...")
+        else:
+            debug_info = await page.evaluate(_DEBUG_INFO_JS)
+            logger.warning(f"Could not find sitekey. Debug info: {debug_info}")
+
+        return sitekey
+    except Exception as e:
+        logger.warning(f"Error extracting sitekey: {e}")
+        return None
+
+
+async def inject_turnstile_token_async(page, token: str) -> bool:
+    """Async version of inject_turnstile_token."""
+    try:
+        result = await page.evaluate(_INJECT_TOKEN_JS, token)
+
+        if result:
+            logger.info("Turnstile token injected successfully")
+        else:
+            logger.warning("Could not find Turnstile input elements")
+
+        return result
+
+    except Exception as e:
+        logger.error(f"Error injecting Turnstile token: {e}")
+        return False
+
+
+async def solve_cloudflare_with_api_async(page, api_url: str = SOLVER_API_URL, timeout: int = 120) -> bool:
+    """Async version of solve_cloudflare_with_api.
+
+    The solver API is polled in a worker thread so other pages keep working
+    while this one waits for a token.
+    """
+    url = page.url
+
+    try:
+        from urllib.parse import urlparse
+        domain = urlparse(url).netloc
+        sitekey = get_sitekey_from_config(domain)
+        if sitekey:
+            logger.info(f"Using configured sitekey for {domain}")
+    except Exception:
+        sitekey = None
+
+    if not sitekey:
+        sitekey = await extract_turnstile_sitekey_async(page)
+
+    if not sitekey:
+        logger.warning("Could not extract Turnstile sitekey from page")
+        return False
+
+    logger.info(f"Found Turnstile sitekey: {sitekey[:20]}...")
+
+    token = await asyncio.to_thread(solve_turnstile, url, sitekey, api_url, timeout)
+
+    if not token:
+        return False
+
+    await inject_turnstile_token_async(page, token)
+
+    # Wait a moment for any auto-submit
+    await asyncio.sleep(2)
+
+    try:
+        submit_btn = await page.query_selector(
+            'button[type="submit"], '
+            'input[type="submit"], '
+            '.challenge-form button'
+        )
+        if submit_btn:
+            await submit_btn.click()
+            await asyncio.sleep(3)
+    except Exception:
+        pass
+
+    return True